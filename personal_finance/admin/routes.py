@@ -8,7 +8,7 @@ from wtforms.validators import DataRequired, NumberRange, ValidationError
 from translations import trans
 import utils
 import datetime
-from models import get_budgets, get_bills
+from models import get_budgets, get_bills, queue_tool_usage_entry
 from credits import ApproveCreditRequestForm, fix_ficore_credit_balances
 from utils import logger
 
@@ -333,11 +333,7 @@ def audit():
     """View audit logs of admin actions."""
     try:
         db = utils.get_mongo_db()
-        db.tool_usage.insert_one({
-            'tool_name': 'audit_logs',
-            'user_id': str(current_user.id),
-            'timestamp': datetime.datetime.utcnow()
-        })
+        queue_tool_usage_entry(db, {'tool_name': 'audit_logs', 'user_id': str(current_user.id), 'timestamp': datetime.datetime.utcnow()})
         logs = list(db.audit_logs.find().sort('timestamp', -1).limit(100))
         for log in logs:
             log['_id'] = str(log['_id'])
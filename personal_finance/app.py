@@ -77,7 +77,8 @@ client = MongoClient(
     tls=True,
     tlsCAFile=certifi.where(),
     maxPoolSize=50,
-    minPoolSize=5
+    minPoolSize=5,
+    maxIdleTimeMS=30000
 )
 app.extensions = {'mongo': client}
 try:
@@ -10,8 +10,8 @@ from datetime import datetime, date, timedelta
 from translations import trans
 from pymongo.errors import DuplicateKeyError
 from bson import ObjectId
-from utils import get_all_recent_activities, requires_role, is_admin, get_mongo_db, limiter, log_tool_usage, check_ficore_credit_balance
-from models import create_bill
+from utils import get_all_recent_activities, requires_role, is_admin, get_mongo_db, limiter, check_ficore_credit_balance
+from models import queue_tool_usage, create_bill
 from decimal import Decimal, InvalidOperation
 import re
 import uuid
@@ -483,7 +483,7 @@ def new():
     db = get_mongo_db()
 
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='bill',
             db=db,
             user_id=current_user.id if current_user.is_authenticated else None,
@@ -535,7 +535,7 @@ def new():
                     }
                     cleaned_data = BillFormProcessor.process_bill_form_data(form_data)
                     if form.validate_on_submit():
-                        log_tool_usage(
+                        queue_tool_usage(
                             tool_name='bill',
                             db=db,
                             user_id=current_user.id if current_user.is_authenticated else None,
@@ -661,7 +661,7 @@ def new():
                     return redirect(url_for('bill.manage'))
                 elif action == 'delete_bill':
                     try:
-                        log_tool_usage(
+                        queue_tool_usage(
                             tool_name='bill',
                             db=db,
                             user_id=current_user.id if current_user.is_authenticated else None,
@@ -681,7 +681,7 @@ def new():
                 elif action == 'toggle_status':
                     new_status = 'paid' if bill['status'] == 'pending' else 'pending'
                     try:
-                        log_tool_usage(
+                        queue_tool_usage(
                             tool_name='bill',
                             db=db,
                             user_id=current_user.id if current_user.is_authenticated else None,
@@ -828,7 +828,7 @@ def dashboard():
     db = get_mongo_db()
 
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='bill',
             db=db,
             user_id=current_user.id if current_user.is_authenticated else None,
@@ -988,7 +988,7 @@ def manage():
     db = get_mongo_db()
 
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='bill',
             db=db,
             user_id=current_user.id if current_user.is_authenticated else None,
@@ -1103,7 +1103,7 @@ def summary():
     """Return summary of upcoming bills for the current user."""
     db = get_mongo_db()
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='bill',
             db=db,
             user_id=current_user.id if current_user.is_authenticated else None,
@@ -1138,7 +1138,7 @@ def unsubscribe():
     session.permanent = True
     session.modified = True
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='bill',
             db=db,
             user_id=current_user.id if current_user.is_authenticated else None,
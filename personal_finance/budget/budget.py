@@ -1,4 +1,4 @@
-from flask import Blueprint, request, session, redirect, url_for, render_template, flash, current_app, jsonify, Response
+from flask import Blueprint, request, session, redirect, url_for, render_template, flash, current_app, jsonify, send_file, copy_current_request_context
 from flask_wtf import FlaskForm
 from flask_wtf.csrf import CSRFProtect, CSRFError
 from wtforms import FloatField, IntegerField, SubmitField, StringField, FieldList, FormField
@@ -8,10 +8,17 @@ import utils
 from utils import logger
 from datetime import datetime
 import re
-from translations import trans
+import logging
+from translations import trans, trans_many
 from bson import ObjectId
-from models import log_tool_usage, create_budget
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+from models import queue_tool_usage, create_budget
 import uuid
+from functools import lru_cache
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 import bleach
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
@@ -26,25 +33,151 @@ budget_bp = Blueprint(
     url_prefix='/budget'
 )
 
+# Fields read when turning a budget document into its view dict.
+# Budget listings filter on user_id and sort on created_at descending; that shape is
+# served by the (user_id, created_at desc) index declared in models.initialize_app_data.
+_BUDGET_PROJECTION = {
+    'user_id': 1, 'session_id': 1, 'user_email': 1,
+    'income': 1, 'fixed_expenses': 1, 'variable_expenses': 1, 'savings_goal': 1, 'surplus_deficit': 1,
+    'housing': 1, 'food': 1, 'transport': 1, 'dependents': 1, 'miscellaneous': 1, 'others': 1,
+    'custom_categories': 1, 'created_at': 1
+}
+
+# Columns drawn by the budget history table in export_pdf
+_BUDGET_HISTORY_PDF_PROJECTION = {
+    'created_at': 1, 'income': 1, 'fixed_expenses': 1, 'variable_expenses': 1, 'savings_goal': 1, 'surplus_deficit': 1
+}
+# Amount columns of that table and their x positions; the date column sits at x=50
+_PDF_HISTORY_AMOUNT_FIELDS = ('income', 'fixed_expenses', 'variable_expenses', 'savings_goal', 'surplus_deficit')
+_PDF_HISTORY_AMOUNT_X = (150, 220, 290, 370, 450)
+
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+_MAX_CURRENCY = 10000000000
+
 def clean_currency(value):
-    """Transform input into a float, using improved validation from utils."""
+    """
+    Transform input into a float, matching utils.clean_currency but returning 0.0 on invalid input.
+    Runs locally with a precompiled pattern since it is called for every amount field on each submit.
+    """
+    if isinstance(value, (int, float)):
+        return float(value) if 0 <= value <= _MAX_CURRENCY else 0.0
+    if value is None:
+        return 0.0
+    cleaned = _NON_NUMERIC_RE.sub('', str(value))
+    # Keep only the first decimal point
+    head, dot, tail = cleaned.partition('.')
+    if dot:
+        cleaned = f"{head}.{tail.replace('.', '')}"
     try:
-        return utils.clean_currency(value)
-    except Exception:
+        result = float(cleaned) if cleaned else 0.0
+    except ValueError:
         return 0.0
+    return result if result <= _MAX_CURRENCY else 0.0
 
 def strip_commas(value):
     """Filter to remove commas and return a float."""
     return clean_currency(value)
 
+_ZERO_CURRENCY = "0.00"
+
+@lru_cache(maxsize=4096)
+def _format_currency_cached(numeric_value):
+    """Format an already-coerced float; cached since budget amounts repeat heavily."""
+    return f"{numeric_value:,.2f}"
+
 def format_currency(value):
     """Format a numeric value with comma separation, no currency symbol."""
+    if value in (0, None, ''):
+        return _ZERO_CURRENCY
     try:
-        numeric_value = float(value)
-        formatted = f"{numeric_value:,.2f}"
-        return formatted
+        return _format_currency_cached(float(value))
     except (ValueError, TypeError):
-        return "0.00"
+        return _ZERO_CURRENCY
+
+# Zero-valued view of a budget, used whenever there is no budget to show.
+# Read-only so a handler can't mutate the shared copy; callers spread it into a new dict.
+_EMPTY_BUDGET_TEMPLATE = MappingProxyType({
+    'id': None,
+    'user_id': None,
+    'session_id': None,
+    'user_email': None,
+    'income': _ZERO_CURRENCY,
+    'income_raw': 0.0,
+    'fixed_expenses': _ZERO_CURRENCY,
+    'fixed_expenses_raw': 0.0,
+    'variable_expenses': _ZERO_CURRENCY,
+    'variable_expenses_raw': 0.0,
+    'total_expenses': _ZERO_CURRENCY,
+    'total_expenses_raw': 0.0,
+    'savings_goal': _ZERO_CURRENCY,
+    'savings_goal_raw': 0.0,
+    'surplus_deficit': 0.0,
+    'surplus_deficit_formatted': _ZERO_CURRENCY,
+    'housing': _ZERO_CURRENCY,
+    'housing_raw': 0.0,
+    'food': _ZERO_CURRENCY,
+    'food_raw': 0.0,
+    'transport': _ZERO_CURRENCY,
+    'transport_raw': 0.0,
+    'dependents': '0',
+    'dependents_raw': 0,
+    'miscellaneous': _ZERO_CURRENCY,
+    'miscellaneous_raw': 0.0,
+    'others': _ZERO_CURRENCY,
+    'others_raw': 0.0,
+    'custom_categories': (),
+    'created_at': 'N/A'
+})
+
+# Shared worker pool for the dashboard's recent-activities lookup, which runs alongside the budget query
+_DASHBOARD_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='budget-dashboard')
+_DASHBOARD_ACTIVITIES_TIMEOUT = 5
+
+# Amount fields read by _budget_to_view, in unpacking order
+_VIEW_AMOUNT_FIELDS = (
+    'income', 'fixed_expenses', 'variable_expenses', 'savings_goal', 'surplus_deficit',
+    'housing', 'food', 'transport', 'miscellaneous', 'others'
+)
+
+def _budget_to_view(budget, default_email, date_format='%Y-%m-%d'):
+    """Turn a budget document into the raw/formatted view dict used by the templates."""
+    (income, fixed_raw, var_raw, savings_goal, surplus_deficit,
+     housing, food, transport, miscellaneous, others) = map(float, map(budget.get, _VIEW_AMOUNT_FIELDS, repeat(0.0)))
+    total_raw = fixed_raw + var_raw
+    dependents = int(budget.get('dependents', 0))
+    created_at = budget.get('created_at')
+    return {
+        'id': str(budget['_id']),
+        'user_id': budget.get('user_id'),
+        'session_id': budget.get('session_id'),
+        'user_email': budget.get('user_email', default_email),
+        'income': format_currency(income),
+        'income_raw': income,
+        'fixed_expenses': format_currency(fixed_raw),
+        'fixed_expenses_raw': fixed_raw,
+        'variable_expenses': format_currency(var_raw),
+        'variable_expenses_raw': var_raw,
+        'total_expenses': format_currency(total_raw),
+        'total_expenses_raw': total_raw,
+        'savings_goal': format_currency(savings_goal),
+        'savings_goal_raw': savings_goal,
+        'surplus_deficit': surplus_deficit,
+        'surplus_deficit_formatted': format_currency(surplus_deficit),
+        'housing': format_currency(housing),
+        'housing_raw': housing,
+        'food': format_currency(food),
+        'food_raw': food,
+        'transport': format_currency(transport),
+        'transport_raw': transport,
+        'dependents': str(dependents),
+        'dependents_raw': dependents,
+        'miscellaneous': format_currency(miscellaneous),
+        'miscellaneous_raw': miscellaneous,
+        'others': format_currency(others),
+        'others_raw': others,
+        'custom_categories': budget.get('custom_categories', []),
+        'created_at': created_at.strftime(date_format) if created_at else 'N/A'
+    }
 
 def custom_login_required(f):
     """Custom login decorator that requires authentication."""
@@ -57,7 +190,66 @@ def custom_login_required(f):
         return redirect(url_for('users.login', next=request.url))
     return decorated_function
 
-def deduct_ficore_credits(db, user_id, amount, action, budget_id=None):
+def _deduct_credits_in_session(db, user_id, amount, action, budget_id, session_id, mongo_session):
+    """
+    Run the balance update and its transaction/audit inserts inside an already-started transaction.
+    
+    Returns:
+        float: The new balance, or None if the user is missing or underfunded
+    """
+    # Deduct only if the balance covers the amount; the new balance comes back in the same round-trip
+    updated_user = db.users.find_one_and_update(
+        {'_id': user_id, 'ficore_credit_balance': {'$gte': amount}},
+        {'$inc': {'ficore_credit_balance': -amount}},
+        projection={'ficore_credit_balance': 1},
+        return_document=ReturnDocument.AFTER,
+        session=mongo_session
+    )
+    
+    if updated_user is None:
+        if db.users.count_documents({'_id': user_id}, limit=1, session=mongo_session) == 0:
+            logger.error(f"User {user_id} not found in database for credit deduction, action: {action}. Check if user_id matches _id field type.",
+                        extra={'session_id': session_id, 'user_id': user_id})
+        else:
+            logger.warning(f"Insufficient credits for user {user_id}: required {amount}, action: {action}",
+                         extra={'session_id': session_id, 'user_id': user_id})
+        return None
+    
+    new_balance = float(updated_user.get('ficore_credit_balance', 0))
+    previous_balance = new_balance + amount
+    budget_id_str = str(budget_id) if budget_id else None
+    # One timestamp so the transaction and audit records line up
+    now = datetime.utcnow()
+    
+    # Log successful transaction
+    transaction = {
+        '_id': ObjectId(),
+        'user_id': user_id,
+        'action': action,
+        'amount': float(-amount),
+        'budget_id': budget_id_str,
+        'timestamp': now,
+        'session_id': session_id,
+        'status': 'completed'
+    }
+    db.ficore_credit_transactions.insert_one(transaction, session=mongo_session)
+    
+    # Log audit trail
+    db.audit_logs.insert_one({
+        'admin_id': 'system',
+        'action': f'deduct_ficore_credits_{action}',
+        'details': {
+            'user_id': user_id,
+            'amount': amount,
+            'budget_id': budget_id_str,
+            'previous_balance': previous_balance,
+            'new_balance': new_balance
+        },
+        'timestamp': now
+    }, session=mongo_session)
+    return new_balance
+
+def deduct_ficore_credits(db, user_id, amount, action, budget_id=None, mongo_session=None):
     """
     Deduct Ficore Credits from user balance with enhanced error logging and transaction handling.
     
@@ -67,6 +259,8 @@ def deduct_ficore_credits(db, user_id, amount, action, budget_id=None):
         amount: Amount to deduct
         action: Action description for logging
         budget_id: Optional budget ID for reference
+        mongo_session: Optional MongoDB session with an active transaction. When given, the
+            deduction joins that transaction and the caller is responsible for aborting it on failure.
     
     Returns:
         bool: True if successful, False otherwise
@@ -85,80 +279,26 @@ def deduct_ficore_credits(db, user_id, amount, action, budget_id=None):
                         extra={'session_id': session_id, 'user_id': user_id})
             return False
         
-        # Check if user exists and get current balance
-        user = db.users.find_one({'_id': user_id})
-        if not user:
-            logger.error(f"User {user_id} not found in database for credit deduction, action: {action}. Check if user_id matches _id field type.",
+        if utils.is_admin():
+            logger.debug(f"Skipping credit deduction for admin user {user_id}, action: {action}",
                         extra={'session_id': session_id, 'user_id': user_id})
-            return False
-        
-        current_balance = float(user.get('ficore_credit_balance', 0))
-        logger.debug(f"Current balance for user {user_id}: {current_balance}, attempting to deduct: {amount}",
-                    extra={'session_id': session_id, 'user_id': user_id})
-        
-        if current_balance < amount:
-            logger.warning(f"Insufficient credits for user {user_id}: required {amount}, available {current_balance}, action: {action}",
-                         extra={'session_id': session_id, 'user_id': user_id})
-            return False
+            return True
         
-        # Use transaction for atomic operation
-        with db.client.start_session() as mongo_session:
-            with mongo_session.start_transaction():
-                # Update user balance using $inc to maintain atomicity
-                result = db.users.update_one(
-                    {'_id': user_id},
-                    {'$inc': {'ficore_credit_balance': -amount}},
-                    session=mongo_session
-                )
-                
-                if result.modified_count == 0:
-                    error_msg = f"Failed to deduct {amount} credits for user {user_id}, action: {action}: No documents modified. User may not exist or balance unchanged."
-                    logger.error(error_msg, extra={'session_id': session_id, 'user_id': user_id})
-                    
-                    # Log failed transaction
-                    db.ficore_credit_transactions.insert_one({
-                        '_id': ObjectId(),
-                        'user_id': user_id,
-                        'action': action,
-                        'amount': float(-amount),
-                        'budget_id': str(budget_id) if budget_id else None,
-                        'timestamp': datetime.utcnow(),
-                        'session_id': session_id,
-                        'status': 'failed'
-                    }, session=mongo_session)
-                    
-                    raise ValueError(error_msg)
-                
-                # Log successful transaction
-                transaction = {
-                    '_id': ObjectId(),
-                    'user_id': user_id,
-                    'action': action,
-                    'amount': float(-amount),
-                    'budget_id': str(budget_id) if budget_id else None,
-                    'timestamp': datetime.utcnow(),
-                    'session_id': session_id,
-                    'status': 'completed'
-                }
-                db.ficore_credit_transactions.insert_one(transaction, session=mongo_session)
-                
-                # Log audit trail
-                db.audit_logs.insert_one({
-                    'admin_id': 'system',
-                    'action': f'deduct_ficore_credits_{action}',
-                    'details': {
-                        'user_id': user_id,
-                        'amount': amount,
-                        'budget_id': str(budget_id) if budget_id else None,
-                        'previous_balance': current_balance,
-                        'new_balance': current_balance - amount
-                    },
-                    'timestamp': datetime.utcnow()
-                }, session=mongo_session)
-                
-                mongo_session.commit_transaction()
+        if mongo_session is not None:
+            new_balance = _deduct_credits_in_session(db, user_id, amount, action, budget_id, session_id, mongo_session)
+            if new_balance is None:
+                return False
+        else:
+            # Use transaction for atomic operation
+            with db.client.start_session() as own_session:
+                with own_session.start_transaction():
+                    new_balance = _deduct_credits_in_session(db, user_id, amount, action, budget_id, session_id, own_session)
+                    if new_balance is None:
+                        own_session.abort_transaction()
+                        return False
+                    own_session.commit_transaction()
                 
-        logger.info(f"Successfully deducted {amount} Ficore Credits for {action} by user {user_id}. New balance: {current_balance - amount}",
+        logger.info(f"Successfully deducted {amount} Ficore Credits for {action} by user {user_id}. New balance: {new_balance}",
                    extra={'session_id': session_id, 'user_id': user_id})
         return True
         
@@ -167,6 +307,48 @@ def deduct_ficore_credits(db, user_id, amount, action, budget_id=None):
                     exc_info=True, extra={'session_id': session_id, 'user_id': user_id})
         return False
 
+def _delete_budget(db, budget_id, filter_criteria, user_id, requires_credits, session_id, abort_on_credit_failure=True):
+    """
+    Delete a budget and deduct its Ficore Credit in one transaction, then clear the budgets cache.
+    
+    Args:
+        db: MongoDB database instance
+        budget_id: Budget ID, as a string or ObjectId
+        filter_criteria: Ownership filter merged into the delete query
+        user_id: User ID charged for the deletion
+        requires_credits: Whether a credit is deducted for the deletion
+        session_id: Session ID for logging
+        abort_on_credit_failure: Roll the deletion back if the deduction fails; otherwise keep it and log
+    
+    Returns:
+        tuple: (True, None) on success, or (False, 'not_found' | 'credit_failed')
+    """
+    with db.client.start_session() as mongo_session:
+        with mongo_session.start_transaction():
+            # delete_one reports whether anything matched, so no separate existence check is needed
+            result = db.budgets.delete_one({'_id': ObjectId(budget_id), **filter_criteria}, session=mongo_session)
+            if result.deleted_count == 0:
+                mongo_session.abort_transaction()
+                return False, 'not_found'
+            if requires_credits and not deduct_ficore_credits(db, user_id, 1, 'delete_budget', budget_id, mongo_session=mongo_session):
+                if abort_on_credit_failure:
+                    mongo_session.abort_transaction()
+                    return False, 'credit_failed'
+                logger.warning(f"Failed to deduct FC for deleting budget {budget_id} by user {user_id}", extra={'session_id': session_id})
+            mongo_session.commit_transaction()
+    
+    try:
+        caching_ext = current_app.extensions.get('caching')
+        if caching_ext:
+            cache = list(caching_ext.values())[0]
+            cache.delete_memoized(utils.get_budgets)
+            current_app.logger.debug(f"Cleared cache for get_budgets", extra={'session_id': session_id})
+        else:
+            current_app.logger.warning(f"Caching extension not found; skipping cache clear", extra={'session_id': session_id})
+    except Exception as e:
+        current_app.logger.warning(f"Failed to clear cache for get_budgets: {str(e)}", extra={'session_id': session_id})
+    return True, None
+
 class CustomCategoryForm(FlaskForm):
     name = StringField(
         trans('budget_custom_category_name', default='Category Name'),
@@ -197,6 +379,74 @@ class CommaSeparatedIntegerField(IntegerField):
                 self.data = None
                 raise ValidationError(trans('budget_dependents_invalid', default='Not a valid integer'))
 
+# BudgetForm field labels per language; translations are static for the life of the process.
+# Keys are in the order the labels are unpacked onto the form fields.
+_FORM_LABEL_DEFAULTS = {
+    'budget_monthly_income': 'Monthly Income',
+    'budget_housing_rent': 'Housing/Rent',
+    'budget_food': 'Food',
+    'budget_transport': 'Transport',
+    'budget_dependents_support': 'Dependents Support',
+    'budget_miscellaneous': 'Miscellaneous',
+    'budget_others': 'Others',
+    'budget_savings_goal': 'Savings Goal',
+    'budget_submit': 'Submit'
+}
+_FORM_LABEL_CACHE = {}
+
+# Raw view fields charted as spending categories, in the order of _budget_labels' category labels
+_CATEGORY_RAW_FIELDS = ('housing_raw', 'food_raw', 'transport_raw', 'miscellaneous_raw', 'others_raw')
+
+@lru_cache(maxsize=16)
+def _budget_labels(lang):
+    """Category labels and budgeting tips shown beside a budget, per language."""
+    return (
+        (
+            trans('budget_housing_rent', lang, default='Housing/Rent'),
+            trans('budget_food', lang, default='Food'),
+            trans('budget_transport', lang, default='Transport'),
+            trans('budget_miscellaneous', lang, default='Miscellaneous'),
+            trans('budget_others', lang, default='Others')
+        ),
+        (
+            trans("budget_tip_track_expenses", lang, default='Track your expenses daily to stay within budget.'),
+            trans("budget_tip_ajo_savings", lang, default='Contribute to ajo savings for financial discipline.'),
+            trans("budget_tip_data_subscriptions", lang, default='Optimize data subscriptions to reduce costs.'),
+            trans("budget_tip_plan_dependents", lang, default='Plan for dependents’ expenses in advance.')
+        )
+    )
+
+def _budget_insights(budget_view):
+    """Budgeting insights for a budget view; its raw amounts are already floats."""
+    insights = []
+    income = budget_view.get('income_raw', 0.0)
+    if income > 0:
+        surplus_deficit = budget_view.get('surplus_deficit', 0.0)
+        if surplus_deficit < 0:
+            insights.append(trans("budget_insight_budget_deficit", default='Your expenses exceed your income. Consider reducing costs.'))
+        elif surplus_deficit > 0:
+            insights.append(trans("budget_insight_budget_surplus", default='You have a surplus. Consider increasing savings.'))
+        if budget_view.get('savings_goal_raw', 0.0) == 0:
+            insights.append(trans("budget_insight_set_savings_goal", default='Set a savings goal to build financial security.'))
+        if budget_view.get('housing_raw', 0.0) / income > 0.4:
+            insights.append(trans("budget_insight_high_housing", default='Housing costs exceed 40% of income. Consider cost-saving measures.'))
+    return insights
+
+def _spending_categories(budget_view, category_labels):
+    """Map category labels and custom category names to their positive amounts for charting."""
+    categories = {}
+    for label, field in zip(category_labels, _CATEGORY_RAW_FIELDS):
+        amount = budget_view.get(field, 0.0)
+        if amount > 0:
+            categories[label] = amount
+    # A custom category shares the dict with the fixed ones, so a zero amount still overrides by name
+    for cat in budget_view.get('custom_categories', []):
+        if cat['amount'] > 0:
+            categories[cat['name']] = cat['amount']
+        else:
+            categories.pop(cat['name'], None)
+    return categories
+
 class BudgetForm(FlaskForm):
     income = FloatField(
         trans('budget_monthly_income', default='Monthly Income'),
@@ -272,43 +522,54 @@ class BudgetForm(FlaskForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         lang = session.get('lang', 'en')
-        self.income.label.text = trans('budget_monthly_income', lang) or 'Monthly Income'
-        self.housing.label.text = trans('budget_housing_rent', lang) or 'Housing/Rent'
-        self.food.label.text = trans('budget_food', lang) or 'Food'
-        self.transport.label.text = trans('budget_transport', lang) or 'Transport'
-        self.dependents.label.text = trans('budget_dependents_support', lang) or 'Dependents Support'
-        self.miscellaneous.label.text = trans('budget_miscellaneous', lang) or 'Miscellaneous'
-        self.others.label.text = trans('budget_others', lang) or 'Others'
-        self.savings_goal.label.text = trans('budget_savings_goal', lang) or 'Savings Goal'
-        self.submit.label.text = trans('budget_submit', lang) or 'Submit'
+        labels = _FORM_LABEL_CACHE.get(lang)
+        if labels is None:
+            translated = trans_many(_FORM_LABEL_DEFAULTS, lang)
+            labels = tuple(translated[key] or default for key, default in _FORM_LABEL_DEFAULTS.items())
+            _FORM_LABEL_CACHE[lang] = labels
+        (
+            self.income.label.text,
+            self.housing.label.text,
+            self.food.label.text,
+            self.transport.label.text,
+            self.dependents.label.text,
+            self.miscellaneous.label.text,
+            self.others.label.text,
+            self.savings_goal.label.text,
+            self.submit.label.text
+        ) = labels
 
     def validate(self, extra_validators=None):
+        session_id = session.get('sid', 'unknown')
         if not super().validate(extra_validators):
-            logger.debug(f"Form validation failed: {self.errors}", extra={'session_id': session.get('sid', 'unknown')})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Form validation failed: %s", self.errors, extra={'session_id': session_id})
             return False
         try:
             # Log custom_categories for debugging
-            logger.debug(f"Validating custom_categories: {[cat.form.data for cat in self.custom_categories.entries]}",
-                        extra={'session_id': session.get('sid', 'unknown')})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Validating custom_categories: %r", [cat.form.data for cat in self.custom_categories.entries],
+                            extra={'session_id': session_id})
             # Validate unique custom category names and total amount
-            category_names = []
+            seen_names = set()
             total_category_amount = 0.0
             for cat in self.custom_categories.entries:
                 if not isinstance(cat.form, CustomCategoryForm):
                     logger.warning(f"Invalid entry in custom_categories: {cat.__dict__}",
-                                  extra={'session_id': session.get('sid', 'unknown')})
+                                  extra={'session_id': session_id})
                     self.custom_categories.errors.append(
                         trans('budget_invalid_category', default='Invalid custom category format')
                     )
                     return False
                 if cat.form.name.data:
-                    category_names.append(cat.form.name.data.lower())
+                    name = cat.form.name.data.lower()
+                    if name in seen_names:
+                        self.custom_categories.errors.append(
+                            trans('budget_duplicate_category_names', default='Custom category names must be unique')
+                        )
+                        return False
+                    seen_names.add(name)
                     total_category_amount += float(cat.form.amount.data or 0.0)
-            if len(category_names) != len(set(category_names)):
-                self.custom_categories.errors.append(
-                    trans('budget_duplicate_category_names', default='Custom category names must be unique')
-                )
-                return False
             # Validate total expenses do not exceed income
             total_expenses = sum([
                 float(self.housing.data or 0.0),
@@ -326,7 +587,7 @@ class BudgetForm(FlaskForm):
             return True
         except Exception as e:
             logger.error(f"Error in BudgetForm.validate: {str(e)}",
-                        exc_info=True, extra={'session_id': session.get('sid', 'unknown')})
+                        exc_info=True, extra={'session_id': session_id})
             self.custom_categories.errors.append(
                 trans('budget_validation_error', default='Error validating custom categories.')
             )
@@ -347,7 +608,11 @@ def new():
     session.permanent = False
     session_id = session.get('sid', str(uuid.uuid4()))
     session['sid'] = session_id
-    current_app.logger.debug(f"Session data: {session}", extra={'session_id': session_id})
+    user_id = current_user.id
+    user_email = current_user.email
+    debug_enabled = current_app.logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        current_app.logger.debug("Session data: %s", session, extra={'session_id': session_id})
     
     form = BudgetForm(formdata=request.form if request.method == 'POST' else None)
     db = utils.get_mongo_db()
@@ -360,10 +625,10 @@ def new():
     is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest' or request.is_json
 
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='budget',
             db=db,
-            user_id=current_user.id,
+            user_id=user_id,
             session_id=session_id,
             action='main_view'
         )
@@ -374,22 +639,26 @@ def new():
     try:
         activities = utils.get_all_recent_activities(
             db=db,
-            user_id=current_user.id,
+            user_id=user_id,
             session_id=None,
         )
-        current_app.logger.debug(f"Fetched {len(activities)} recent activities for user {current_user.id}", extra={'session_id': session_id})
+        current_app.logger.debug(f"Fetched {len(activities)} recent activities for user {user_id}", extra={'session_id': session_id})
     except Exception as e:
         current_app.logger.error(f"Failed to fetch recent activities: {str(e)}", extra={'session_id': session_id})
         flash(trans('budget_activities_load_error', default='Error loading recent activities.'), 'warning')
         activities = []
 
     try:
-        filter_criteria = {} if utils.is_admin() else {'user_id': current_user.id}
+        is_admin_user = utils.is_admin()
+        requires_credits = current_user.is_authenticated and not is_admin_user
+        filter_criteria = {} if is_admin_user else {'user_id': user_id}
         if request.method == 'POST':
-            current_app.logger.debug(f"POST request.form: {dict(request.form)}", extra={'session_id': session_id})
-            current_app.logger.debug(f"CSRF token in request.form: {'csrf_token' in request.form}", extra={'session_id': session_id})
+            if debug_enabled:
+                current_app.logger.debug("POST request.form: %s", dict(request.form), extra={'session_id': session_id})
+                current_app.logger.debug("CSRF token in request.form: %s", 'csrf_token' in request.form, extra={'session_id': session_id})
             if not form.validate_on_submit():
-                current_app.logger.debug(f"Form errors: {form.errors}", extra={'session_id': session_id})
+                if debug_enabled:
+                    current_app.logger.debug("Form errors: %s", form.errors, extra={'session_id': session_id})
                 error_message = trans('budget_form_invalid', default='Invalid form data. Please check your inputs.')
                 if is_ajax:
                     return jsonify({'success': False, 'message': error_message, 'errors': form.errors}), 400
@@ -398,38 +667,7 @@ def new():
                     'budget/new.html',
                     form=form,
                     budgets={},
-                    latest_budget={
-                        'id': None,
-                        'user_id': None,
-                        'session_id': session_id,
-                        'user_email': current_user.email,
-                        'income': format_currency(0.0),
-                        'income_raw': 0.0,
-                        'fixed_expenses': format_currency(0.0),
-                        'fixed_expenses_raw': 0.0,
-                        'variable_expenses': format_currency(0.0),
-                        'variable_expenses_raw': 0.0,
-                        'total_expenses': format_currency(0.0),
-                        'total_expenses_raw': 0.0,
-                        'savings_goal': format_currency(0.0),
-                        'savings_goal_raw': 0.0,
-                        'surplus_deficit': 0.0,
-                        'surplus_deficit_formatted': format_currency(0.0),
-                        'housing': format_currency(0.0),
-                        'housing_raw': 0.0,
-                        'food': format_currency(0.0),
-                        'food_raw': 0.0,
-                        'transport': format_currency(0.0),
-                        'transport_raw': 0.0,
-                        'dependents': str(0),
-                        'dependents_raw': 0,
-                        'miscellaneous': format_currency(0.0),
-                        'miscellaneous_raw': 0.0,
-                        'others': format_currency(0.0),
-                        'others_raw': 0.0,
-                        'custom_categories': [],
-                        'created_at': 'N/A'
-                    },
+                    latest_budget={**_EMPTY_BUDGET_TEMPLATE, 'session_id': session_id, 'user_email': user_email},
                     categories={},
                     tips=[],
                     insights=[],
@@ -440,9 +678,9 @@ def new():
 
             action = request.form.get('action')
             if action == 'create_budget' and form.validate_on_submit():
-                if current_user.is_authenticated and not utils.is_admin():
-                    if not utils.check_ficore_credit_balance(required_amount=1, user_id=current_user.id):
-                        current_app.logger.warning(f"Insufficient Ficore Credits for creating budget by user {current_user.id}", extra={'session_id': session_id})
+                if requires_credits:
+                    if not utils.check_ficore_credit_balance(required_amount=1, user_id=user_id):
+                        current_app.logger.warning(f"Insufficient Ficore Credits for creating budget by user {user_id}", extra={'session_id': session_id})
                         error_message = trans('budget_insufficient_credits', default='Insufficient Ficore Credits to create a budget. Please purchase more credits.')
                         if is_ajax:
                             return jsonify({'success': False, 'message': error_message}), 400
@@ -450,10 +688,10 @@ def new():
                         return redirect(url_for('dashboard.index'))
 
                 try:
-                    log_tool_usage(
+                    queue_tool_usage(
                         tool_name='budget',
                         db=db,
-                        user_id=current_user.id,
+                        user_id=user_id,
                         session_id=session_id,
                         action='create_budget'
                     )
@@ -463,35 +701,40 @@ def new():
 
                 income = float(form.income.data or 0.0)
                 custom_categories = []
+                variable_expenses = 0.0
                 for cat in form.custom_categories.entries:
                     try:
                         if isinstance(cat.form, CustomCategoryForm) and cat.form.name.data and cat.form.amount.data:
                             current_app.logger.debug(f"Processing custom category: name={cat.form.name.data}, amount={cat.form.amount.data}", extra={'session_id': session_id})
+                            amount = float(cat.form.amount.data)
                             custom_categories.append({
                                 'name': bleach.clean(cat.form.name.data),
-                                'amount': float(cat.form.amount.data or 0.0)
+                                'amount': amount
                             })
+                            variable_expenses += amount
                         else:
                             current_app.logger.warning(f"Skipping invalid custom category: {cat.form.data}", extra={'session_id': session_id})
                     except AttributeError as e:
                         current_app.logger.warning(f"Invalid custom category entry: {cat.__dict__}, error: {str(e)}", extra={'session_id': session_id})
                         continue
-                housing_val = float(form.housing.data or 0.0)
-                food_val = float(form.food.data or 0.0)
-                transport_val = float(form.transport.data or 0.0)
-                miscellaneous_val = float(form.miscellaneous.data or 0.0)
-                others_val = float(form.others.data or 0.0)
+                housing_val, food_val, transport_val, miscellaneous_val, others_val = (
+                    float(form.housing.data or 0.0),
+                    float(form.food.data or 0.0),
+                    float(form.transport.data or 0.0),
+                    float(form.miscellaneous.data or 0.0),
+                    float(form.others.data or 0.0)
+                )
                 fixed_expenses = housing_val + food_val + transport_val + miscellaneous_val + others_val
-                variable_expenses = sum(cat['amount'] for cat in custom_categories)
                 expenses = fixed_expenses + variable_expenses
                 savings_goal = float(form.savings_goal.data or 0.0)
                 surplus_deficit = income - expenses
                 budget_id = ObjectId()
+                now = datetime.utcnow()
                 budget_data = {
                     '_id': budget_id,
-                    'user_id': current_user.id,
+                    'user_id': user_id,
                     'session_id': session_id,
-                    'user_email': current_user.email,
+                    'user_email': user_email,
                     'income': income,
                     'fixed_expenses': fixed_expenses,
                     'variable_expenses': variable_expenses,
@@ -504,16 +747,17 @@ def new():
                     'miscellaneous': miscellaneous_val,
                     'others': others_val,
                     'custom_categories': custom_categories,
-                    'created_at': datetime.utcnow()
+                    'created_at': now
                 }
-                current_app.logger.debug(f"Saving budget data: {budget_data}", extra={'session_id': session_id})
+                if debug_enabled:
+                    current_app.logger.debug("Saving budget data: %r", budget_data, extra={'session_id': session_id})
                 try:
                     with db.client.start_session() as mongo_session:
                         with mongo_session.start_transaction():
-                            created_budget_id = create_budget(db, budget_data)
-                            if current_user.is_authenticated and not utils.is_admin():
-                                if not deduct_ficore_credits(db, current_user.id, 1, 'create_budget', budget_id):
-                                    db.budgets.delete_one({'_id': budget_id}, session=mongo_session)
+                            created_budget_id = create_budget(db, budget_data, mongo_session=mongo_session)
+                            if requires_credits:
+                                # Raising aborts the transaction, which also rolls back the budget insert
+                                if not deduct_ficore_credits(db, user_id, 1, 'create_budget', budget_id, mongo_session=mongo_session):
                                     raise ValueError("Credit deduction failed")
                             mongo_session.commit_transaction()
                     current_app.logger.info(f"Budget {created_budget_id} saved successfully to MongoDB for session {session_id}", extra={'session_id': session_id})
@@ -544,38 +788,7 @@ def new():
                         'budget/new.html',
                         form=form,
                         budgets={},
-                        latest_budget={
-                            'id': None,
-                            'user_id': None,
-                            'session_id': session_id,
-                            'user_email': current_user.email,
-                            'income': format_currency(0.0),
-                            'income_raw': 0.0,
-                            'fixed_expenses': format_currency(0.0),
-                            'fixed_expenses_raw': 0.0,
-                            'variable_expenses': format_currency(0.0),
-                            'variable_expenses_raw': 0.0,
-                            'total_expenses': format_currency(0.0),
-                            'total_expenses_raw': 0.0,
-                            'savings_goal': format_currency(0.0),
-                            'savings_goal_raw': 0.0,
-                            'surplus_deficit': 0.0,
-                            'surplus_deficit_formatted': format_currency(0.0),
-                            'housing': format_currency(0.0),
-                            'housing_raw': 0.0,
-                            'food': format_currency(0.0),
-                            'food_raw': 0.0,
-                            'transport': format_currency(0.0),
-                            'transport_raw': 0.0,
-                            'dependents': str(0),
-                            'dependents_raw': 0,
-                            'miscellaneous': format_currency(0.0),
-                            'miscellaneous_raw': 0.0,
-                            'others': format_currency(0.0),
-                            'others_raw': 0.0,
-                            'custom_categories': [],
-                            'created_at': 'N/A'
-                        },
+                        latest_budget={**_EMPTY_BUDGET_TEMPLATE, 'session_id': session_id, 'user_email': user_email},
                         categories={},
                         tips=[],
                         insights=[],
@@ -585,52 +798,28 @@ def new():
                     )
             elif action == 'delete':
                 budget_id = request.form.get('budget_id')
-                budget = db.budgets.find_one({'_id': ObjectId(budget_id), **filter_criteria})
-                if not budget:
-                    current_app.logger.warning(f"Budget {budget_id} not found for deletion", extra={'session_id': session_id})
-                    error_message = trans("budget_not_found", default='Budget not found.')
-                    if is_ajax:
-                        return jsonify({'success': False, 'message': error_message}), 404
-                    flash(error_message, "danger")
-                    return redirect(url_for('budget.manage'))
-                if current_user.is_authenticated and not utils.is_admin():
-                    if not utils.check_ficore_credit_balance(required_amount=1, user_id=current_user.id):
-                        current_app.logger.warning(f"Insufficient Ficore Credits for deleting budget {budget_id} by user {current_user.id}", extra={'session_id': session_id})
+                if requires_credits:
+                    if not utils.check_ficore_credit_balance(required_amount=1, user_id=user_id):
+                        current_app.logger.warning(f"Insufficient Ficore Credits for deleting budget {budget_id} by user {user_id}", extra={'session_id': session_id})
                         error_message = trans('budget_insufficient_credits', default='Insufficient Ficore Credits to delete a budget. Please purchase more credits.')
                         if is_ajax:
                             return jsonify({'success': False, 'message': error_message}), 400
                         flash(error_message, 'danger')
                         return redirect(url_for('dashboard.index'))
                 try:
-                    with db.client.start_session() as mongo_session:
-                        with mongo_session.start_transaction():
-                            result = db.budgets.delete_one({'_id': ObjectId(budget_id), **filter_criteria}, session=mongo_session)
-                            if result.deleted_count > 0:
-                                if current_user.is_authenticated and not utils.is_admin():
-                                    if not deduct_ficore_credits(db, current_user.id, 1, 'delete_budget', budget_id):
-                                        error_message = trans('budget_credit_deduction_failed', default='Failed to deduct Ficore Credit for deleting budget.')
-                                        if is_ajax:
-                                            return jsonify({'success': False, 'message': error_message}), 400
-                                        flash(error_message, 'danger')
-                                        return redirect(url_for('budget.manage'))
-                                mongo_session.commit_transaction()
-                            else:
-                                current_app.logger.warning(f"Budget ID {budget_id} not found for session {session_id}", extra={'session_id': session_id})
-                                error_message = trans("budget_not_found", default='Budget not found.')
-                                if is_ajax:
-                                    return jsonify({'success': False, 'message': error_message}), 404
-                                flash(error_message, "danger")
-                                return redirect(url_for('budget.manage'))
-                    try:
-                        caching_ext = current_app.extensions.get('caching')
-                        if caching_ext:
-                            cache = list(caching_ext.values())[0]
-                            cache.delete_memoized(utils.get_budgets)
-                            current_app.logger.debug(f"Cleared cache for get_budgets", extra={'session_id': session_id})
+                    deleted, error = _delete_budget(db, budget_id, filter_criteria, user_id, requires_credits, session_id)
+                    if not deleted:
+                        if error == 'credit_failed':
+                            error_message = trans('budget_credit_deduction_failed', default='Failed to deduct Ficore Credit for deleting budget.')
+                            status = 400
                         else:
-                            current_app.logger.warning(f"Caching extension not found; skipping cache clear", extra={'session_id': session_id})
-                    except Exception as e:
-                        current_app.logger.warning(f"Failed to clear cache for get_budgets: {str(e)}", extra={'session_id': session_id})
+                            current_app.logger.warning(f"Budget {budget_id} not found for deletion", extra={'session_id': session_id})
+                            error_message = trans("budget_not_found", default='Budget not found.')
+                            status = 404
+                        if is_ajax:
+                            return jsonify({'success': False, 'message': error_message}), status
+                        flash(error_message, "danger")
+                        return redirect(url_for('budget.manage'))
                     current_app.logger.info(f"Deleted budget ID {budget_id} for session {session_id}", extra={'session_id': session_id})
                     success_message = trans("budget_deleted_success", default='Budget deleted successfully!')
                     if is_ajax:
@@ -645,115 +834,24 @@ def new():
                     flash(error_message, "danger")
                     return redirect(url_for('budget.manage'))
 
-        budgets = list(db.budgets.find(filter_criteria).sort('created_at', -1).limit(10))
-        current_app.logger.info(f"Read {len(budgets)} records from MongoDB budgets collection [session: {session_id}]", extra={'session_id': session_id})
+        budgets = db.budgets.find(filter_criteria, _BUDGET_PROJECTION).sort('created_at', -1).limit(10)
         budgets_dict = {}
         latest_budget = None
         for budget in budgets:
-            fixed_raw = float(budget.get('fixed_expenses', 0.0))
-            var_raw = float(budget.get('variable_expenses', 0.0))
-            total_raw = fixed_raw + var_raw
-            budget_data = {
-                'id': str(budget['_id']),
-                'user_id': budget.get('user_id'),
-                'session_id': budget.get('session_id'),
-                'user_email': budget.get('user_email', current_user.email),
-                'income': format_currency(budget.get('income', 0.0)),
-                'income_raw': float(budget.get('income', 0.0)),
-                'fixed_expenses': format_currency(fixed_raw),
-                'fixed_expenses_raw': fixed_raw,
-                'variable_expenses': format_currency(var_raw),
-                'variable_expenses_raw': var_raw,
-                'total_expenses': format_currency(total_raw),
-                'total_expenses_raw': total_raw,
-                'savings_goal': format_currency(budget.get('savings_goal', 0.0)),
-                'savings_goal_raw': float(budget.get('savings_goal', 0.0)),
-                'surplus_deficit': float(budget.get('surplus_deficit', 0.0)),
-                'surplus_deficit_formatted': format_currency(budget.get('surplus_deficit', 0.0)),
-                'housing': format_currency(budget.get('housing', 0.0)),
-                'housing_raw': float(budget.get('housing', 0.0)),
-                'food': format_currency(budget.get('food', 0.0)),
-                'food_raw': float(budget.get('food', 0.0)),
-                'transport': format_currency(budget.get('transport', 0.0)),
-                'transport_raw': float(budget.get('transport', 0.0)),
-                'dependents': str(budget.get('dependents', 0)),
-                'dependents_raw': int(budget.get('dependents', 0)),
-                'miscellaneous': format_currency(budget.get('miscellaneous', 0.0)),
-                'miscellaneous_raw': float(budget.get('miscellaneous', 0.0)),
-                'others': format_currency(budget.get('others', 0.0)),
-                'others_raw': float(budget.get('others', 0.0)),
-                'custom_categories': budget.get('custom_categories', []),
-                'created_at': budget.get('created_at').strftime('%Y-%m-%d') if budget.get('created_at') else 'N/A'
-            }
+            budget_data = _budget_to_view(budget, user_email)
             budgets_dict[budget_data['id']] = budget_data
-            if not latest_budget or (budget.get('created_at') and (latest_budget['created_at'] == 'N/A' or budget.get('created_at') > datetime.strptime(latest_budget['created_at'], '%Y-%m-%d'))):
+            # Budgets are sorted by created_at descending, so the first one is the latest
+            if latest_budget is None:
                 latest_budget = budget_data
+        current_app.logger.info(f"Read {len(budgets_dict)} records from MongoDB budgets collection [session: {session_id}]", extra={'session_id': session_id})
         if not latest_budget:
-            latest_budget = {
-                'id': None,
-                'user_id': None,
-                'session_id': session_id,
-                'user_email': current_user.email,
-                'income': format_currency(0.0),
-                'income_raw': 0.0,
-                'fixed_expenses': format_currency(0.0),
-                'fixed_expenses_raw': 0.0,
-                'variable_expenses': format_currency(0.0),
-                'variable_expenses_raw': 0.0,
-                'total_expenses': format_currency(0.0),
-                'total_expenses_raw': 0.0,
-                'savings_goal': format_currency(0.0),
-                'savings_goal_raw': 0.0,
-                'surplus_deficit': 0.0,
-                'surplus_deficit_formatted': format_currency(0.0),
-                'housing': format_currency(0.0),
-                'housing_raw': 0.0,
-                'food': format_currency(0.0),
-                'food_raw': 0.0,
-                'transport': format_currency(0.0),
-                'transport_raw': 0.0,
-                'dependents': str(0),
-                'dependents_raw': 0,
-                'miscellaneous': format_currency(0.0),
-                'miscellaneous_raw': 0.0,
-                'others': format_currency(0.0),
-                'others_raw': 0.0,
-                'custom_categories': [],
-                'created_at': 'N/A'
-            }
-        categories = {
-            trans('budget_housing_rent', default='Housing/Rent'): latest_budget.get('housing_raw', 0.0),
-            trans('budget_food', default='Food'): latest_budget.get('food_raw', 0.0),
-            trans('budget_transport', default='Transport'): latest_budget.get('transport_raw', 0.0),
-            trans('budget_miscellaneous', default='Miscellaneous'): latest_budget.get('miscellaneous_raw', 0.0),
-            trans('budget_others', default='Others'): latest_budget.get('others_raw', 0.0),
-        }
-        for cat in latest_budget.get('custom_categories', []):
-            categories[cat['name']] = cat['amount']
-        categories = {k: v for k, v in categories.items() if v > 0}
-        tips = [
-            trans("budget_tip_track_expenses", default='Track your expenses daily to stay within budget.'),
-            trans("budget_tip_ajo_savings", default='Contribute to ajo savings for financial discipline.'),
-            trans("budget_tip_data_subscriptions", default='Optimize data subscriptions to reduce costs.'),
-            trans("budget_tip_plan_dependents", default='Plan for dependents’ expenses in advance.')
-        ]
-        insights = []
-        try:
-            income_float = float(latest_budget.get('income_raw', 0.0))
-            surplus_deficit_float = float(latest_budget.get('surplus_deficit', 0.0))
-            savings_goal_float = float(latest_budget.get('savings_goal_raw', 0.0))
-            if income_float > 0:
-                if surplus_deficit_float < 0:
-                    insights.append(trans("budget_insight_budget_deficit", default='Your expenses exceed your income. Consider reducing costs.'))
-                elif surplus_deficit_float > 0:
-                    insights.append(trans("budget_insight_budget_surplus", default='You have a surplus. Consider increasing savings.'))
-                if savings_goal_float == 0:
-                    insights.append(trans("budget_insight_set_savings_goal", default='Set a savings goal to build financial security.'))
-                if income_float > 0 and latest_budget.get('housing_raw', 0.0) / income_float > 0.4:
-                    insights.append(trans("budget_insight_high_housing", default='Housing costs exceed 40% of income. Consider cost-saving measures.'))
-        except (ValueError, TypeError) as e:
-            current_app.logger.warning(f"Error parsing budget amounts for insights: {str(e)}", extra={'session_id': session_id})
-        current_app.logger.debug(f"Rendering template with context: form={form}, budgets={budgets_dict}, latest_budget={latest_budget}, categories={categories}, active_tab={active_tab}", extra={'session_id': session_id})
+            latest_budget = {**_EMPTY_BUDGET_TEMPLATE, 'session_id': session_id, 'user_email': user_email}
+        category_labels, tips = _budget_labels(session.get('lang', 'en'))
+        categories = _spending_categories(latest_budget, category_labels)
+        insights = _budget_insights(latest_budget)
+        if debug_enabled:
+            current_app.logger.debug("Rendering template with context: form=%s, budgets=%s, latest_budget=%s, categories=%s, active_tab=%s",
+                                     form, budgets_dict, latest_budget, categories, active_tab, extra={'session_id': session_id})
         return render_template(
             'budget/new.html',
             form=form,
@@ -776,38 +874,7 @@ def new():
             'budget/new.html',
             form=form,
             budgets={},
-            latest_budget={
-                'id': None,
-                'user_id': None,
-                'session_id': session_id,
-                'user_email': current_user.email if current_user.is_authenticated else '',
-                'income': format_currency(0.0),
-                'income_raw': 0.0,
-                'fixed_expenses': format_currency(0.0),
-                'fixed_expenses_raw': 0.0,
-                'variable_expenses': format_currency(0.0),
-                'variable_expenses_raw': 0.0,
-                'total_expenses': format_currency(0.0),
-                'total_expenses_raw': 0.0,
-                'savings_goal': format_currency(0.0),
-                'savings_goal_raw': 0.0,
-                'surplus_deficit': 0.0,
-                'surplus_deficit_formatted': format_currency(0.0),
-                'housing': format_currency(0.0),
-                'housing_raw': 0.0,
-                'food': format_currency(0.0),
-                'food_raw': 0.0,
-                'transport': format_currency(0.0),
-                'transport_raw': 0.0,
-                'dependents': str(0),
-                'dependents_raw': 0,
-                'miscellaneous': format_currency(0.0),
-                'miscellaneous_raw': 0.0,
-                'others': format_currency(0.0),
-                'others_raw': 0.0,
-                'custom_categories': [],
-                'created_at': 'N/A'
-            },
+            latest_budget={**_EMPTY_BUDGET_TEMPLATE, 'session_id': session_id, 'user_email': current_user.email if current_user.is_authenticated else ''},
             categories={},
             tips=[],
             insights=[],
@@ -825,147 +892,59 @@ def dashboard():
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
         current_app.logger.debug(f"New session created with sid: {session['sid']}", extra={'session_id': session['sid']})
+    session_id = session['sid']
     session.permanent = False
     session.modified = True
     db = utils.get_mongo_db()
 
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='budget',
             db=db,
             user_id=current_user.id,
-            session_id=session.get('sid', 'unknown'),
+            session_id=session_id,
             action='dashboard_view'
         )
     except Exception as e:
-        current_app.logger.error(f"Failed to log tool usage: {str(e)}", extra={'session_id': session.get('sid', 'unknown')})
+        current_app.logger.error(f"Failed to log tool usage: {str(e)}", extra={'session_id': session_id})
         flash(trans('budget_log_error', default='Error logging budget activity. Please try again.'), 'warning')
 
-    try:
-        activities = utils.get_all_recent_activities(
-            db=db,
-            user_id=current_user.id,
-            session_id=None,
-        )
-    except Exception as e:
-        current_app.logger.error(f"Failed to fetch recent activities: {str(e)}", extra={'session_id': session.get('sid', 'unknown')})
-        flash(trans('budget_activities_load_error', default='Error loading recent activities.'), 'warning')
-        activities = []
+    # Recent activities are independent of the budget query, so fetch them on a worker while the budgets load
+    activities_future = _DASHBOARD_EXECUTOR.submit(
+        copy_current_request_context(utils.get_all_recent_activities),
+        db=db,
+        user_id=current_user.id,
+        session_id=None,
+    )
 
     try:
         filter_criteria = {} if utils.is_admin() else {'user_id': current_user.id}
-        budgets = list(db.budgets.find(filter_criteria).sort('created_at', -1).limit(10))
+        user_email = current_user.email
+        budgets = db.budgets.find(filter_criteria, _BUDGET_PROJECTION).sort('created_at', -1).limit(10)
         
         budgets_dict = {}
         latest_budget = None
         for budget in budgets:
-            fixed_raw = float(budget.get('fixed_expenses', 0.0))
-            var_raw = float(budget.get('variable_expenses', 0.0))
-            total_raw = fixed_raw + var_raw
-            budget_data = {
-                'id': str(budget['_id']),
-                'user_id': budget.get('user_id'),
-                'session_id': budget.get('session_id'),
-                'user_email': budget.get('user_email', current_user.email),
-                'income': format_currency(budget.get('income', 0.0)),
-                'income_raw': float(budget.get('income', 0.0)),
-                'fixed_expenses': format_currency(fixed_raw),
-                'fixed_expenses_raw': fixed_raw,
-                'variable_expenses': format_currency(var_raw),
-                'variable_expenses_raw': var_raw,
-                'total_expenses': format_currency(total_raw),
-                'total_expenses_raw': total_raw,
-                'savings_goal': format_currency(budget.get('savings_goal', 0.0)),
-                'savings_goal_raw': float(budget.get('savings_goal', 0.0)),
-                'surplus_deficit': float(budget.get('surplus_deficit', 0.0)),
-                'surplus_deficit_formatted': format_currency(budget.get('surplus_deficit', 0.0)),
-                'housing': format_currency(budget.get('housing', 0.0)),
-                'housing_raw': float(budget.get('housing', 0.0)),
-                'food': format_currency(budget.get('food', 0.0)),
-                'food_raw': float(budget.get('food', 0.0)),
-                'transport': format_currency(budget.get('transport', 0.0)),
-                'transport_raw': float(budget.get('transport', 0.0)),
-                'dependents': str(budget.get('dependents', 0)),
-                'dependents_raw': int(budget.get('dependents', 0)),
-                'miscellaneous': format_currency(budget.get('miscellaneous', 0.0)),
-                'miscellaneous_raw': float(budget.get('miscellaneous', 0.0)),
-                'others': format_currency(budget.get('others', 0.0)),
-                'others_raw': float(budget.get('others', 0.0)),
-                'custom_categories': budget.get('custom_categories', []),
-                'created_at': budget.get('created_at').strftime('%Y-%m-%d') if budget.get('created_at') else 'N/A'
-            }
+            budget_data = _budget_to_view(budget, user_email)
             budgets_dict[budget_data['id']] = budget_data
-            if not latest_budget or (budget.get('created_at') and (latest_budget['created_at'] == 'N/A' or budget.get('created_at') > datetime.strptime(latest_budget['created_at'], '%Y-%m-%d'))):
+            # Budgets are sorted by created_at descending, so the first one is the latest
+            if latest_budget is None:
                 latest_budget = budget_data
 
-        if not latest_budget:
-            latest_budget = {
-                'id': None,
-                'user_id': None,
-                'session_id': session.get('sid', 'unknown'),
-                'user_email': current_user.email,
-                'income': format_currency(0.0),
-                'income_raw': 0.0,
-                'fixed_expenses': format_currency(0.0),
-                'fixed_expenses_raw': 0.0,
-                'variable_expenses': format_currency(0.0),
-                'variable_expenses_raw': 0.0,
-                'total_expenses': format_currency(0.0),
-                'total_expenses_raw': 0.0,
-                'savings_goal': format_currency(0.0),
-                'savings_goal_raw': 0.0,
-                'surplus_deficit': 0.0,
-                'surplus_deficit_formatted': format_currency(0.0),
-                'housing': format_currency(0.0),
-                'housing_raw': 0.0,
-                'food': format_currency(0.0),
-                'food_raw': 0.0,
-                'transport': format_currency(0.0),
-                'transport_raw': 0.0,
-                'dependents': str(0),
-                'dependents_raw': 0,
-                'miscellaneous': format_currency(0.0),
-                'miscellaneous_raw': 0.0,
-                'others': format_currency(0.0),
-                'others_raw': 0.0,
-                'custom_categories': [],
-                'created_at': 'N/A'
-            }
+        try:
+            activities = activities_future.result(timeout=_DASHBOARD_ACTIVITIES_TIMEOUT)
+        except Exception as e:
+            current_app.logger.error(f"Failed to fetch recent activities: {str(e)}", extra={'session_id': session_id})
+            flash(trans('budget_activities_load_error', default='Error loading recent activities.'), 'warning')
+            activities = []
 
-        categories = {
-            trans('budget_housing_rent', default='Housing/Rent'): latest_budget.get('housing_raw', 0.0),
-            trans('budget_food', default='Food'): latest_budget.get('food_raw', 0.0),
-            trans('budget_transport', default='Transport'): latest_budget.get('transport_raw', 0.0),
-            trans('budget_miscellaneous', default='Miscellaneous'): latest_budget.get('miscellaneous_raw', 0.0),
-            trans('budget_others', default='Others'): latest_budget.get('others_raw', 0.0)
-        }
-        for cat in latest_budget.get('custom_categories', []):
-            categories[cat['name']] = cat['amount']
-        categories = {k: v for k, v in categories.items() if v > 0}
+        if not latest_budget:
+            latest_budget = {**_EMPTY_BUDGET_TEMPLATE, 'session_id': session_id, 'user_email': user_email}
 
-        tips = [
-            trans("budget_tip_track_expenses", default='Track your expenses daily to stay within budget.'),
-            trans("budget_tip_ajo_savings", default='Contribute to ajo savings for financial discipline.'),
-            trans("budget_tip_data_subscriptions", default='Optimize data subscriptions to reduce costs.'),
-            trans("budget_tip_plan_dependents", default='Plan for dependents’ expenses in advance.')
-        ]
+        category_labels, tips = _budget_labels(session.get('lang', 'en'))
+        categories = _spending_categories(latest_budget, category_labels)
 
-        insights = []
-        try:
-            income_float = float(latest_budget.get('income_raw', 0.0))
-            surplus_deficit_float = float(latest_budget.get('surplus_deficit', 0.0))
-            savings_goal_float = float(latest_budget.get('savings_goal_raw', 0.0))
-            if income_float > 0:
-                if surplus_deficit_float < 0:
-                    insights.append(trans("budget_insight_budget_deficit", default='Your expenses exceed your income. Consider reducing costs.'))
-                elif surplus_deficit_float > 0:
-                    insights.append(trans("budget_insight_budget_surplus", default='You have a surplus. Consider increasing savings.'))
-                if savings_goal_float == 0:
-                    insights.append(trans("budget_insight_set_savings_goal", default='Set a savings goal to build financial security.'))
-                if income_float > 0 and latest_budget.get('housing_raw', 0.0) / income_float > 0.4:
-                    insights.append(trans("budget_insight_high_housing", default='Housing costs exceed 40% of income. Consider cost-saving measures.'))
-        except (ValueError, TypeError) as e:
-            current_app.logger.warning(f"Error parsing budget amounts for insights: {str(e)}", extra={'session_id': session.get('sid', 'unknown')})
+        insights = _budget_insights(latest_budget)
 
         return render_template(
             'budget/dashboard.html',
@@ -978,7 +957,7 @@ def dashboard():
             tool_title=trans('budget_dashboard', default='Budget Dashboard')
         )
     except Exception as e:
-        current_app.logger.error(f"Error in budget.dashboard: {str(e)}", extra={'session_id': session.get('sid', 'unknown')})
+        current_app.logger.error(f"Error in budget.dashboard: {str(e)}", extra={'session_id': session_id})
         flash(trans('budget_dashboard_load_error', default='Error loading budget dashboard.'), 'danger')
         return render_template(
             'budget/dashboard.html',
@@ -1000,125 +979,69 @@ def manage():
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
         current_app.logger.debug(f"New session created with sid: {session['sid']}", extra={'session_id': session['sid']})
+    session_id = session['sid']
     session.permanent = False
     session.modified = True
     db = utils.get_mongo_db()
 
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='budget',
             db=db,
             user_id=current_user.id,
-            session_id=session.get('sid', 'unknown'),
+            session_id=session_id,
             action='manage_view'
         )
     except Exception as e:
-        current_app.logger.error(f"Failed to log tool usage: {str(e)}", extra={'session_id': session.get('sid', 'unknown')})
+        current_app.logger.error(f"Failed to log tool usage: {str(e)}", extra={'session_id': session_id})
         flash(trans('budget_log_error', default='Error logging budget activity. Please try again.'), 'warning')
 
-    filter_criteria = {} if utils.is_admin() else {'user_id': current_user.id}
+    is_admin_user = utils.is_admin()
+    requires_credits = current_user.is_authenticated and not is_admin_user
+    filter_criteria = {} if is_admin_user else {'user_id': current_user.id}
 
     if request.method == 'POST':
         action = request.form.get('action')
         if action == 'delete':
             budget_id = request.form.get('budget_id')
-            budget = db.budgets.find_one({'_id': ObjectId(budget_id), **filter_criteria})
-            if not budget:
-                current_app.logger.warning(f"Budget {budget_id} not found for deletion", extra={'session_id': session.get('sid', 'unknown')})
-                flash(trans("budget_not_found", default='Budget not found.'), "danger")
-                return redirect(url_for('budget.manage'))
-            
-            if current_user.is_authenticated and not utils.is_admin():
+            if requires_credits:
                 if not utils.check_ficore_credit_balance(required_amount=1, user_id=current_user.id):
-                    current_app.logger.warning(f"Insufficient Ficore Credits for deleting budget {budget_id} by user {current_user.id}", extra={'session_id': session.get('sid', 'unknown')})
+                    current_app.logger.warning(f"Insufficient Ficore Credits for deleting budget {budget_id} by user {current_user.id}", extra={'session_id': session_id})
                     flash(trans('budget_insufficient_credits', default='Insufficient Ficore Credits to delete a budget. Please purchase more credits.'), 'danger')
                     return redirect(url_for('dashboard.index'))
             
             try:
-                with db.client.start_session() as mongo_session:
-                    with mongo_session.start_transaction():
-                        result = db.budgets.delete_one({'_id': ObjectId(budget_id), **filter_criteria}, session=mongo_session)
-                        if result.deleted_count > 0:
-                            if current_user.is_authenticated and not utils.is_admin():
-                                if not deduct_ficore_credits(db, current_user.id, 1, 'delete_budget', budget_id):
-                                    current_app.logger.error(f"Failed to deduct Ficore Credit for deleting budget {budget_id} by user {current_user.id}", extra={'session_id': session.get('sid', 'unknown')})
-                                    flash(trans('budget_credit_deduction_failed', default='Failed to deduct Ficore Credit for deleting budget.'), 'danger')
-                                    return redirect(url_for('budget.manage'))
-                            mongo_session.commit_transaction()
-                        else:
-                            current_app.logger.warning(f"Budget ID {budget_id} not found for session {session['sid']}", extra={'session_id': session['sid']})
-                            flash(trans("budget_not_found", default='Budget not found.'), "danger")
-                            return redirect(url_for('budget.manage'))
-                try:
-                    caching_ext = current_app.extensions.get('caching')
-                    if caching_ext:
-                        cache = list(caching_ext.values())[0]
-                        cache.delete_memoized(utils.get_budgets)
-                        current_app.logger.debug(f"Cleared cache for get_budgets", extra={'session_id': session.get('sid', 'unknown')})
-                    else:
-                        current_app.logger.warning(f"Caching extension not found; skipping cache clear", extra={'session_id': session.get('sid', 'unknown')})
-                except Exception as e:
-                    current_app.logger.warning(f"Failed to clear cache for get_budgets: {str(e)}", extra={'session_id': session.get('sid', 'unknown')})
-                current_app.logger.info(f"Deleted budget ID {budget_id} for session {session['sid']}", extra={'session_id': session['sid']})
-                flash(trans("budget_deleted_success", default='Budget deleted successfully!'), "success")
+                deleted, error = _delete_budget(db, budget_id, filter_criteria, current_user.id, requires_credits, session_id)
+                if deleted:
+                    current_app.logger.info(f"Deleted budget ID {budget_id} for session {session_id}", extra={'session_id': session_id})
+                    flash(trans("budget_deleted_success", default='Budget deleted successfully!'), "success")
+                elif error == 'credit_failed':
+                    current_app.logger.error(f"Failed to deduct Ficore Credit for deleting budget {budget_id} by user {current_user.id}", extra={'session_id': session_id})
+                    flash(trans('budget_credit_deduction_failed', default='Failed to deduct Ficore Credit for deleting budget.'), 'danger')
+                else:
+                    current_app.logger.warning(f"Budget {budget_id} not found for deletion", extra={'session_id': session_id})
+                    flash(trans("budget_not_found", default='Budget not found.'), "danger")
             except Exception as e:
-                current_app.logger.error(f"Failed to delete budget ID {budget_id} for session {session['sid']}: {str(e)}", extra={'session_id': session['sid']})
+                current_app.logger.error(f"Failed to delete budget ID {budget_id} for session {session_id}: {str(e)}", extra={'session_id': session_id})
                 flash(trans("budget_delete_failed", default='Error deleting budget.'), "danger")
             return redirect(url_for('budget.manage'))
 
     try:
-        budgets = list(db.budgets.find(filter_criteria).sort('created_at', -1).limit(20))
-        budgets_dict = {}
-        
-        for budget in budgets:
-            fixed_raw = float(budget.get('fixed_expenses', 0.0))
-            var_raw = float(budget.get('variable_expenses', 0.0))
-            total_raw = fixed_raw + var_raw
-            budget_data = {
-                'id': str(budget['_id']),
-                'user_id': budget.get('user_id'),
-                'session_id': budget.get('session_id'),
-                'user_email': budget.get('user_email', current_user.email),
-                'income': format_currency(budget.get('income', 0.0)),
-                'income_raw': float(budget.get('income', 0.0)),
-                'fixed_expenses': format_currency(fixed_raw),
-                'fixed_expenses_raw': fixed_raw,
-                'variable_expenses': format_currency(var_raw),
-                'variable_expenses_raw': var_raw,
-                'total_expenses': format_currency(total_raw),
-                'total_expenses_raw': total_raw,
-                'savings_goal': format_currency(budget.get('savings_goal', 0.0)),
-                'savings_goal_raw': float(budget.get('savings_goal', 0.0)),
-                'surplus_deficit': float(budget.get('surplus_deficit', 0.0)),
-                'surplus_deficit_formatted': format_currency(budget.get('surplus_deficit', 0.0)),
-                'housing': format_currency(budget.get('housing', 0.0)),
-                'housing_raw': float(budget.get('housing', 0.0)),
-                'food': format_currency(budget.get('food', 0.0)),
-                'food_raw': float(budget.get('food', 0.0)),
-                'transport': format_currency(budget.get('transport', 0.0)),
-                'transport_raw': float(budget.get('transport', 0.0)),
-                'dependents': str(budget.get('dependents', 0)),
-                'dependents_raw': int(budget.get('dependents', 0)),
-                'miscellaneous': format_currency(budget.get('miscellaneous', 0.0)),
-                'miscellaneous_raw': float(budget.get('miscellaneous', 0.0)),
-                'others': format_currency(budget.get('others', 0.0)),
-                'others_raw': float(budget.get('others', 0.0)),
-                'custom_categories': budget.get('custom_categories', []),
-                'created_at': budget.get('created_at').strftime('%Y-%m-%d %H:%M') if budget.get('created_at') else 'N/A'
-            }
-            budgets_dict[budget_data['id']] = budget_data
+        budgets = db.budgets.find(filter_criteria, _BUDGET_PROJECTION).sort('created_at', -1).limit(20)
+        user_email = current_user.email
+        budgets_list = [_budget_to_view(budget, user_email, date_format='%Y-%m-%d %H:%M') for budget in budgets]
 
         return render_template(
             'budget/manage.html',
-            budgets=budgets_dict,
+            budgets=budgets_list,
             tool_title=trans('budget_manage_budgets', default='Manage Budgets')
         )
     except Exception as e:
-        current_app.logger.error(f"Error in budget.manage: {str(e)}", extra={'session_id': session.get('sid', 'unknown')})
+        current_app.logger.error(f"Error in budget.manage: {str(e)}", extra={'session_id': session_id})
         flash(trans('budget_manage_load_error', default='Error loading budgets for management.'), 'danger')
         return render_template(
             'budget/manage.html',
-            budgets={},
+            budgets=[],
             tool_title=trans('budget_manage_budgets', default='Manage Budgets')
         )
 
@@ -1127,33 +1050,38 @@ def manage():
 @utils.requires_role(['personal', 'admin'])
 @utils.limiter.limit("5 per minute")
 def summary():
+    session_id = session.get('sid', 'unknown')
     db = utils.get_mongo_db()
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='budget',
             db=db,
             user_id=current_user.id,
-            session_id=session.get('sid', 'unknown'),
+            session_id=session_id,
             action='summary_view'
         )
         filter_criteria = {} if utils.is_admin() else {'user_id': current_user.id}
-        latest_budget = db.budgets.find_one(filter_criteria, sort=[('created_at', -1)])
-        if not latest_budget:
-            current_app.logger.info(f"No budget found for user {current_user.id}", extra={'session_id': session.get('sid', 'unknown')})
+        latest_budget = db.budgets.find_one(
+            filter_criteria,
+            {'income': 1, 'user_email': 1, '_id': 0},
+            sort=[('created_at', -1)]
+        )
+        if latest_budget is None:
+            current_app.logger.info(f"No budget found for user {current_user.id}", extra={'session_id': session_id})
             return jsonify({
-                'totalBudget': format_currency(0.0),
+                'totalBudget': _ZERO_CURRENCY,
                 'user_email': current_user.email
             })
         total_budget = float(latest_budget.get('income', 0.0))
-        current_app.logger.info(f"Fetched budget summary for user {current_user.id}: {total_budget}", extra={'session_id': session.get('sid', 'unknown')})
+        current_app.logger.info(f"Fetched budget summary for user {current_user.id}: {total_budget}", extra={'session_id': session_id})
         return jsonify({
             'totalBudget': format_currency(total_budget),
             'user_email': latest_budget.get('user_email', current_user.email if current_user.is_authenticated else '')
         })
     except Exception as e:
-        current_app.logger.error(f"Error in budget.summary: {str(e)}", extra={'session_id': session.get('sid', 'unknown')})
+        current_app.logger.error(f"Error in budget.summary: {str(e)}", extra={'session_id': session_id})
         return jsonify({
-            'totalBudget': format_currency(0.0),
+            'totalBudget': _ZERO_CURRENCY,
             'user_email': current_user.email if current_user.is_authenticated else ''
         }), 500
 
@@ -1164,6 +1092,7 @@ def export_pdf():
     """Export budget to PDF with FC deduction, supporting single budget or full history."""
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
+    session_id = session['sid']
     
     db = utils.get_mongo_db()
     budget_id = request.args.get('budget_id')
@@ -1173,29 +1102,34 @@ def export_pdf():
         is_single_budget = bool(budget_id)
         credit_cost = 1 if is_single_budget else 2
         export_type = 'single_budget' if is_single_budget else 'full_history'
+        is_admin_user = utils.is_admin()
+        requires_credits = current_user.is_authenticated and not is_admin_user
         
         # Check FC balance before generating PDF
-        if current_user.is_authenticated and not utils.is_admin():
+        if requires_credits:
             if not utils.check_ficore_credit_balance(required_amount=credit_cost, user_id=current_user.id):
                 flash(trans('budget_insufficient_credits_pdf', default=f'Insufficient credits for PDF export. {export_type.replace("_", " ").title()} export costs {credit_cost} FC.'), 'danger')
                 return redirect(url_for('budget.manage'))
         
-        filter_criteria = {} if utils.is_admin() else {'user_id': str(current_user.id)}
+        filter_criteria = {} if is_admin_user else {'user_id': str(current_user.id)}
         
         # Fetch budget(s)
         if is_single_budget:
-            if not ObjectId.is_valid(budget_id):
+            try:
+                budget_oid = ObjectId(budget_id)
+            except (InvalidId, TypeError):
                 flash(trans('budget_invalid_id', default='Invalid budget ID.'), 'danger')
                 return redirect(url_for('budget.manage'))
-            budget = db.budgets.find_one({'_id': ObjectId(budget_id), **filter_criteria})
+            budget = db.budgets.find_one({'_id': budget_oid, **filter_criteria}, _BUDGET_PROJECTION)
             if not budget:
                 flash(trans('budget_no_data_for_pdf', default='No budget data found for PDF export.'), 'warning')
                 return redirect(url_for('budget.manage'))
             budgets = [budget]
-            report_title = f"Budget Report - {utils.format_date(budget.get('created_at'))}"
+            created_at_display = utils.format_date(budget.get('created_at'))
+            report_title = f"Budget Report - {created_at_display}"
             filename = f"budget_report_{budget_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.pdf"
         else:
-            budgets = list(db.budgets.find(filter_criteria).sort('created_at', -1).limit(10))
+            budgets = list(db.budgets.find(filter_criteria, _BUDGET_HISTORY_PDF_PROJECTION).sort('created_at', -1).limit(10))
             if not budgets:
                 flash(trans('budget_no_data_for_pdf', default='No budget data found for PDF export.'), 'warning')
                 return redirect(url_for('budget.manage'))
@@ -1228,7 +1162,7 @@ def export_pdf():
             p.drawString(50, y, "Budget Details")
             y -= 20
             p.setFont("Helvetica", 10)
-            p.drawString(50, y, f"Date: {utils.format_date(budget.get('created_at'))}")
+            p.drawString(50, y, f"Date: {created_at_display}")
             p.drawString(50, y - 15, f"Income: {format_currency(budget.get('income', 0))}")
             p.drawString(50, y - 30, f"Fixed Expenses: {format_currency(budget.get('fixed_expenses', 0))}")
             p.drawString(50, y - 45, f"Variable Expenses: {format_currency(budget.get('variable_expenses', 0))}")
@@ -1275,10 +1209,13 @@ def export_pdf():
             p.drawString(450, y, "Surplus/Deficit")
             y -= 20
             
-            # Budget records
+            # Budget records, written into one text object per page so each page gets a single text block
             p.setFont("Helvetica", 9)
+            rows = p.beginText()
+            rows.setFont("Helvetica", 9)
             for budget in budgets:
                 if y < 50:  # New page if needed
+                    p.drawText(rows)
                     p.showPage()
                     draw_ficore_pdf_header(p, current_user, y_start=height - 50)
                     y = height - 120
@@ -1292,32 +1229,37 @@ def export_pdf():
                     p.drawString(450, y, "Surplus/Deficit")
                     y -= 20
                     p.setFont("Helvetica", 9)
+                    rows = p.beginText()
+                    rows.setFont("Helvetica", 9)
                 
-                p.drawString(50, y, utils.format_date(budget.get('created_at')))
-                p.drawString(150, y, format_currency(budget.get('income', 0)))
-                p.drawString(220, y, format_currency(budget.get('fixed_expenses', 0)))
-                p.drawString(290, y, format_currency(budget.get('variable_expenses', 0)))
-                p.drawString(370, y, format_currency(budget.get('savings_goal', 0)))
-                p.drawString(450, y, format_currency(budget.get('surplus_deficit', 0)))
+                rows.setTextOrigin(50, y)
+                rows.textOut(utils.format_date(budget.get('created_at')))
+                amounts = map(format_currency, map(budget.get, _PDF_HISTORY_AMOUNT_FIELDS, repeat(0)))
+                for x, amount in zip(_PDF_HISTORY_AMOUNT_X, amounts):
+                    rows.setTextOrigin(x, y)
+                    rows.textOut(amount)
                 y -= 15
+            p.drawText(rows)
         
         p.save()
         buffer.seek(0)
         
         # Deduct FC for PDF export
-        if current_user.is_authenticated and not utils.is_admin():
+        if requires_credits:
             if not deduct_ficore_credits(db, current_user.id, credit_cost, f'export_budget_pdf_{export_type}', budget_id if is_single_budget else None):
                 flash(trans('budget_credit_deduction_failed', default=f'Failed to deduct credits for {export_type.replace("_", " ").title()} PDF export.'), 'danger')
                 return redirect(url_for('budget.manage'))
         
-        return Response(
-            buffer.getvalue(),
+        # send_file streams from the buffer instead of copying it into a bytes object first
+        return send_file(
+            buffer,
             mimetype='application/pdf',
-            headers={'Content-Disposition': f'attachment; filename={filename}'}
+            as_attachment=True,
+            download_name=filename
         )
         
     except Exception as e:
-        logger.error(f"Error exporting {export_type} PDF: {str(e)}", exc_info=True, extra={'session_id': session.get('sid', 'unknown')})
+        logger.error(f"Error exporting {export_type} PDF: {str(e)}", exc_info=True, extra={'session_id': session_id})
         flash(trans('budget_pdf_error', default='Error generating PDF report.'), 'danger')
         return redirect(url_for('budget.manage'))
 
@@ -1328,6 +1270,7 @@ def delete_budget():
     """Delete a budget record with FC deduction."""
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
+    session_id = session['sid']
     
     db = utils.get_mongo_db()
     
@@ -1335,44 +1278,35 @@ def delete_budget():
         data = request.get_json()
         budget_id = data.get('budget_id')
         
-        if not ObjectId.is_valid(budget_id):
+        try:
+            budget_oid = ObjectId(budget_id)
+        except (InvalidId, TypeError):
             return jsonify({'success': False, 'error': trans('budget_invalid_id', default='Invalid budget ID.')}), 400
         
-        filter_criteria = {} if utils.is_admin() else {'user_id': str(current_user.id)}
-        budget = db.budgets.find_one({'_id': ObjectId(budget_id), **filter_criteria})
-        
-        if not budget:
+        is_admin_user = utils.is_admin()
+        filter_criteria = {} if is_admin_user else {'user_id': str(current_user.id)}
+        # Deletion goes ahead even if the credit deduction fails
+        deleted, _ = _delete_budget(
+            db, budget_oid, filter_criteria, current_user.id,
+            current_user.is_authenticated and not is_admin_user, session_id,
+            abort_on_credit_failure=False
+        )
+        if not deleted:
             return jsonify({'success': False, 'error': trans('budget_not_found', default='Budget not found.')}), 404
         
-        # Delete the budget
-        with db.client.start_session() as mongo_session:
-            with mongo_session.start_transaction():
-                result = db.budgets.delete_one({'_id': ObjectId(budget_id)}, session=mongo_session)
-                
-                if result.deleted_count > 0:
-                    if current_user.is_authenticated and not utils.is_admin():
-                        if not deduct_ficore_credits(db, current_user.id, 1, 'delete_budget', budget_id):
-                            logger.warning(f"Failed to deduct FC for deleting budget {budget_id} by user {current_user.id}", extra={'session_id': session.get('sid', 'unknown')})
-                            # Continue with deletion even if credit deduction fails
-                    mongo_session.commit_transaction()
-                
-                else:
-                    return jsonify({'success': False, 'error': trans('budget_delete_failed', default='Failed to delete budget.')}), 500
-            
-        utils.cache.delete_memoized(utils.get_budgets)
         try:
-            log_tool_usage(
+            queue_tool_usage(
                 tool_name='budget',
                 db=db,
                 user_id=current_user.id,
-                session_id=session.get('sid', 'no-session'),
+                session_id=session_id,
                 action='delete_budget'
             )
         except Exception as e:
-            logger.warning(f"Error logging delete activity: {str(e)}", extra={'session_id': session.get('sid', 'unknown')})
+            logger.warning(f"Error logging delete activity: {str(e)}", extra={'session_id': session_id})
         
         return jsonify({'success': True, 'message': trans('budget_deleted', default='Budget deleted successfully!')})
         
     except Exception as e:
-        logger.error(f"Error deleting budget: {str(e)}", exc_info=True, extra={'session_id': session.get('sid', 'unknown')})
+        logger.error(f"Error deleting budget: {str(e)}", exc_info=True, extra={'session_id': session_id})
         return jsonify({'success': False, 'error': trans('budget_delete_error', default='Error deleting budget.')}), 500
@@ -1,5 +1,5 @@
 from datetime import datetime
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, UpdateOne
 from bson import ObjectId
 from pymongo.errors import DuplicateKeyError, OperationFailure, PyMongoError, WriteError
 from translations import trans
@@ -7,6 +7,11 @@ from utils import get_mongo_db, logger
 from werkzeug.security import generate_password_hash
 from functools import lru_cache
 import uuid
+import queue
+import threading
+import time
+import atexit
+import logging
 
 def get_db():
     """
@@ -66,6 +71,7 @@ def initialize_app_data(app):
                                 'session_id': {'bsonType': ['string', 'null']},
                                 'list_id': {'bsonType': 'string'},
                                 'name': {'bsonType': 'string'},
+                                'name_lower': {'bsonType': 'string'},
                                 'quantity': {'bsonType': ['double', 'int'], 'minimum': 1, 'maximum': 1000},
                                 'price': {'bsonType': ['double', 'int'], 'minimum': 0, 'maximum': 1000000},
                                 'category': {'enum': ['fruits', 'vegetables', 'dairy', 'meat', 'grains', 'beverages', 'household', 'other']},
@@ -80,6 +86,11 @@ def initialize_app_data(app):
                     },
                     'indexes': [
                         {'key': [('user_id', ASCENDING), ('list_id', ASCENDING)]},
+                        {'key': [('list_id', ASCENDING), ('category', ASCENDING)]},
+                        # Item names are unique per list, case-insensitively; rows written before
+                        # name_lower existed are backfilled below, before the index is built
+                        {'key': [('list_id', ASCENDING), ('name_lower', ASCENDING)], 'unique': True,
+                         'partialFilterExpression': {'name_lower': {'$exists': True}}},
                         {'key': [('created_at', DESCENDING)]}
                     ]
                 },
@@ -105,6 +116,7 @@ def initialize_app_data(app):
                         }
                     },
                     'indexes': [
+                        {'key': [('user_id', ASCENDING), ('created_at', DESCENDING)]},
                         {'key': [('user_id', ASCENDING), ('status', ASCENDING), ('updated_at', DESCENDING)]}
                     ]
                 },
@@ -145,7 +157,8 @@ def initialize_app_data(app):
                         }
                     },
                     'indexes': [
-                        {'key': [('user_id', ASCENDING), ('created_at', DESCENDING)]}
+                        {'key': [('user_id', ASCENDING), ('created_at', DESCENDING)]},
+                        {'key': [('session_id', ASCENDING), ('created_at', DESCENDING)]}
                     ]
                 },
                 'bills': {
@@ -223,6 +236,9 @@ def initialize_app_data(app):
                 }
             }
                 
+            # Backfill name_lower on older shopping items so the unique (list_id, name_lower) index covers them
+            backfill_shopping_item_names(db)
+                
             # Initialize collections and indexes
             for collection_name, config in collection_schemas.items():
                 if collection_name in collections:
@@ -286,6 +302,58 @@ def initialize_app_data(app):
                          exc_info=True, extra={'session_id': 'no-session-id'})
             raise
 
+def backfill_shopping_item_names(db, batch_size=1000):
+    """
+    Set name_lower on shopping items written before it existed.
+    
+    The value is computed in Python with the same strip().lower() the shopping views use on
+    writes; MongoDB's $toLower only folds ASCII, so non-ASCII names would never collide with
+    newly written ones. Older items whose names differ only in case would block the unique
+    (list_id, name_lower) index, so the later ones get a numbered suffix, e.g. "Rice (2)",
+    and are logged. The backfill runs before that index is built, so once the index exists
+    every item already has name_lower and nothing is scanned.
+    
+    Args:
+        db: MongoDB database instance
+        batch_size: Number of updates sent per bulk_write
+    """
+    name_index_key = [('list_id', ASCENDING), ('name_lower', ASCENDING)]
+    if any(info['key'] == name_index_key for info in db.shopping_items.index_information().values()):
+        return
+    
+    pending = list(db.shopping_items.find({'name_lower': {'$exists': False}}, {'list_id': 1, 'name': 1}))
+    if not pending:
+        return
+    
+    seen = {
+        (item['list_id'], item['name_lower'])
+        for item in db.shopping_items.find(
+            {'list_id': {'$in': list({item.get('list_id') for item in pending})}, 'name_lower': {'$exists': True}},
+            {'list_id': 1, 'name_lower': 1}
+        )
+    }
+    updates, renamed = [], []
+    for item in pending:
+        list_id = item.get('list_id')
+        name = str(item.get('name', '')).strip()
+        fields = {'name_lower': name.lower()}
+        if (list_id, fields['name_lower']) in seen:
+            suffix = 2
+            while (list_id, f"{fields['name_lower']} ({suffix})") in seen:
+                suffix += 1
+            fields = {'name': f'{name} ({suffix})', 'name_lower': f"{fields['name_lower']} ({suffix})"}
+            renamed.append((list_id, name, fields['name']))
+        seen.add((list_id, fields['name_lower']))
+        updates.append(UpdateOne({'_id': item['_id']}, {'$set': fields}))
+    
+    if renamed:
+        logger.warning(f"Renamed {len(renamed)} shopping item(s) whose names duplicated another item's in the same list "
+                       f"(list_id, old name, new name): {renamed[:20]}",
+                       extra={'session_id': 'no-session-id'})
+    for start in range(0, len(updates), batch_size):
+        db.shopping_items.bulk_write(updates[start:start + batch_size], ordered=False)
+    logger.info(f"Backfilled name_lower on {len(updates)} shopping item(s)", extra={'session_id': 'no-session-id'})
+
 def get_budgets(db, filter_kwargs):
     """
     Retrieve budget records based on filter criteria.
@@ -322,13 +390,14 @@ def get_bills(db, filter_kwargs):
                      exc_info=True, extra={'session_id': 'no-session-id'})
         raise
 
-def create_budget(db, budget_data):
+def create_budget(db, budget_data, mongo_session=None):
     """
     Create a new budget record in the budgets collection.
     
     Args:
         db: MongoDB database instance
         budget_data: Dictionary containing budget information
+        mongo_session: Optional MongoDB session for transaction handling
     
     Returns:
         str: ID of the created budget record
@@ -337,9 +406,10 @@ def create_budget(db, budget_data):
         required_fields = ['user_id', 'income', 'fixed_expenses', 'variable_expenses', 'created_at']
         if not all(field in budget_data for field in required_fields):
             raise ValueError(trans('general_missing_budget_fields', default='Missing required budget fields'))
-        logger.debug(f"Inserting budget_data into {db.budgets.name}: {budget_data}", 
-                     extra={'session_id': budget_data.get('session_id', 'no-session-id')})
-        result = db.budgets.insert_one(budget_data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Inserting budget_data into %s: %r", db.budgets.name, budget_data,
+                         extra={'session_id': budget_data.get('session_id', 'no-session-id')})
+        result = db.budgets.insert_one(budget_data, session=mongo_session)
         logger.info(f"{trans('general_budget_created', default='Created budget record with ID')}: {result.inserted_id}", 
                     extra={'session_id': budget_data.get('session_id', 'no-session-id')})
         return str(result.inserted_id)
@@ -594,7 +664,6 @@ def to_dict_bill_reminder(record):
         'read_status': record.get('read_status', False)
     }
 
-@lru_cache(maxsize=128)
 def get_shopping_lists(db, filter_kwargs):
     """
     Retrieve shopping list records based on filter criteria.
@@ -635,7 +704,6 @@ def create_shopping_list(db, list_data):
         result = db.shopping_lists.insert_one(list_data)
         logger.info(f"{trans('general_shopping_list_created', default='Created shopping list with ID')}: {result.inserted_id}", 
                    extra={'session_id': list_data.get('session_id', 'no-session-id')})
-        get_shopping_lists.cache_clear()
         return str(result.inserted_id)
     except WriteError as e:
         logger.error(f"{trans('general_shopping_list_creation_error', default='Error creating shopping list')}: {str(e)}", 
@@ -690,7 +758,6 @@ def update_shopping_list(db, list_id, update_data):
         if result.modified_count > 0:
             logger.info(f"{trans('general_shopping_list_updated', default='Updated shopping list with ID')}: {list_id}", 
                        extra={'session_id': 'no-session-id'})
-            get_shopping_lists.cache_clear()
             return True
         logger.info(f"{trans('general_shopping_list_no_change', default='No changes made to shopping list with ID')}: {list_id}", 
                    extra={'session_id': 'no-session-id'})
@@ -800,7 +867,6 @@ def delete_shopping_list(db, list_id, user_id=None, email=None):
                 logger.info(f"Deleted shopping list ID {list_id} and {items_result.deleted_count} associated items", 
                            extra={'session_id': 'no-session-id'})
                 
-                get_shopping_lists.cache_clear()
                 return True
     except WriteError as e:
         logger.error(f"Error deleting shopping list ID {list_id}: {str(e)}", 
@@ -1190,13 +1256,123 @@ def log_tool_usage(tool_name, db, user_id=None, session_id=None, action=None):
         logger.error(f"Error logging tool usage: {str(e)}", extra={'session_id': session_id or 'no-session-id'})
         raise
 
-def create_shopping_items_bulk(db, items_data):
+# Tool usage entries are written off the request path by a single background writer
+_TOOL_USAGE_BATCH_SIZE = 100
+_TOOL_USAGE_FLUSH_INTERVAL = 1.0
+_TOOL_USAGE_SHUTDOWN_TIMEOUT = 5.0
+_TOOL_USAGE_STOP = None
+_tool_usage_queue = queue.Queue(maxsize=10000)
+_tool_usage_writer = None
+_tool_usage_writer_lock = threading.Lock()
+
+def _flush_tool_usage(db, batch):
+    try:
+        db.tool_usage.insert_many(batch, ordered=False)
+    except Exception as e:
+        logger.error(f"Error writing {len(batch)} queued tool usage entries: {str(e)}", extra={'session_id': 'no-session-id'})
+
+def _drain_tool_usage_queue():
+    """Block on the queue and flush entries in batches of up to _TOOL_USAGE_BATCH_SIZE or every _TOOL_USAGE_FLUSH_INTERVAL seconds.
+    Returns once the _TOOL_USAGE_STOP sentinel is received, after flushing the current batch."""
+    while True:
+        item = _tool_usage_queue.get()
+        if item is _TOOL_USAGE_STOP:
+            return
+        db, entry = item
+        batch = [entry]
+        stop = False
+        deadline = time.monotonic() + _TOOL_USAGE_FLUSH_INTERVAL
+        while len(batch) < _TOOL_USAGE_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _tool_usage_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _TOOL_USAGE_STOP:
+                stop = True
+                break
+            batch.append(item[1])
+        _flush_tool_usage(db, batch)
+        if stop:
+            return
+
+@atexit.register
+def _flush_pending_tool_usage():
+    """Stop the background writer and wait for it to flush what is left in the queue."""
+    if _tool_usage_writer is not None and _tool_usage_writer.is_alive():
+        try:
+            _tool_usage_queue.put(_TOOL_USAGE_STOP, timeout=_TOOL_USAGE_SHUTDOWN_TIMEOUT)
+        except queue.Full:
+            logger.error("Tool usage queue full at shutdown; pending entries dropped", extra={'session_id': 'no-session-id'})
+            return
+        _tool_usage_writer.join(timeout=_TOOL_USAGE_SHUTDOWN_TIMEOUT)
+        return
+    batch, db = [], None
+    while True:
+        try:
+            db, entry = _tool_usage_queue.get_nowait()
+        except queue.Empty:
+            break
+        batch.append(entry)
+    if batch:
+        _flush_tool_usage(db, batch)
+
+def queue_tool_usage_entry(db, log_entry):
+    """
+    Queue a prebuilt tool usage document for the background writer, storing it exactly as given.
+    Falls back to a synchronous insert if the queue is full; a failed write there is logged and dropped.
+    
+    Args:
+        db: MongoDB database instance
+        log_entry: Document to insert into tool_usage
+    """
+    global _tool_usage_writer
+    if _tool_usage_writer is None:
+        with _tool_usage_writer_lock:
+            if _tool_usage_writer is None:
+                _tool_usage_writer = threading.Thread(target=_drain_tool_usage_queue, name='tool-usage-writer', daemon=True)
+                _tool_usage_writer.start()
+    session_id = log_entry.get('session_id') or 'no-session-id'
+    try:
+        _tool_usage_queue.put_nowait((db, log_entry))
+    except queue.Full:
+        logger.warning("Tool usage queue full; logging synchronously", extra={'session_id': session_id})
+        try:
+            db.tool_usage.insert_one(log_entry)
+        except Exception as e:
+            # Usage logging is best-effort, so drop the entry rather than fail the request
+            logger.error(f"Error logging tool usage: {str(e)}", extra={'session_id': session_id})
+
+def queue_tool_usage(tool_name, db, user_id=None, session_id=None, action=None):
+    """
+    Queue a tool usage entry for the background writer instead of inserting it on the request path.
+    Falls back to a synchronous insert if the queue is full; a failed write there is logged and dropped.
+    
+    Args:
+        tool_name: Name of the tool
+        db: MongoDB database instance
+        user_id: User ID (optional)
+        session_id: Session ID (optional)
+        action: Action performed (optional)
+    """
+    queue_tool_usage_entry(db, {
+        'tool_name': tool_name,
+        'user_id': user_id,
+        'session_id': str(session_id) if session_id else 'no-session-id',
+        'action': action,
+        'timestamp': datetime.utcnow()
+    })
+
+def create_shopping_items_bulk(db, items_data, mongo_session=None):
     """
     Create multiple shopping items in bulk.
     
     Args:
         db: MongoDB database instance
         items_data: List of dictionaries containing shopping item information
+        mongo_session: Optional MongoDB session for transaction handling
     
     Returns:
         list: List of IDs of the created shopping items
@@ -1214,7 +1390,7 @@ def create_shopping_items_bulk(db, items_data):
             if 'session_id' in item_data and item_data['session_id']:
                 item_data['session_id'] = str(item_data['session_id'])  # Ensure session_id is a string if provided
         
-        result = db.shopping_items.insert_many(items_data)
+        result = db.shopping_items.insert_many(items_data, ordered=False, session=mongo_session)
         logger.info(f"{trans('general_shopping_items_created_bulk', default='Created shopping items in bulk')}: {len(result.inserted_ids)}", 
                    extra={'session_id': items_data[0].get('session_id', 'no-session-id') if items_data else 'no-session-id'})
         return [str(item_id) for item_id in result.inserted_ids]
@@ -1274,7 +1450,6 @@ def update_shopping_list(db, list_id, update_data):
         if result.modified_count > 0:
             logger.info(f"{trans('general_shopping_list_updated', default='Updated shopping list with ID')}: {list_id}", 
                        extra={'session_id': 'no-session-id'})
-            get_shopping_lists.cache_clear()  # Clear cache after update
             return True
         logger.info(f"{trans('general_shopping_list_no_change', default='No changes made to shopping list with ID')}: {list_id}", 
                    extra={'session_id': 'no-session-id'})
@@ -1309,7 +1484,6 @@ def delete_shopping_list(db, list_id):
         if result.deleted_count > 0:
             logger.info(f"{trans('general_shopping_list_deleted', default='Deleted shopping list with ID')}: {list_id}", 
                        extra={'session_id': 'no-session-id'})
-            get_shopping_lists.cache_clear()  # Clear cache after deletion
             return True
         logger.info(f"{trans('general_shopping_list_not_found_delete', default='Shopping list not found for deletion with ID')}: {list_id}", 
                    extra={'session_id': 'no-session-id'})
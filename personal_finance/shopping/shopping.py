@@ -1,24 +1,26 @@
-from flask import Blueprint, request, session, redirect, url_for, render_template, flash, current_app, jsonify, Response
+from flask import Blueprint, request, session, redirect, url_for, render_template, flash, jsonify, send_file, make_response
 from flask_wtf import FlaskForm
 from flask_wtf.csrf import CSRFProtect, CSRFError
 from wtforms import StringField, FloatField, IntegerField, SelectField, SubmitField
 from wtforms.validators import DataRequired, NumberRange, ValidationError, Email
-from flask_login import current_user, login_required
+from flask_login import current_user
 from datetime import datetime
 from helpers.branding_helpers import draw_ficore_pdf_header
 from bson import ObjectId
-from pymongo import errors
+from pymongo import errors, ReturnDocument, UpdateOne, DeleteOne
+from pymongo.write_concern import WriteConcern
 from utils import get_mongo_db, requires_role, logger, check_ficore_credit_balance, is_admin, format_date, format_currency
-from translations import trans
+from translations import trans, trans_many
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import inch
 from io import BytesIO
-from contextlib import nullcontext
 import uuid
-from models import log_tool_usage, get_shopping_lists, create_shopping_list, create_shopping_item, create_shopping_items_bulk
-import json
+from models import queue_tool_usage, create_shopping_list, create_shopping_item, create_shopping_items_bulk
+import hashlib
+from collections import defaultdict
+import re
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
 
 shopping_bp = Blueprint(
     'shopping',
@@ -29,38 +31,218 @@ shopping_bp = Blueprint(
 
 csrf = CSRFProtect()
 
+# Keywords that place an item in a category; categories are checked in this order
+_CATEGORY_KEYWORDS = {
+    'fruits': ['apple', 'banana', 'orange', 'mango', 'pineapple', 'berry', 'grape'],
+    'vegetables': ['carrot', 'potato', 'tomato', 'onion', 'spinach', 'lettuce'],
+    'dairy': ['milk', 'cheese', 'yogurt', 'butter', 'cream'],
+    'meat': ['chicken', 'beef', 'pork', 'fish', 'egg'],
+    'grains': ['rice', 'bread', 'pasta', 'flour', 'cereal'],
+    'beverages': ['juice', 'soda', 'water', 'tea', 'coffee'],
+    'household': ['detergent', 'soap', 'tissue', 'paper towel']
+}
+# One compiled alternation per category, so each category is a single scan of the name
+_CATEGORY_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+)
+
 def auto_categorize_item(item_name):
-    item_name = item_name.lower().strip()
-    categories = {
-        'fruits': ['apple', 'banana', 'orange', 'mango', 'pineapple', 'berry', 'grape'],
-        'vegetables': ['carrot', 'potato', 'tomato', 'onion', 'spinach', 'lettuce'],
-        'dairy': ['milk', 'cheese', 'yogurt', 'butter', 'cream'],
-        'meat': ['chicken', 'beef', 'pork', 'fish', 'egg'],
-        'grains': ['rice', 'bread', 'pasta', 'flour', 'cereal'],
-        'beverages': ['juice', 'soda', 'water', 'tea', 'coffee'],
-        'household': ['detergent', 'soap', 'tissue', 'paper towel'],
-        'other': []
-    }
-    for category, keywords in categories.items():
-        if any(keyword in item_name for keyword in keywords):
+    return _categorize_normalized_name(item_name.lower().strip())
+
+# Shoppers re-add the same staples across lists, so results are cached by normalized name
+# ('Rice', 'rice ' and 'RICE' share one entry)
+@lru_cache(maxsize=4096)
+def _categorize_normalized_name(item_name):
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(item_name):
             return category
     return 'other'
 
+# Item categories in display order, with their label translation keys and defaults
+_CATEGORY_LABEL_KEYS = (
+    ('fruits', 'shopping_category_fruits', 'Fruits'),
+    ('vegetables', 'shopping_category_vegetables', 'Vegetables'),
+    ('dairy', 'shopping_category_dairy', 'Dairy'),
+    ('meat', 'shopping_category_meat', 'Meat'),
+    ('grains', 'shopping_category_grains', 'Grains'),
+    ('beverages', 'shopping_category_beverages', 'Beverages'),
+    ('household', 'shopping_category_household', 'Household'),
+    ('other', 'shopping_category_other', 'Other')
+)
+
+@lru_cache(maxsize=16)
+def _category_labels(lang):
+    """(category, translated label) pairs in display order, per language."""
+    return tuple(
+        (category, trans(label_key, lang, default=label_default))
+        for category, label_key, label_default in _CATEGORY_LABEL_KEYS
+    )
+
+# Fields read by _item_view; timestamps and ownership fields stay on the server
+_ITEM_VIEW_PROJECTION = {
+    'name': 1, 'quantity': 1, 'price': 1, 'unit': 1, 'category': 1, 'status': 1, 'store': 1, 'frequency': 1
+}
+
+# List fields shown by new(), dashboard() and manage(), and how many of the most recent lists new() loads
+_LIST_VIEW_PROJECTION = {
+    'name': 1, 'budget': 1, 'total_spent': 1, 'status': 1, 'created_at': 1, 'collaborators': 1
+}
+_NEW_VIEW_LIST_LIMIT = 50
+
+@lru_cache(maxsize=16)
+def _shopping_tips(lang):
+    """Shopping tips shown beside lists, per language."""
+    return (
+        trans('shopping_tip_plan_ahead', lang, default='Plan your shopping list ahead to avoid impulse buys.'),
+        trans('shopping_tip_compare_prices', lang, default='Compare prices across stores to save money.'),
+        trans('shopping_tip_bulk_buy', lang, default='Buy non-perishable items in bulk to reduce costs.'),
+        trans('shopping_tip_check_sales', lang, default='Check for sales or discounts before shopping.')
+    )
+
+# A hex ObjectId string; matching it first means each id is only decoded once, by ObjectId()
+_OBJECT_ID_PATTERN = re.compile(r'[0-9a-fA-F]{24}')
+
+def _to_object_id(value):
+    """Return value as an ObjectId, or None if it is not a 24-digit hex string."""
+    if isinstance(value, str) and _OBJECT_ID_PATTERN.fullmatch(value):
+        return ObjectId(value)
+    return None
+
+def _item_view(item):
+    """Adapt a shopping item document in place into the dict used by the templates.
+
+    The shopping_items validator requires name, quantity, price, unit, category and
+    status with typed values, so only the id and price are renamed and the optional
+    store and frequency get their defaults; no second dict is built per item.
+    """
+    item['id'] = str(item.pop('_id'))
+    item['price_raw'] = item.pop('price')
+    item.setdefault('store', 'Unknown')
+    item.setdefault('frequency', 7)
+    return item
+
+def _list_item_views(db, list_id):
+    """Fetch one list's items as template dicts."""
+    return [_item_view(item) for item in db.shopping_items.find({'list_id': list_id}, _ITEM_VIEW_PROJECTION)]
+
+def _fetch_list_with_items(db, list_oid, filter_criteria, item_projection, list_projection=None):
+    """
+    Load a list the caller may see and its items in one aggregation.
+    
+    The ownership match runs first, so the items sub-pipeline only runs for a list that passed it.
+    The bought count and the items' combined cost are worked out by the server over the joined
+    items, so views do not make another pass over them.
+    
+    Returns:
+        dict: The list document with its items under 'items' and 'bought_count' and 'items_cost'
+            added, or None if no such list is visible
+    """
+    list_id = str(list_oid)
+    pipeline = [{'$match': {'_id': list_oid, **filter_criteria}}]
+    if list_projection is not None:
+        pipeline.append({'$project': list_projection})
+    pipeline.append({'$lookup': {
+        'from': 'shopping_items',
+        'pipeline': [{'$match': {'list_id': list_id}}, {'$project': item_projection}],
+        'as': 'items'
+    }})
+    pipeline.append({'$addFields': {
+        'bought_count': {'$size': {'$filter': {'input': '$items', 'cond': {'$eq': ['$$this.status', 'bought']}}}},
+        'items_cost': {'$sum': {'$map': {'input': '$items', 'in': {'$multiply': ['$$this.price', '$$this.quantity']}}}}
+    }})
+    return next(db.shopping_lists.aggregate(pipeline), None)
+
+def _items_by_list(db, lists, projection=None):
+    """Fetch the items of several lists with one $in query, grouped by list id."""
+    items_by_list = defaultdict(list)
+    list_ids = [str(lst['_id']) for lst in lists]
+    if list_ids:
+        if projection is not None:
+            projection = {**projection, 'list_id': 1}
+        for item in db.shopping_items.find({'list_id': {'$in': list_ids}}, projection):
+            items_by_list[item['list_id']].append(item)
+    return items_by_list
+
+def _list_item_stats(db, lists):
+    """Item count, bought count and total cost per list, computed by MongoDB in one aggregation."""
+    list_ids = [str(lst['_id']) for lst in lists]
+    if not list_ids:
+        return {}
+    pipeline = [
+        {'$match': {'list_id': {'$in': list_ids}}},
+        {'$group': {
+            '_id': '$list_id',
+            'items_count': {'$sum': 1},
+            'bought_items': {'$sum': {'$cond': [{'$eq': ['$status', 'bought']}, 1, 0]}},
+            'total': {'$sum': {'$multiply': [{'$ifNull': ['$price', 0]}, {'$ifNull': ['$quantity', 1]}]}}
+        }}
+    ]
+    return {
+        row['_id']: (row['items_count'], row['bought_items'], row['total'])
+        for row in db.shopping_items.aggregate(pipeline)
+    }
+
+def _item_cost(item):
+    """price * quantity for a stored item document."""
+    return item.get('price', 0.0) * item.get('quantity', 1)
+
+def _category_totals(db, list_id):
+    """
+    Sum price * quantity per category for a list's items on the server.
+    
+    list_id may also be a query operator such as {'$in': list_ids} to total several lists.
+    """
+    pipeline = [
+        {'$match': {'list_id': list_id}},
+        {'$group': {
+            '_id': {'$ifNull': ['$category', 'other']},
+            'total': {'$sum': {'$multiply': [{'$ifNull': ['$price', 0]}, {'$ifNull': ['$quantity', 1]}]}}
+        }}
+    ]
+    return {row['_id']: row['total'] for row in db.shopping_items.aggregate(pipeline)}
+
+# x position and heading of each column in the PDF item table
+_PDF_ITEM_COLUMNS = ((50, 'Item'), (200, 'Qty'), (250, 'Price'), (300, 'Unit'), (350, 'Category'), (450, 'Status'))
+_PDF_ITEM_COLUMN_X = tuple(float(x) for x, _ in _PDF_ITEM_COLUMNS)
+
+def _draw_pdf_item_header(p, y):
+    """Draw the PDF item table's column headings at y and leave the row font set."""
+    p.setFont("Helvetica-Bold", 10)
+    for x, heading in _PDF_ITEM_COLUMNS:
+        p.drawString(x, y, heading)
+    p.setFont("Helvetica", 9)
+
+# Shared worker pool for view queries that can run alongside the request's other Mongo calls
+_VIEW_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='shopping-view')
+
+# Thousands separators, spaces and currency symbols dropped from amounts in a single pass
+_CURRENCY_STRIP = str.maketrans('', '', ', ₦$')
+
+def _parse_amount(value):
+    """Parse an amount to a float rounded to 2 places; raises ValueError or TypeError if it isn't one."""
+    if isinstance(value, (int, float)):
+        return round(float(value), 2)
+    return round(float(str(value).translate(_CURRENCY_STRIP)), 2)
+
 def clean_currency(value):
     """Clean and convert currency input to float, handling empty or invalid inputs."""
     if value is None or value == '':
         logger.debug("clean_currency received empty or None input, returning None")
         return None
     try:
-        cleaned_value = str(value).replace(',', '').replace(' ', '')
-        return round(float(cleaned_value), 2)
+        return _parse_amount(value)
     except (ValueError, TypeError) as e:
         logger.error(f"clean_currency failed with input {value}: {str(e)}")
         raise ValidationError(trans('shopping_price_invalid', default='Invalid price format'))
 
-def deduct_ficore_credits(db, user_id, amount, action, item_id=None, mongo_session=None):
+# Item add/edit/delete/toggle transactions commit on the primary's acknowledgement; list deletes
+# and credit writes keep the deployment's default write concern
+_ITEM_TXN_WRITE_CONCERN = WriteConcern(w=1)
+
+def deduct_ficore_credits(db, user_id, amount, action, item_id=None):
     """
-    Deduct Ficore Credits from user balance with enhanced error logging and transaction handling.
+    Deduct Ficore Credits from user balance with a balance-guarded atomic update.
     
     Args:
         db: MongoDB database instance
@@ -68,7 +250,6 @@ def deduct_ficore_credits(db, user_id, amount, action, item_id=None, mongo_sessi
         amount: Amount to deduct (1 or 2)
         action: Action description for logging
         item_id: Optional item ID for reference
-        mongo_session: Optional MongoDB session for transaction
     
     Returns:
         bool: True if successful, False otherwise
@@ -87,140 +268,196 @@ def deduct_ficore_credits(db, user_id, amount, action, item_id=None, mongo_sessi
                         extra={'session_id': session_id})
             return False
         
-        user = db.users.find_one({'_id': user_id}, session=mongo_session)
-        if not user:
-            logger.error(f"User {user_id} not found in database for credit deduction, action: {action}. Check if user_id matches _id field type.",
-                        extra={'session_id': session_id, 'user_id': user_id})
-            return False
-        
-        current_balance = float(user.get('ficore_credit_balance', 0))
-        logger.debug(f"Current balance for user {user_id}: {current_balance}, attempting to deduct: {amount}",
-                    extra={'session_id': session_id, 'user_id': user_id})
+        # One balance-guarded update both checks and deducts; the guard in the filter stops a
+        # concurrent deduction from overdrawing, so no transaction is started here. The log
+        # inserts below are append-only records of a deduction that has already happened.
+        updated_user = db.users.find_one_and_update(
+            {'_id': user_id, 'ficore_credit_balance': {'$gte': amount}},
+            {'$inc': {'ficore_credit_balance': -amount}},
+            projection={'ficore_credit_balance': 1},
+            return_document=ReturnDocument.AFTER
+        )
         
-        if current_balance < amount:
-            logger.warning(f"Insufficient credits for user {user_id}: required {amount}, available {current_balance}, action: {action}",
-                         extra={'session_id': session_id, 'user_id': user_id})
+        if updated_user is None:
+            # Only the failure path pays for a second lookup, to report why nothing was deducted
+            if db.users.count_documents({'_id': user_id}, limit=1) == 0:
+                logger.error(f"User {user_id} not found in database for credit deduction, action: {action}. Check if user_id matches _id field type.",
+                            extra={'session_id': session_id, 'user_id': user_id})
+            else:
+                logger.warning(f"Insufficient credits for user {user_id}: required {amount}, action: {action}",
+                             extra={'session_id': session_id, 'user_id': user_id})
             return False
         
-        session_to_use = mongo_session if mongo_session else db.client.start_session()
-        owns_session = not mongo_session
-        max_retries = 3
+        new_balance = float(updated_user.get('ficore_credit_balance', 0))
+        previous_balance = new_balance + amount
+        now = datetime.utcnow()
+        item_id_str = str(item_id) if item_id else None
         
-        for attempt in range(max_retries):
-            try:
-                with session_to_use.start_transaction() if not mongo_session else nullcontext():
-                    result = db.users.update_one(
-                        {'_id': user_id},
-                        [{'$set': {'ficore_credit_balance': {'$toDouble': {'$subtract': ['$ficore_credit_balance', amount]}}}}],
-                        session=session_to_use
-                    )
-                    
-                    if result.modified_count == 0:
-                        error_msg = f"Failed to deduct {amount} credits for user {user_id}, action: {action}: No documents modified. User may not exist or balance unchanged."
-                        logger.error(error_msg, extra={'session_id': session_id, 'user_id': user_id})
-                        
-                        db.ficore_credit_transactions.insert_one({
-                            '_id': ObjectId(),
-                            'user_id': user_id,
-                            'action': action,
-                            'amount': float(-amount),
-                            'item_id': str(item_id) if item_id else None,
-                            'timestamp': datetime.utcnow(),
-                            'session_id': session_id,
-                            'status': 'failed'
-                        }, session=session_to_use)
-                        
-                        raise ValueError(error_msg)
-                    
-                    transaction = {
-                        '_id': ObjectId(),
-                        'user_id': user_id,
-                        'action': action,
-                        'amount': float(-amount),
-                        'item_id': str(item_id) if item_id else None,
-                        'timestamp': datetime.utcnow(),
-                        'session_id': session_id,
-                        'status': 'completed'
-                    }
-                    db.ficore_credit_transactions.insert_one(transaction, session=session_to_use)
-                    
-                    db.audit_logs.insert_one({
-                        'admin_id': 'system',
-                        'action': f'deduct_ficore_credits_{action}',
-                        'details': {
-                            'user_id': user_id, 
-                            'amount': amount, 
-                            'item_id': str(item_id) if item_id else None,
-                            'previous_balance': current_balance,
-                            'new_balance': current_balance - amount
-                        },
-                        'timestamp': datetime.utcnow()
-                    }, session=session_to_use)
-                    
-                    if owns_session:
-                        session_to_use.commit_transaction()
-                    
-                    logger.info(f"Successfully deducted {amount} Ficore Credits for {action} by user {user_id}. New balance: {current_balance - amount}",
-                               extra={'session_id': session_id, 'user_id': user_id})
-                    return True
-                    
-            except errors.OperationFailure as e:
-                error_details = e.details if hasattr(e, 'details') else {}
-                
-                if "TransientTransactionError" in error_details.get("errorLabels", []):
-                    if attempt < max_retries - 1:
-                        logger.warning(f"Transient transaction error for user {user_id}, action: {action}, attempt {attempt + 1}/{max_retries}. Retrying...",
-                                     extra={'session_id': session_id, 'user_id': user_id})
-                        continue
-                
-                logger.error(f"MongoDB operation failed for user {user_id}, action: {action}: {str(e)}. Error details: {error_details}",
-                            exc_info=True, extra={'session_id': session_id, 'user_id': user_id})
-                
-                if owns_session:
-                    try:
-                        session_to_use.abort_transaction()
-                    except Exception as abort_error:
-                        logger.error(f"Failed to abort transaction: {abort_error}", extra={'session_id': session_id, 'user_id': user_id})
-                return False
-                
-            except (ValueError, errors.PyMongoError) as e:
-                logger.error(f"Database error during credit deduction for user {user_id}, action: {action}: {str(e)}",
-                            exc_info=True, extra={'session_id': session_id, 'user_id': user_id})
-                
-                if owns_session:
-                    try:
-                        session_to_use.abort_transaction()
-                    except Exception as abort_error:
-                        logger.error(f"Failed to abort transaction: {abort_error}", extra={'session_id': session_id, 'user_id': user_id})
-                return False
-                
-            except Exception as e:
-                logger.error(f"Unexpected error during transaction for user {user_id}, action: {action}: {str(e)}",
-                            exc_info=True, extra={'session_id': session_id, 'user_id': user_id})
-                
-                if owns_session:
-                    try:
-                        session_to_use.end_session()
-                    except Exception as end_error:
-                        logger.error(f"Failed to end session: {end_error}", extra={'session_id': session_id, 'user_id': user_id})
-                return False
-                
-            finally:
-                if owns_session:
-                    try:
-                        session_to_use.end_session()
-                    except Exception as end_error:
-                        logger.error(f"Failed to end session: {end_error}", extra={'session_id': session_id, 'user_id': user_id})
+        try:
+            db.ficore_credit_transactions.insert_one({
+                '_id': ObjectId(),
+                'user_id': user_id,
+                'action': action,
+                'amount': float(-amount),
+                'item_id': item_id_str,
+                'timestamp': now,
+                'session_id': session_id,
+                'status': 'completed'
+            })
+            
+            db.audit_logs.insert_one({
+                'admin_id': 'system',
+                'action': f'deduct_ficore_credits_{action}',
+                'details': {
+                    'user_id': user_id, 
+                    'amount': amount, 
+                    'item_id': item_id_str,
+                    'previous_balance': previous_balance,
+                    'new_balance': new_balance
+                },
+                'timestamp': now
+            })
+        except errors.PyMongoError as e:
+            logger.error(f"Deducted {amount} credits for user {user_id}, action: {action}, but failed to record it: {str(e)}",
+                        exc_info=True, extra={'session_id': session_id, 'user_id': user_id})
         
-        logger.error(f"All {max_retries} transaction attempts failed for user {user_id}, action: {action}",
-                    extra={'session_id': session_id, 'user_id': user_id})
-        return False
+        logger.info(f"Successfully deducted {amount} Ficore Credits for {action} by user {user_id}. New balance: {new_balance}",
+                   extra={'session_id': session_id, 'user_id': user_id})
+        return True
         
     except Exception as e:
         logger.error(f"Unexpected error in deduct_ficore_credits for user {user_id}, action: {action}: {str(e)}",
                     exc_info=True, extra={'session_id': session_id, 'user_id': user_id})
         return False
 
+# Item fields accepted per add_items row, and the most rows taken from one post
+_ITEM_ROW_FIELDS = ('name', 'quantity', 'price', 'unit', 'category', 'status', 'store', 'frequency')
+_MAX_ITEMS_PER_POST = 50
+
+_NUMBERED_ROW_NAME_KEY = re.compile(r'new_item_name_(\d+)')
+
+def _numbered_item_rows(form):
+    """Yield add_items rows posted as new_item_<field>_<n> fields; rows without a name are skipped."""
+    # Row numbers are read off the posted name keys in one scan rather than probed one by one
+    row_numbers = sorted(
+        int(match.group(1)) for match in map(_NUMBERED_ROW_NAME_KEY.fullmatch, form.keys()) if match
+    )
+    for i in row_numbers[:_MAX_ITEMS_PER_POST]:
+        if form[f'new_item_name_{i}'].strip():
+            yield {
+                field: form[f'new_item_{field}_{i}']
+                for field in _ITEM_ROW_FIELDS
+                if f'new_item_{field}_{i}' in form
+            }
+
+def _retry_transient(times=3):
+    """Re-run a function that owns its transaction when MongoDB labels the failure TransientTransactionError."""
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            for attempt in range(times):
+                try:
+                    return f(*args, **kwargs)
+                except errors.PyMongoError as e:
+                    if attempt == times - 1 or not e.has_error_label('TransientTransactionError'):
+                        raise
+                    logger.warning(f"Transient transaction error in {f.__name__}, attempt {attempt + 1}/{times}. Retrying...",
+                                 extra={'session_id': session.get('sid', 'no-session-id')})
+        return wrapper
+    return decorator
+
+def _bump_list_total(db, list_oid, delta, now, mongo_session):
+    """
+    Add delta to a list's total_spent without re-reading its items.
+    
+    Returns:
+        float: The list's new total_spent
+    """
+    updated_list = db.shopping_lists.find_one_and_update(
+        {'_id': list_oid},
+        {'$inc': {'total_spent': delta}, '$set': {'updated_at': now}},
+        projection={'total_spent': 1},
+        return_document=ReturnDocument.AFTER,
+        session=mongo_session
+    )
+    return updated_list['total_spent']
+
+@_retry_transient()
+def _add_items_to_list(db, list_oid, item_docs, now):
+    """
+    Insert items and add their combined cost to the list's total_spent in one transaction.
+    
+    Returns:
+        float: The list's new total_spent
+    """
+    with db.client.start_session() as mongo_session:
+        with mongo_session.start_transaction(write_concern=_ITEM_TXN_WRITE_CONCERN):
+            create_shopping_items_bulk(db, item_docs, mongo_session=mongo_session)
+            return _bump_list_total(
+                db, list_oid, sum(doc['price'] * doc['quantity'] for doc in item_docs), now, mongo_session
+            )
+
+def _bulk_item_changes(data):
+    """
+    Validate the fields of one bulk_items update and return them as a $set document.
+    
+    Raises:
+        ValueError, TypeError: If a field has the wrong type or is out of range
+    """
+    changes = {}
+    if 'name' in data:
+        name = str(data['name']).strip()
+        if not name:
+            raise ValueError('Item name is required')
+        changes['name'] = name
+        changes['name_lower'] = name.lower()
+    if 'quantity' in data:
+        changes['quantity'] = int(data['quantity'])
+        if changes['quantity'] < 1 or changes['quantity'] > 1000:
+            raise ValueError('Invalid input range')
+    if 'price' in data:
+        changes['price'] = _parse_amount(data['price'])
+        if changes['price'] < 0 or changes['price'] > 1000000:
+            raise ValueError('Invalid input range')
+    if 'frequency' in data:
+        changes['frequency'] = int(data['frequency'])
+        if changes['frequency'] < 1 or changes['frequency'] > 365:
+            raise ValueError('Invalid input range')
+    # Choice fields are checked against the same values the item forms offer
+    for field, allowed in (('unit', _UNIT_VALUES), ('category', _CATEGORY_VALUES), ('status', _STATUS_VALUES)):
+        if field in data:
+            if data[field] not in allowed:
+                raise ValueError(f'Invalid {field}')
+            changes[field] = data[field]
+    if 'store' in data:
+        changes['store'] = str(data['store']).strip()
+    return changes
+
+@_retry_transient()
+def _apply_item_bulk(db, list_oid, operations, now):
+    """
+    Run a list's item updates and deletions as one unordered bulk write and recompute its
+    total_spent from the items in the same transaction.
+    
+    Returns:
+        tuple: The BulkWriteResult and the list's new total_spent
+    """
+    list_id = str(list_oid)
+    with db.client.start_session() as mongo_session:
+        with mongo_session.start_transaction(write_concern=_ITEM_TXN_WRITE_CONCERN):
+            result = db.shopping_items.bulk_write(operations, ordered=False, session=mongo_session)
+            totals = next(db.shopping_items.aggregate([
+                {'$match': {'list_id': list_id}},
+                {'$group': {'_id': None, 'total': {'$sum': {'$multiply': ['$price', '$quantity']}}}}
+            ], session=mongo_session), None)
+            total_spent = totals['total'] if totals else 0.0
+            db.shopping_lists.update_one(
+                {'_id': list_oid},
+                {'$set': {'total_spent': total_spent, 'updated_at': now}},
+                session=mongo_session
+            )
+            return result, total_spent
+
 def custom_login_required(f):
     from functools import wraps
     @wraps(f)
@@ -230,6 +467,63 @@ def custom_login_required(f):
         return redirect(url_for('users.login', next=request.url))
     return decorated_function
 
+# Form field labels per language; translations are static for the life of the process.
+# Keys are in the order the labels are unpacked onto the form fields.
+_LIST_FORM_LABEL_DEFAULTS = {
+    'shopping_list_name': 'List Name',
+    'shopping_budget': 'Budget',
+    'shopping_submit': 'Create List'
+}
+_ITEMS_FORM_LABEL_DEFAULTS = {
+    'shopping_item_name': 'Item Name',
+    'shopping_quantity': 'Quantity',
+    'shopping_price': 'Price',
+    'shopping_unit': 'Unit',
+    'shopping_store': 'Store',
+    'shopping_category': 'Category',
+    'shopping_status': 'Status',
+    'shopping_frequency': 'Frequency (days)',
+    'shopping_item_submit': 'Add Item'
+}
+_LIST_FORM_LABEL_CACHE = {}
+_ITEMS_FORM_LABEL_CACHE = {}
+
+# Unit and status choices as (value, translation key, default), in display order
+_UNIT_CHOICE_KEYS = (
+    ('piece', 'shopping_unit_piece', 'Piece'),
+    ('carton', 'shopping_unit_carton', 'Carton'),
+    ('kg', 'shopping_unit_kg', 'Kilogram'),
+    ('liter', 'shopping_unit_liter', 'Liter'),
+    ('pack', 'shopping_unit_pack', 'Pack'),
+    ('other', 'shopping_unit_other', 'Other')
+)
+_STATUS_CHOICE_KEYS = (
+    ('to_buy', 'shopping_status_to_buy', 'To Buy'),
+    ('bought', 'shopping_status_bought', 'Bought')
+)
+# Values add_items rows may carry, checked before anything is written
+_UNIT_VALUES = frozenset(value for value, _, _ in _UNIT_CHOICE_KEYS)
+_CATEGORY_VALUES = frozenset(value for value, _, _ in _CATEGORY_LABEL_KEYS)
+_STATUS_VALUES = frozenset(value for value, _, _ in _STATUS_CHOICE_KEYS)
+
+@lru_cache(maxsize=16)
+def _item_form_choices(lang):
+    """Unit, category and status choices for ShoppingItemsForm, per language."""
+    return (
+        [(value, trans(key, lang, default=default)) for value, key, default in _UNIT_CHOICE_KEYS],
+        list(_category_labels(lang)),
+        [(value, trans(key, lang, default=default)) for value, key, default in _STATUS_CHOICE_KEYS]
+    )
+
+def _form_labels(defaults, cache, lang):
+    """Translated labels for a form's fields, looked up once per language."""
+    labels = cache.get(lang)
+    if labels is None:
+        translated = trans_many(defaults, lang)
+        labels = tuple(translated[key] or default for key, default in defaults.items())
+        cache[lang] = labels
+    return labels
+
 class ShoppingListForm(FlaskForm):
     name = StringField(
         trans('shopping_list_name', default='List Name'),
@@ -247,24 +541,26 @@ class ShoppingListForm(FlaskForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        lang = session.get('lang', 'en')
-        self.name.label.text = trans('shopping_list_name', lang) or 'List Name'
-        self.budget.label.text = trans('shopping_budget', lang) or 'Budget'
-        self.submit.label.text = trans('shopping_submit', lang) or 'Create List'
+        (
+            self.name.label.text,
+            self.budget.label.text,
+            self.submit.label.text
+        ) = _form_labels(_LIST_FORM_LABEL_DEFAULTS, _LIST_FORM_LABEL_CACHE, session.get('lang', 'en'))
 
     def validate_budget(self, budget):
         if budget.data is None or budget.data == '':
             raise ValidationError(trans('shopping_budget_required', default='Budget is required'))
         try:
-            cleaned_value = str(budget.data).replace(',', '').replace(' ', '')
-            budget.data = round(float(cleaned_value), 2)
-            if budget.data < 0.01:
-                raise ValidationError(trans('shopping_budget_min', default='Budget must be at least 0.01'))
-            if budget.data > 10000000000:
-                raise ValidationError(trans('shopping_budget_max', default='Budget must be between 0.01 and 10 billion'))
+            budget.data = _parse_amount(budget.data)
         except (ValueError, TypeError):
             logger.error(f"Budget validation failed: {budget.data}", extra={'session_id': session.get('sid', 'no-session-id')})
             raise ValidationError(trans('shopping_budget_invalid', default='Invalid budget format'))
+        # Range checks sit outside the try: ValidationError subclasses ValueError and would be
+        # reported as an invalid format otherwise
+        if budget.data < 0.01:
+            raise ValidationError(trans('shopping_budget_min', default='Budget must be at least 0.01'))
+        if budget.data > 10000000000:
+            raise ValidationError(trans('shopping_budget_max', default='Budget must be between 0.01 and 10 billion'))
 
 class ShoppingItemsForm(FlaskForm):
     name = StringField(
@@ -335,21 +631,24 @@ class ShoppingItemsForm(FlaskForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        logger.debug(f"Initializing ShoppingItemsForm with kwargs: {kwargs}", extra={'session_id': session.get('sid', 'no-session-id')})
+        logger.debug("Initializing ShoppingItemsForm with kwargs: %s", kwargs, extra={'session_id': session.get('sid', 'no-session-id')})
         lang = session.get('lang', 'en')
-        self.name.label.text = trans('shopping_item_name', lang) or 'Item Name'
-        self.quantity.label.text = trans('shopping_quantity', lang) or 'Quantity'
-        self.price.label.text = trans('shopping_price', lang) or 'Price'
-        self.unit.label.text = trans('shopping_unit', lang) or 'Unit'
-        self.store.label.text = trans('shopping_store', lang) or 'Store'
-        self.category.label.text = trans('shopping_category', lang) or 'Category'
-        self.status.label.text = trans('shopping_status', lang) or 'Status'
-        self.frequency.label.text = trans('shopping_frequency', lang) or 'Frequency (days)'
-        self.submit.label.text = trans('shopping_item_submit', lang) or 'Add Item'
+        (
+            self.name.label.text,
+            self.quantity.label.text,
+            self.price.label.text,
+            self.unit.label.text,
+            self.store.label.text,
+            self.category.label.text,
+            self.status.label.text,
+            self.frequency.label.text,
+            self.submit.label.text
+        ) = _form_labels(_ITEMS_FORM_LABEL_DEFAULTS, _ITEMS_FORM_LABEL_CACHE, lang)
+        self.unit.choices, self.category.choices, self.status.choices = _item_form_choices(lang)
 
     def validate_price(self, price):
         if price.data is None:
-            logger.debug(f"Price validation failed: Price is None", extra={'session_id': session.get('sid', 'no-session-id')})
+            logger.debug("Price validation failed: Price is None", extra={'session_id': session.get('sid', 'no-session-id')})
             raise ValidationError(trans('shopping_price_required', default='Price is required'))
         try:
             price.data = float(price.data)
@@ -362,9 +661,29 @@ class ShoppingItemsForm(FlaskForm):
     def validate_status(self, status):
         valid_choices = ['to_buy', 'bought']
         if status.data not in valid_choices:
-            logger.debug(f"Invalid status value submitted: {status.data}", extra={'session_id': session.get('sid', 'no-session-id')})
+            logger.debug("Invalid status value submitted: %s", status.data, extra={'session_id': session.get('sid', 'no-session-id')})
             raise ValidationError(trans('shopping_status_invalid', default='Not a valid status choice.'))
 
+def _item_fields_from_form(item_form):
+    """
+    Build the stored item fields from a validated ShoppingItemsForm.
+    
+    IntegerField already yields ints, and price is parsed by clean_currency and validate_price,
+    so the values are taken as the form produced them.
+    """
+    name = item_form.name.data.strip()
+    return {
+        'name': name,
+        'name_lower': name.lower(),
+        'quantity': item_form.quantity.data,
+        'price': item_form.price.data,
+        'unit': item_form.unit.data,
+        'category': item_form.category.data or auto_categorize_item(name),
+        'status': item_form.status.data or 'to_buy',
+        'store': item_form.store.data.strip(),
+        'frequency': item_form.frequency.data
+    }
+
 class ShareListForm(FlaskForm):
     email = StringField(
         trans('shopping_collaborator_email', default='Collaborator Email'),
@@ -394,7 +713,7 @@ def index():
 def new():
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
-        logger.debug(f"New session created with sid: {session['sid']}")
+        logger.debug("New session created with sid: %s", session['sid'])
     session.permanent = True
     session.modified = True
 
@@ -409,50 +728,60 @@ def new():
     if active_tab not in valid_tabs:
         active_tab = 'create-list'
 
-    filter_criteria = {} if is_admin() else {'user_id': str(current_user.id)}
-    lists = {str(lst['_id']): lst for lst in db.shopping_lists.find(filter_criteria).sort('created_at', -1)}
+    # Resolve the current user once; each current_user access goes through Flask-Login's proxy
+    user_id = str(current_user.id)
+    filter_criteria = {} if is_admin() else {'user_id': user_id}
+    requested_list_id = request.args.get('list_id') or session.get('selected_list_id')
+    # Category totals only need the list id, so a requested list's totals load on a worker while the lists query runs
+    totals_future = _VIEW_EXECUTOR.submit(_category_totals, db, requested_list_id) if requested_list_id else None
+    if request.method == 'GET':
+        # A page render shows every list's items, so they are joined in on the server in the same round trip
+        recent_lists = db.shopping_lists.aggregate([
+            {'$match': filter_criteria},
+            {'$sort': {'created_at': -1}},
+            {'$limit': _NEW_VIEW_LIST_LIMIT},
+            {'$project': _LIST_VIEW_PROJECTION},
+            {'$lookup': {
+                'from': 'shopping_items',
+                'let': {'list_id': {'$toString': '$_id'}},
+                'pipeline': [
+                    {'$match': {'$expr': {'$eq': ['$list_id', '$$list_id']}}},
+                    {'$project': _ITEM_VIEW_PROJECTION}
+                ],
+                'as': 'items'
+            }}
+        ])
+    else:
+        recent_lists = db.shopping_lists.find(filter_criteria, _LIST_VIEW_PROJECTION).sort('created_at', -1).limit(_NEW_VIEW_LIST_LIMIT)
+    lists = {str(lst['_id']): lst for lst in recent_lists}
     
-    selected_list_id = request.args.get('list_id') or session.get('selected_list_id')
+    selected_list_id = requested_list_id
     if not selected_list_id and lists:
         selected_list_id = list(lists.keys())[0]
         session['selected_list_id'] = selected_list_id
+    elif selected_list_id not in lists:
+        # A selected list older than the most recent ones is still loaded on its own
+        selected_oid = _to_object_id(selected_list_id)
+        older_list = selected_oid and db.shopping_lists.find_one({'_id': selected_oid, **filter_criteria}, _LIST_VIEW_PROJECTION)
+        if older_list:
+            lists[selected_list_id] = older_list
 
     selected_list = lists.get(selected_list_id, {})
     items = []
-    if selected_list_id:
-        list_items = list(db.shopping_items.find({'list_id': selected_list_id}))
-        items = [{
-            'id': str(item['_id']),
-            'name': item.get('name', ''),
-            'quantity': int(item.get('quantity', 1)),
-            'price_raw': float(item.get('price', 0.0)),
-            'unit': item.get('unit', 'piece'),
-            'category': item.get('category', 'other'),
-            'status': item.get('status', 'to_buy'),
-            'store': item.get('store', 'Unknown'),
-            'frequency': int(item.get('frequency', 7))
-        } for item in list_items]
-        selected_list['items'] = items
 
     categories = {}
     if selected_list_id:
-        categories = {
-            trans('shopping_category_fruits', default='Fruits'): sum(item['price_raw'] * item['quantity'] for item in items if item['category'] == 'fruits'),
-            trans('shopping_category_vegetables', default='Vegetables'): sum(item['price_raw'] * item['quantity'] for item in items if item['category'] == 'vegetables'),
-            trans('shopping_category_dairy', default='Dairy'): sum(item['price_raw'] * item['quantity'] for item in items if item['category'] == 'dairy'),
-            trans('shopping_category_meat', default='Meat'): sum(item['price_raw'] * item['quantity'] for item in items if item['category'] == 'meat'),
-            trans('shopping_category_grains', default='Grains'): sum(item['price_raw'] * item['quantity'] for item in items if item['category'] == 'grains'),
-            trans('shopping_category_beverages', default='Beverages'): sum(item['price_raw'] * item['quantity'] for item in items if item['category'] == 'beverages'),
-            trans('shopping_category_household', default='Household'): sum(item['price_raw'] * item['quantity'] for item in items if item['category'] == 'household'),
-            trans('shopping_category_other', default='Other'): sum(item['price_raw'] * item['quantity'] for item in items if item['category'] == 'other')
-        }
-        categories = {k: v for k, v in categories.items() if v > 0}
+        totals = totals_future.result() if totals_future else _category_totals(db, selected_list_id)
+        for category, label in _category_labels(session.get('lang', 'en')):
+            total = totals.get(category, 0)
+            if total > 0:
+                categories[label] = total
 
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='shopping',
             db=db,
-            user_id=current_user.id,
+            user_id=user_id,
             session_id=session.get('sid', 'no-session'),
             action='main_view'
         )
@@ -461,28 +790,29 @@ def new():
 
     if request.method == 'POST':
         action = request.form.get('action')
-        logger.debug(f"Processing action: {action} with form data: {request.form.to_dict()}", extra={'session_id': session.get('sid', 'no-session-id')})
+        logger.debug("Processing action: %s with form data: %s", action, request.form, extra={'session_id': session.get('sid', 'no-session-id')})
         if action == 'create_list':
-            logger.debug(f"Processing create_list action with form data: {request.form.to_dict()}", extra={'session_id': session.get('sid', 'no-session-id')})
+            logger.debug("Processing create_list action with form data: %s", request.form, extra={'session_id': session.get('sid', 'no-session-id')})
             if list_form.validate_on_submit():
                 session_id = session.get('sid', str(uuid.uuid4()))
                 if not session.get('sid'):
                     session['sid'] = session_id
-                    logger.debug(f"Assigned new session_id: {session_id}")
+                    logger.debug("Assigned new session_id: %s", session_id)
+                now = datetime.utcnow()
                 list_data = {
                     '_id': ObjectId(),
                     'name': list_form.name.data.strip(),
-                    'user_id': str(current_user.id),
+                    'user_id': user_id,
                     'budget': float(list_form.budget.data),
-                    'created_at': datetime.utcnow(),
-                    'updated_at': datetime.utcnow(),
+                    'created_at': now,
+                    'updated_at': now,
                     'collaborators': [],
                     'items': [],
                     'total_spent': 0.0,
                     'status': 'active'
                 }
                 try:
-                    logger.debug(f"Creating shopping list: {list_data}", extra={'session_id': session_id})
+                    logger.debug("Creating shopping list: %s", list_data, extra={'session_id': session_id})
                     created_list_id = create_shopping_list(db, list_data)
                     session['selected_list_id'] = str(list_data['_id'])
                     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -512,7 +842,7 @@ def new():
                     return redirect(url_for('shopping.new'))
             else:
                 form_errors = {field: [trans(error, default=error) for error in field_errors] for field, field_errors in list_form.errors.items()}
-                logger.debug(f"Form validation failed: {form_errors}", extra={'session_id': session.get('sid', 'no-session-id')})
+                logger.debug("Form validation failed: %s", form_errors, extra={'session_id': session.get('sid', 'no-session-id')})
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return jsonify({
                         'success': False,
@@ -522,6 +852,9 @@ def new():
                 for field, field_errors in list_form.errors.items():
                     for error in field_errors:
                         flash(f"{field.capitalize()}: {trans(error, default=error)}", 'danger')
+                if selected_list_id:
+                    items = [_item_view(item) for item in db.shopping_items.find({'list_id': selected_list_id}, _ITEM_VIEW_PROJECTION)]
+                    selected_list['items'] = items
                 return render_template(
                     'shopping/new.html',
                     form=list_form,
@@ -534,12 +867,7 @@ def new():
                     selected_list_id=selected_list_id,
                     items=items,
                     categories=categories,
-                    tips=[
-                        trans('shopping_tip_plan_ahead', default='Plan your shopping list ahead to avoid impulse buys.'),
-                        trans('shopping_tip_compare_prices', default='Compare prices across stores to save money.'),
-                        trans('shopping_tip_bulk_buy', default='Buy non-perishable items in bulk to reduce costs.'),
-                        trans('shopping_tip_check_sales', default='Check for sales or discounts before shopping.')
-                    ],
+                    tips=_shopping_tips(session.get('lang', 'en')),
                     insights=[],
                     tool_title=trans('shopping_title', default='Shopping List Planner'),
                     active_tab='create-list'
@@ -547,85 +875,81 @@ def new():
 
         elif action == 'add_items':
             list_id = request.form.get('list_id')
-            if not ObjectId.is_valid(list_id):
+            list_oid = _to_object_id(list_id)
+            if list_oid is None:
                 flash(trans('shopping_invalid_list_id', default='Invalid list ID.'), 'danger')
                 return redirect(url_for('shopping.new'))
-            shopping_list = db.shopping_lists.find_one({'_id': ObjectId(list_id), **filter_criteria})
+            # The user's lists were already loaded under the same filter for this page
+            shopping_list = lists.get(list_id) or db.shopping_lists.find_one(
+                {'_id': list_oid, **filter_criteria}, _LIST_VIEW_PROJECTION
+            )
             if not shopping_list:
                 flash(trans('shopping_list_not_found', default='List not found.'), 'danger')
                 return redirect(url_for('shopping.new'))
-            existing_items = db.shopping_items.find({'list_id': list_id}, {'name': 1})
-            existing_names = {item['name'].lower() for item in existing_items}
-            new_items = []
-            for i in range(1, 6):
-                new_name = request.form.get(f'new_item_name_{i}', '').strip()
-                if new_name:
-                    new_items.append({
-                        'name': new_name,
-                        'quantity': request.form.get(f'new_item_quantity_{i}', 1),
-                        'price': request.form.get(f'new_item_price_{i}', '0'),
-                        'unit': request.form.get(f'new_item_unit_{i}', 'piece'),
-                        'category': request.form.get(f'new_item_category_{i}', auto_categorize_item(new_name)),
-                        'status': request.form.get(f'new_item_status_{i}', 'to_buy'),
-                        'store': request.form.get(f'new_item_store_{i}', 'Unknown'),
-                        'frequency': request.form.get(f'new_item_frequency_{i}', 7)
-                    })
-            for item_data in new_items:
-                if item_data['name'].lower() in existing_names:
-                    flash(trans('shopping_duplicate_item_name', default='Item name already exists in this list.'), 'danger')
-                    return redirect(url_for('shopping.new'))
-            added = 0
+            budget = shopping_list['budget']
+            rows = _numbered_item_rows(request.form)
             session_id = session.get('sid', str(uuid.uuid4()))
             if not session.get('sid'):
                 session['sid'] = session_id
-                logger.debug(f"Assigned new session_id: {session_id}")
+                logger.debug("Assigned new session_id: %s", session_id)
+            # Rows are parsed, range-checked and turned into ready-to-insert documents in one pass
+            # before any transaction opens. Duplicate names, within the batch or against the list,
+            # are rejected by the unique (list_id, name_lower) index when the batch is inserted
+            now = datetime.utcnow()
+            new_docs = []
+            for row in rows:
+                new_name = str(row.get('name') or '').strip()
+                if not new_name:
+                    continue
+                try:
+                    new_quantity = int(row.get('quantity', 1))
+                    new_price = _parse_amount(row.get('price', '0'))
+                    new_frequency = int(row.get('frequency', 7))
+                    if new_quantity < 1 or new_quantity > 1000 or new_price < 0 or new_price > 1000000 or new_frequency < 1 or new_frequency > 365:
+                        raise ValueError('Invalid input range')
+                    new_unit = row.get('unit', 'piece')
+                    new_category = row.get('category') or auto_categorize_item(new_name)
+                    new_status = row.get('status', 'to_buy')
+                    if new_unit not in _UNIT_VALUES or new_category not in _CATEGORY_VALUES or new_status not in _STATUS_VALUES:
+                        raise ValueError('Invalid unit, category or status')
+                except (ValueError, TypeError) as e:
+                    flash(trans('shopping_item_error', default='Error adding new item: ') + str(e), 'danger')
+                    continue
+                new_docs.append({
+                    '_id': ObjectId(),
+                    'list_id': list_id,
+                    'user_id': user_id,
+                    'name': new_name,
+                    'name_lower': new_name.lower(),
+                    'quantity': new_quantity,
+                    'price': new_price,
+                    'unit': new_unit,
+                    'category': new_category,
+                    'status': new_status,
+                    'store': row.get('store', 'Unknown').strip(),
+                    'frequency': new_frequency,
+                    'created_at': now,
+                    'updated_at': now
+                })
+            added = len(new_docs)
             try:
-                with db.client.start_session() as mongo_session:
-                    with mongo_session.start_transaction():
-                        for item_data in new_items:
-                            try:
-                                new_quantity = int(item_data['quantity'])
-                                new_price = float(clean_currency(item_data['price']))
-                                new_unit = item_data['unit']
-                                new_category = item_data['category']
-                                new_status = item_data['status']
-                                new_store = item_data['store']
-                                new_frequency = int(item_data['frequency'])
-                                if new_quantity < 1 or new_quantity > 1000 or new_price is None or new_price < 0 or new_price > 1000000 or new_frequency < 1 or new_frequency > 365:
-                                    raise ValueError('Invalid input range')
-                                new_item_data = {
-                                    '_id': ObjectId(),
-                                    'list_id': list_id,
-                                    'user_id': str(current_user.id),
-                                    'name': item_data['name'],
-                                    'quantity': new_quantity,
-                                    'price': new_price,
-                                    'unit': new_unit,
-                                    'category': new_category,
-                                    'status': new_status,
-                                    'store': new_store,
-                                    'frequency': new_frequency,
-                                    'created_at': datetime.utcnow(),
-                                    'updated_at': datetime.utcnow()
-                                }
-                                logger.debug(f"Creating shopping item: {new_item_data}", extra={'session_id': session_id})
-                                created_item_id = create_shopping_item(db, new_item_data, mongo_session=mongo_session)
-                                added += 1
-                                existing_names.add(item_data['name'].lower())
-                            except ValueError as e:
-                                flash(trans('shopping_item_error', default='Error adding new item: ') + str(e), 'danger')
-                        if added > 0:
-                            items = list(db.shopping_items.find({'list_id': list_id}, session=mongo_session))
-                            total_spent = sum(item['price'] * item['quantity'] for item in items)
-                            db.shopping_lists.update_one(
-                                {'_id': ObjectId(list_id)},
-                                {'$set': {'total_spent': total_spent, 'updated_at': datetime.utcnow()}},
-                                session=mongo_session
-                            )
-                            get_shopping_lists.cache_clear()
-                            flash(trans('shopping_items_added', default=f'{added} item(s) added successfully!'), 'success')
-                            if total_spent > shopping_list['budget']:
-                                flash(trans('shopping_over_budget', default='Warning: Total spent exceeds budget by ') + format_currency(total_spent - shopping_list['budget']) + '.', 'warning')
+                if added > 0:
+                    logger.debug("Creating %s shopping item(s) for list %s", added, list_id, extra={'session_id': session_id})
+                    total_spent = _add_items_to_list(db, shopping_list['_id'], new_docs, now)
+                    flash(trans('shopping_items_added', default=f'{added} item(s) added successfully!'), 'success')
+                    if total_spent > budget:
+                        flash(trans('shopping_over_budget', default='Warning: Total spent exceeds budget by ') + format_currency(total_spent - budget) + '.', 'warning')
+            except errors.BulkWriteError as e:
+                # The transaction rolls back the whole batch; log which rows the server rejected
+                write_errors = e.details.get('writeErrors', [])
+                if any(err.get('code') == 11000 for err in write_errors):
+                    flash(trans('shopping_duplicate_item_name', default='Item name already exists in this list.'), 'danger')
+                    return redirect(url_for('shopping.new'))
+                logger.error(f"Failed to save items for list {list_id}: {len(write_errors)} of {added} rejected: "
+                             f"{[(err.get('index'), err.get('errmsg')) for err in write_errors]}",
+                             extra={'session_id': session_id})
+                flash(trans('shopping_list_error', default='Error saving items due to validation failure.'), 'danger')
+                return redirect(url_for('shopping.new'))
             except errors.WriteError as e:
                 logger.error(f"Failed to save items for list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
                 flash(trans('shopping_list_error', default='Error saving items due to validation failure.'), 'danger')
@@ -637,8 +961,10 @@ def new():
             return redirect(url_for('shopping.new'))
 
     lists_dict = {}
+    # Lists loaded without their joined items (a POST, or an older selected list) are filled in with one query
+    items_by_list = _items_by_list(db, [lst for lst in lists.values() if 'items' not in lst], _ITEM_VIEW_PROJECTION)
     for lst in lists.values():
-        list_items = list(db.shopping_items.find({'list_id': str(lst['_id'])}))
+        list_items = lst['items'] if 'items' in lst else items_by_list[str(lst['_id'])]
         list_data = {
             'id': str(lst['_id']),
             'name': lst.get('name', ''),
@@ -647,17 +973,7 @@ def new():
             'status': lst.get('status', 'active'),
             'created_at': lst.get('created_at'),
             'collaborators': lst.get('collaborators', []),
-            'items': [{
-                'id': str(item['_id']),
-                'name': item.get('name', ''),
-                'quantity': int(item.get('quantity', 1)),
-                'price_raw': float(item.get('price', 0.0)),
-                'unit': item.get('unit', 'piece'),
-                'category': item.get('category', 'other'),
-                'status': item.get('status', 'to_buy'),
-                'store': item.get('store', 'Unknown'),
-                'frequency': int(item.get('frequency', 7))
-            } for item in list_items]
+            'items': [_item_view(item) for item in list_items]
         }
         lists_dict[list_data['id']] = list_data
 
@@ -682,12 +998,7 @@ def new():
         selected_list_id=selected_list_id,
         items=items,
         categories=categories,
-        tips=[
-            trans('shopping_tip_plan_ahead', default='Plan your shopping list ahead to avoid impulse buys.'),
-            trans('shopping_tip_compare_prices', default='Compare prices across stores to save money.'),
-            trans('shopping_tip_bulk_buy', default='Buy non-perishable items in bulk to reduce costs.'),
-            trans('shopping_tip_check_sales', default='Check for sales or discounts before shopping.')
-        ],
+        tips=_shopping_tips(session.get('lang', 'en')),
         insights=insights,
         tool_title=trans('shopping_title', default='Shopping List Planner'),
         active_tab=active_tab
@@ -700,13 +1011,13 @@ def dashboard():
     """Shopping dashboard page."""
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
-        logger.debug(f"New session created with sid: {session['sid']}")
+        logger.debug("New session created with sid: %s", session['sid'])
     session.permanent = True
     session.modified = True
     db = get_mongo_db()
 
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='shopping',
             db=db,
             user_id=current_user.id,
@@ -717,7 +1028,7 @@ def dashboard():
         flash(trans('shopping_log_error', default='Error logging activity.'), 'danger')
 
     filter_criteria = {} if is_admin() else {'user_id': str(current_user.id)}
-    lists = list(db.shopping_lists.find(filter_criteria).sort('created_at', -1).limit(10))
+    lists = list(db.shopping_lists.find(filter_criteria, _LIST_VIEW_PROJECTION).sort('created_at', -1).limit(10))
     
     lists_data = []
     total_budget = 0.0
@@ -725,11 +1036,13 @@ def dashboard():
     active_lists = 0
     completed_lists = 0
     
+    # Counts and totals are computed by MongoDB, so no item documents travel for this page;
+    # the category breakdown runs on a worker alongside the per-list stats
+    list_ids = [str(lst['_id']) for lst in lists]
+    categories_future = _VIEW_EXECUTOR.submit(_category_totals, db, {'$in': list_ids}) if list_ids else None
+    stats_by_list = _list_item_stats(db, lists)
     for lst in lists:
-        list_items = list(db.shopping_items.find({'list_id': str(lst['_id'])}))
-        items_count = len(list_items)
-        bought_items = len([item for item in list_items if item.get('status') == 'bought'])
-        list_total = sum(item.get('price', 0) * item.get('quantity', 1) for item in list_items)
+        items_count, bought_items, list_total = stats_by_list.get(str(lst['_id']), (0, 0, 0))
         
         list_data = {
             'id': str(lst['_id']),
@@ -740,8 +1053,7 @@ def dashboard():
             'bought_items': bought_items,
             'progress': (bought_items / items_count * 100) if items_count > 0 else 0,
             'status': lst.get('status', 'active'),
-            'created_at': lst.get('created_at'),
-            'items': list_items[:5]
+            'created_at': lst.get('created_at')
         }
         lists_data.append(list_data)
         
@@ -753,21 +1065,7 @@ def dashboard():
         else:
             completed_lists += 1
 
-    categories = {}
-    for lst in lists:
-        list_items = list(db.shopping_items.find({'list_id': str(lst['_id'])}))
-        for item in list_items:
-            category = item.get('category', 'other')
-            if category not in categories:
-                categories[category] = 0
-            categories[category] += item.get('price', 0) * item.get('quantity', 1)
-
-    tips = [
-        trans('shopping_tip_plan_ahead', default='Plan your shopping list ahead to avoid impulse buys.'),
-        trans('shopping_tip_compare_prices', default='Compare prices across stores to save money.'),
-        trans('shopping_tip_bulk_buy', default='Buy non-perishable items in bulk to reduce costs.'),
-        trans('shopping_tip_check_sales', default='Check for sales or discounts before shopping.')
-    ]
+    tips = _shopping_tips(session.get('lang', 'en'))
 
     insights = []
     if total_budget > 0 and total_spent > total_budget:
@@ -782,7 +1080,7 @@ def dashboard():
         total_spent=format_currency(total_spent),
         active_lists=active_lists,
         completed_lists=completed_lists,
-        categories=categories,
+        categories=categories_future.result() if categories_future else {},
         tips=tips,
         insights=insights,
         tool_title=trans('shopping_dashboard', default='Shopping Dashboard')
@@ -795,13 +1093,13 @@ def manage():
     """Manage shopping lists page."""
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
-        logger.debug(f"New session created with sid: {session['sid']}")
+        logger.debug("New session created with sid: %s", session['sid'])
     session.permanent = True
     session.modified = True
     db = get_mongo_db()
 
     try:
-        log_tool_usage(
+        queue_tool_usage(
             tool_name='shopping',
             db=db,
             user_id=current_user.id,
@@ -812,14 +1110,12 @@ def manage():
         flash(trans('shopping_log_error', default='Error logging activity.'), 'danger')
 
     filter_criteria = {} if is_admin() else {'user_id': str(current_user.id)}
-    lists = list(db.shopping_lists.find(filter_criteria).sort('created_at', -1))
+    lists = list(db.shopping_lists.find(filter_criteria, _LIST_VIEW_PROJECTION).sort('created_at', -1))
     
     lists_data = []
+    stats_by_list = _list_item_stats(db, lists)
     for lst in lists:
-        list_items = list(db.shopping_items.find({'list_id': str(lst['_id'])}))
-        items_count = len(list_items)
-        bought_items = len([item for item in list_items if item.get('status') == 'bought'])
-        list_total = sum(item.get('price', 0) * item['quantity'] for item in list_items)
+        items_count, bought_items, list_total = stats_by_list.get(str(lst['_id']), (0, 0, 0))
         
         list_data = {
             'id': str(lst['_id']),
@@ -849,16 +1145,29 @@ def get_list_details():
     list_id = request.args.get('list_id')
     tab = request.args.get('tab', 'manage-list')
     
-    if not ObjectId.is_valid(list_id):
+    list_oid = _to_object_id(list_id)
+    if list_oid is None:
         return jsonify({'success': False, 'error': trans('shopping_invalid_list_id', default='Invalid list ID.')}), 400
     
     filter_criteria = {} if is_admin() else {'user_id': str(current_user.id)}
-    shopping_list = db.shopping_lists.find_one({'_id': ObjectId(list_id), **filter_criteria})
+    shopping_list = _fetch_list_with_items(db, list_oid, filter_criteria, _ITEM_VIEW_PROJECTION)
     
     if not shopping_list:
         return jsonify({'success': False, 'error': trans('shopping_list_not_found', default='List not found.')}), 404
     
-    list_items = list(db.shopping_items.find({'list_id': str(list_id)}))
+    list_items = shopping_list['items']
+    # Every list and item write bumps the list's updated_at, so with the item count and the
+    # language the partial is rendered in it identifies the response; an unchanged list skips
+    # the render and goes back as a 304
+    updated_at = shopping_list.get('updated_at')
+    etag = hashlib.md5(
+        f"{updated_at.timestamp() if updated_at else ''}:{len(list_items)}:{session.get('lang', 'en')}".encode()
+    ).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+        response.set_etag(etag)
+        return response
+    
     selected_list = {
         'id': str(shopping_list['_id']),
         'name': shopping_list.get('name', ''),
@@ -867,34 +1176,32 @@ def get_list_details():
         'status': shopping_list.get('status', 'active'),
         'created_at': shopping_list.get('created_at'),
         'collaborators': shopping_list.get('collaborators', []),
-        'items': [{
-            'id': str(item['_id']),
-            'name': item.get('name', ''),
-            'quantity': int(item.get('quantity', 1)),
-            'price_raw': float(item.get('price', 0.0)),
-            'unit': item.get('unit', 'piece'),
-            'category': item.get('category', 'other'),
-            'status': item.get('status', 'to_buy'),
-            'store': item.get('store', 'Unknown'),
-            'frequency': int(item.get('frequency', 7))
-        } for item in list_items]
+        'items': [_item_view(item) for item in list_items],
+        'bought_count': shopping_list['bought_count']
     }
     
     try:
+        # The details partial only reads selected_list and selected_list_id, so no forms are built for it
         html = render_template(
             'shopping/manage_list_details.html',
-            form=ShoppingListForm(data={'name': selected_list['name'], 'budget': selected_list['budget_raw']}),
-            list_form=ShoppingListForm(data={'name': selected_list['name'], 'budget': selected_list['budget_raw']}),
-            item_form=ShoppingItemsForm(),
             selected_list=selected_list,
-            selected_list_id=list_id,
-            items=selected_list['items']
+            selected_list_id=list_id
         )
-        return jsonify({'success': True, 'html': html, 'items': selected_list['items']})
+        response = jsonify({'success': True, 'html': html, 'items': selected_list['items']})
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
     except Exception as e:
         logger.error(f"Error rendering list details for {list_id}: {str(e)}")
         return jsonify({'success': False, 'error': trans('shopping_load_error', default='Failed to load list details.')}), 500
 
+def _json_failure(message, status, form_errors=None):
+    """The JSON reply a script-driven edit_list post gets when its action fails."""
+    payload = {'success': False, 'error': message}
+    if form_errors:
+        payload['errors'] = form_errors
+    return jsonify(payload), status
+
 @shopping_bp.route('/edit/<list_id>', methods=['GET', 'POST'])
 @custom_login_required
 @requires_role(['personal', 'admin'])
@@ -902,262 +1209,314 @@ def edit_list(list_id):
     """Edit an existing shopping list and its items."""
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
-        logger.debug(f"New session created with sid: {session['sid']}")
+        logger.debug("New session created with sid: %s", session['sid'])
     session.permanent = True
     session.modified = True
 
     db = get_mongo_db()
     session_id = session.get('sid', 'no-session-id')
+    # Script callers get the outcome of a POST as JSON and patch the page themselves instead of
+    # following a redirect and re-fetching the list; plain form posts keep the redirect
+    wants_json = request.method == 'POST' and request.headers.get('X-Requested-With') == 'XMLHttpRequest'
 
-    if not ObjectId.is_valid(list_id):
+    list_oid = _to_object_id(list_id)
+    if list_oid is None:
         logger.error(f"Invalid list ID: {list_id}", extra={'session_id': session_id})
-        flash(trans('shopping_invalid_list_id', default='Invalid list ID.'), 'danger')
+        message = trans('shopping_invalid_list_id', default='Invalid list ID.')
+        if wants_json:
+            return _json_failure(message, 400)
+        flash(message, 'danger')
         return redirect(url_for('shopping.manage'))
 
-    filter_criteria = {} if is_admin() else {'user_id': str(current_user.id)}
-    shopping_list = db.shopping_lists.find_one({'_id': ObjectId(list_id), **filter_criteria})
+    user_id = str(current_user.id)
+    filter_criteria = {} if is_admin() else {'user_id': user_id}
+    if request.method == 'GET':
+        # A GET always renders the items, so they are joined in with the ownership check
+        shopping_list = _fetch_list_with_items(db, list_oid, filter_criteria, _ITEM_VIEW_PROJECTION)
+    else:
+        # The projection leaves out the items array stored on list documents, so the page
+        # re-rendered after a failed action loads the actual items below
+        shopping_list = db.shopping_lists.find_one({'_id': list_oid, **filter_criteria}, _LIST_VIEW_PROJECTION)
 
     if not shopping_list:
         logger.error(f"List not found: {list_id}", extra={'session_id': session_id})
-        flash(trans('shopping_list_not_found', default='List not found.'), 'danger')
+        message = trans('shopping_list_not_found', default='List not found.')
+        if wants_json:
+            return _json_failure(message, 404)
+        flash(message, 'danger')
         return redirect(url_for('shopping.manage'))
 
-    # Fetch items for the list
-    list_items = list(db.shopping_items.find({'list_id': str(list_id)}))
-    items = [{
-        'id': str(item['_id']),
-        'name': item.get('name', ''),
-        'quantity': int(item.get('quantity', 1)),
-        'price_raw': float(item.get('price', 0.0)),
-        'unit': item.get('unit', 'piece'),
-        'category': item.get('category', 'other'),
-        'status': item.get('status', 'to_buy'),
-        'store': item.get('store', 'Unknown'),
-        'frequency': int(item.get('frequency', 7))
-    } for item in list_items]
-
-    # Calculate total cost for statistics
-    total_cost = sum(item['price_raw'] * item['quantity'] for item in items)
-
     list_form = ShoppingListForm(data={'name': shopping_list['name'], 'budget': shopping_list['budget']})
     item_form = ShoppingItemsForm()
 
     if request.method == 'POST':
         action = request.form.get('action')
-        logger.debug(f"Processing action: {action} with form data: {request.form.to_dict()}", extra={'session_id': session_id})
+        # One timestamp for everything this POST writes
+        now = datetime.utcnow()
+        logger.debug("Processing action: %s with form data: %s", action, request.form, extra={'session_id': session_id})
 
         if action == 'update_list':
-            logger.debug(f"Attempting to update list: {list_id} with data: {request.form.to_dict()}", extra={'session_id': session_id})
+            logger.debug("Attempting to update list: %s with data: %s", list_id, request.form, extra={'session_id': session_id})
             if list_form.validate_on_submit():
+                new_name = list_form.name.data.strip()
+                new_budget = float(list_form.budget.data)
+                if new_name == shopping_list['name'] and new_budget == shopping_list['budget']:
+                    # Nothing to write; skip the update rather than only bumping updated_at
+                    message = trans('shopping_no_changes', default='No changes to save.')
+                    if wants_json:
+                        return jsonify({'success': True, 'message': message, 'list': {'name': new_name, 'budget': new_budget}})
+                    flash(message, 'info')
+                    return redirect(url_for('shopping.edit_list', list_id=list_id))
                 try:
                     updated_data = {
-                        'name': list_form.name.data.strip(),
-                        'budget': float(list_form.budget.data),
-                        'updated_at': datetime.utcnow()
+                        'name': new_name,
+                        'budget': new_budget,
+                        'updated_at': now
                     }
                     result = db.shopping_lists.update_one(
-                        {'_id': ObjectId(list_id), **filter_criteria},
+                        {'_id': shopping_list['_id'], **filter_criteria},
                         {'$set': updated_data}
                     )
                     if result.modified_count > 0:
                         logger.info(f"List {list_id} updated successfully", extra={'session_id': session_id})
-                        flash(trans('shopping_list_updated', default='Shopping list updated successfully!'), 'success')
-                        get_shopping_lists.cache_clear()
+                        message = trans('shopping_list_updated', default='Shopping list updated successfully!')
+                        if wants_json:
+                            return jsonify({'success': True, 'message': message, 'list': {'name': new_name, 'budget': new_budget}})
+                        flash(message, 'success')
                         return redirect(url_for('shopping.edit_list', list_id=list_id))
                     else:
                         logger.warning(f"No changes made to list {list_id}", extra={'session_id': session_id})
-                        flash(trans('shopping_update_failed', default='Failed to update list.'), 'danger')
+                        message = trans('shopping_update_failed', default='Failed to update list.')
+                        if wants_json:
+                            return _json_failure(message, 404)
+                        flash(message, 'danger')
                 except errors.WriteError as e:
                     logger.error(f"Failed to update list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
-                    flash(trans('shopping_update_error', default='Error updating list due to validation failure.'), 'danger')
+                    message = trans('shopping_update_error', default='Error updating list due to validation failure.')
+                    if wants_json:
+                        return _json_failure(message, 500)
+                    flash(message, 'danger')
                 except Exception as e:
                     logger.error(f"Unexpected error updating list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
-                    flash(trans('shopping_update_error', default=f'Error updating list: {str(e)}'), 'danger')
+                    message = trans('shopping_update_error', default=f'Error updating list: {str(e)}')
+                    if wants_json:
+                        return _json_failure(message, 500)
+                    flash(message, 'danger')
             else:
                 form_errors = {field: [trans(error, default=error) for error in field_errors] for field, field_errors in list_form.errors.items()}
-                logger.debug(f"List form validation failed: {form_errors}", extra={'session_id': session_id})
-                flash(trans('shopping_form_invalid', default='Invalid form data.'), 'danger')
+                logger.debug("List form validation failed: %s", form_errors, extra={'session_id': session_id})
+                message = trans('shopping_form_invalid', default='Invalid form data.')
+                if wants_json:
+                    return _json_failure(message, 400, form_errors)
+                flash(message, 'danger')
 
         elif action == 'add_item':
-            logger.debug(f"Attempting to add item to list: {list_id} with data: {request.form.to_dict()}", extra={'session_id': session_id})
+            logger.debug("Attempting to add item to list: %s with data: %s", list_id, request.form, extra={'session_id': session_id})
             item_form = ShoppingItemsForm()
             if item_form.validate_on_submit():
                 try:
                     with db.client.start_session() as mongo_session:
-                        with mongo_session.start_transaction():
+                        with mongo_session.start_transaction(write_concern=_ITEM_TXN_WRITE_CONCERN):
                             new_item_data = {
                                 '_id': ObjectId(),
-                                'list_id': str(list_id),
-                                'user_id': str(current_user.id),
-                                'name': item_form.name.data.strip(),
-                                'quantity': int(item_form.quantity.data),
-                                'price': float(item_form.price.data),
-                                'unit': item_form.unit.data,
-                                'category': item_form.category.data or auto_categorize_item(item_form.name.data),
-                                'status': item_form.status.data or 'to_buy',
-                                'store': item_form.store.data.strip(),
-                                'frequency': int(item_form.frequency.data),
-                                'created_at': datetime.utcnow(),
-                                'updated_at': datetime.utcnow()
+                                'list_id': list_id,
+                                'user_id': user_id,
+                                **_item_fields_from_form(item_form),
+                                'created_at': now,
+                                'updated_at': now
                             }
-                            logger.debug(f"Creating shopping item: {new_item_data}", extra={'session_id': session_id})
-                            existing_items = db.shopping_items.count_documents(
-                                {'list_id': str(list_id), 'name': {'$regex': f'^{new_item_data["name"].lower()}$', '$options': 'i'}},
-                                session=mongo_session
-                            )
-                            if existing_items > 0:
-                                logger.warning(f"Duplicate item name found: {new_item_data['name']}", extra={'session_id': session_id})
-                                flash(trans('shopping_duplicate_item_name', default='Item name already exists in this list.'), 'danger')
-                                return redirect(url_for('shopping.edit_list', list_id=list_id))
-                            
+                            logger.debug("Creating shopping item: %s", new_item_data, extra={'session_id': session_id})
                             created_item_id = create_shopping_item(db, new_item_data, mongo_session=mongo_session)
-                            list_items = list(db.shopping_items.find({'list_id': str(list_id)}, session=mongo_session))
-                            total_spent = sum(item['price'] * item['quantity'] for item in list_items)
-                            db.shopping_lists.update_one(
-                                {'_id': ObjectId(list_id)},
-                                {'$set': {'total_spent': total_spent, 'updated_at': datetime.utcnow()}},
-                                session=mongo_session
+                            total_spent = _bump_list_total(
+                                db, shopping_list['_id'], new_item_data['price'] * new_item_data['quantity'],
+                                now, mongo_session
                             )
                             logger.info(f"Item {created_item_id} added to list {list_id}", extra={'session_id': session_id})
-                            flash(trans('shopping_item_added', default='Item added successfully!'), 'success')
+                            message = trans('shopping_item_added', default='Item added successfully!')
+                            if wants_json:
+                                return jsonify({
+                                    'success': True,
+                                    'message': message,
+                                    'item': _item_view({field: new_item_data[field] for field in ('_id', *_ITEM_VIEW_PROJECTION)}),
+                                    'total_spent': total_spent,
+                                    'over_budget': total_spent > shopping_list['budget']
+                                })
+                            flash(message, 'success')
                             if total_spent > shopping_list['budget']:
                                 flash(trans('shopping_over_budget', default='Warning: Total spent exceeds budget by ') + format_currency(total_spent - shopping_list['budget']) + '.', 'warning')
-                            get_shopping_lists.cache_clear()
                             return redirect(url_for('shopping.edit_list', list_id=list_id))
+                except errors.DuplicateKeyError:
+                    # The unique (list_id, name_lower) index rejects the name; the transaction is rolled back
+                    logger.warning(f"Duplicate item name found: {item_form.name.data.strip()}", extra={'session_id': session_id})
+                    message = trans('shopping_duplicate_item_name', default='Item name already exists in this list.')
+                    if wants_json:
+                        return _json_failure(message, 400)
+                    flash(message, 'danger')
+                    return redirect(url_for('shopping.edit_list', list_id=list_id))
                 except errors.WriteError as e:
                     logger.error(f"Failed to add item to list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
-                    flash(trans('shopping_item_error', default='Error adding item due to validation failure.'), 'danger')
+                    message = trans('shopping_item_error', default='Error adding item due to validation failure.')
+                    if wants_json:
+                        return _json_failure(message, 500)
+                    flash(message, 'danger')
                 except Exception as e:
                     logger.error(f"Unexpected error adding item to list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
-                    flash(trans('shopping_item_error', default=f'Error adding item: {str(e)}'), 'danger')
+                    message = trans('shopping_item_error', default=f'Error adding item: {str(e)}')
+                    if wants_json:
+                        return _json_failure(message, 500)
+                    flash(message, 'danger')
             else:
                 form_errors = {field: [trans(error, default=error) for error in field_errors] for field, field_errors in item_form.errors.items()}
-                logger.debug(f"Item form validation failed: {form_errors}", extra={'session_id': session_id})
-                flash(trans('shopping_form_invalid', default='Invalid form data.'), 'danger')
+                logger.debug("Item form validation failed: %s", form_errors, extra={'session_id': session_id})
+                message = trans('shopping_form_invalid', default='Invalid form data.')
+                if wants_json:
+                    return _json_failure(message, 400, form_errors)
+                flash(message, 'danger')
 
         elif action == 'update_item':
             item_id = request.form.get('item_id')
-            logger.debug(f"Attempting to update item {item_id} in list {list_id} with data: {request.form.to_dict()}", extra={'session_id': session_id})
-            if not ObjectId.is_valid(item_id):
+            logger.debug("Attempting to update item %s in list %s with data: %s", item_id, list_id, request.form, extra={'session_id': session_id})
+            item_oid = _to_object_id(item_id)
+            if item_oid is None:
                 logger.error(f"Invalid item ID: {item_id}", extra={'session_id': session_id})
-                flash(trans('shopping_invalid_item_id', default='Invalid item ID.'), 'danger')
+                message = trans('shopping_invalid_item_id', default='Invalid item ID.')
+                if wants_json:
+                    return _json_failure(message, 400)
+                flash(message, 'danger')
                 return redirect(url_for('shopping.edit_list', list_id=list_id))
             item_form = ShoppingItemsForm()
             if item_form.validate_on_submit():
                 try:
                     with db.client.start_session() as mongo_session:
-                        with mongo_session.start_transaction():
-                            existing_item = db.shopping_items.find_one({'_id': ObjectId(item_id), 'list_id': str(list_id)}, session=mongo_session)
-                            if not existing_item:
-                                logger.error(f"Item not found: {item_id}", extra={'session_id': session_id})
-                                flash(trans('shopping_item_not_found', default='Item not found.'), 'danger')
-                                return redirect(url_for('shopping.edit_list', list_id=list_id))
+                        with mongo_session.start_transaction(write_concern=_ITEM_TXN_WRITE_CONCERN):
                             updated_item_data = {
-                                'name': item_form.name.data.strip(),
-                                'quantity': int(item_form.quantity.data),
-                                'price': float(item_form.price.data),
-                                'unit': item_form.unit.data,
-                                'category': item_form.category.data or auto_categorize_item(item_form.name.data),
-                                'status': item_form.status.data or 'to_buy',
-                                'store': item_form.store.data.strip(),
-                                'frequency': int(item_form.frequency.data),
-                                'updated_at': datetime.utcnow()
+                                **_item_fields_from_form(item_form),
+                                'updated_at': now
                             }
-                            logger.debug(f"Updating shopping item {item_id}: {updated_item_data}", extra={'session_id': session_id})
-                            existing_items = db.shopping_items.count_documents(
-                                {'list_id': str(list_id), 'name': {'$regex': f'^{updated_item_data["name"].lower()}$', '$options': 'i'}, '_id': {'$ne': ObjectId(item_id)}},
-                                session=mongo_session
-                            )
-                            if existing_items > 0:
-                                logger.warning(f"Duplicate item name found: {updated_item_data['name']}", extra={'session_id': session_id})
-                                flash(trans('shopping_duplicate_item_name', default='Item name already exists in this list.'), 'danger')
-                                return redirect(url_for('shopping.edit_list', list_id=list_id))
-                            result = db.shopping_items.update_one(
-                                {'_id': ObjectId(item_id), 'list_id': str(list_id), **filter_criteria},
+                            logger.debug("Updating shopping item %s: %s", item_id, updated_item_data, extra={'session_id': session_id})
+                            # The update hands back the item's previous price and quantity for the total
+                            previous_item = db.shopping_items.find_one_and_update(
+                                {'_id': item_oid, 'list_id': list_id, **filter_criteria},
                                 {'$set': updated_item_data},
+                                projection={'price': 1, 'quantity': 1},
+                                return_document=ReturnDocument.BEFORE,
                                 session=mongo_session
                             )
-                            if result.modified_count > 0:
-                                list_items = list(db.shopping_items.find({'list_id': str(list_id)}, session=mongo_session))
-                                total_spent = sum(item['price'] * item['quantity'] for item in list_items)
-                                db.shopping_lists.update_one(
-                                    {'_id': ObjectId(list_id)},
-                                    {'$set': {'total_spent': total_spent, 'updated_at': datetime.utcnow()}},
-                                    session=mongo_session
-                                )
-                                logger.info(f"Item {item_id} updated successfully in list {list_id}", extra={'session_id': session_id})
-                                flash(trans('shopping_item_updated', default='Item updated successfully!'), 'success')
-                                if total_spent > shopping_list['budget']:
-                                    flash(trans('shopping_over_budget', default='Warning: Total spent exceeds budget by ') + format_currency(total_spent - shopping_list['budget']) + '.', 'warning')
-                                get_shopping_lists.cache_clear()
+                            if not previous_item:
+                                logger.error(f"Item not found: {item_id}", extra={'session_id': session_id})
+                                message = trans('shopping_item_not_found', default='Item not found.')
+                                if wants_json:
+                                    return _json_failure(message, 404)
+                                flash(message, 'danger')
                                 return redirect(url_for('shopping.edit_list', list_id=list_id))
-                            else:
-                                logger.warning(f"No changes made to item {item_id} in list {list_id}", extra={'session_id': session_id})
-                                flash(trans('shopping_update_item_failed', default='Failed to update item.'), 'danger')
+                            # Adjust the total by the change in this item's cost
+                            total_spent = _bump_list_total(
+                                db, shopping_list['_id'],
+                                updated_item_data['price'] * updated_item_data['quantity'] - _item_cost(previous_item),
+                                now, mongo_session
+                            )
+                            logger.info(f"Item {item_id} updated successfully in list {list_id}", extra={'session_id': session_id})
+                            message = trans('shopping_item_updated', default='Item updated successfully!')
+                            if wants_json:
+                                return jsonify({
+                                    'success': True,
+                                    'message': message,
+                                    'item': _item_view({'_id': item_oid, **{field: updated_item_data[field] for field in _ITEM_VIEW_PROJECTION}}),
+                                    'total_spent': total_spent,
+                                    'over_budget': total_spent > shopping_list['budget']
+                                })
+                            flash(message, 'success')
+                            if total_spent > shopping_list['budget']:
+                                flash(trans('shopping_over_budget', default='Warning: Total spent exceeds budget by ') + format_currency(total_spent - shopping_list['budget']) + '.', 'warning')
+                            return redirect(url_for('shopping.edit_list', list_id=list_id))
+                except errors.DuplicateKeyError:
+                    logger.warning(f"Duplicate item name found: {item_form.name.data.strip()}", extra={'session_id': session_id})
+                    message = trans('shopping_duplicate_item_name', default='Item name already exists in this list.')
+                    if wants_json:
+                        return _json_failure(message, 400)
+                    flash(message, 'danger')
+                    return redirect(url_for('shopping.edit_list', list_id=list_id))
                 except errors.WriteError as e:
                     logger.error(f"Failed to update item {item_id} in list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
-                    flash(trans('shopping_item_error', default='Error updating item due to validation failure.'), 'danger')
+                    message = trans('shopping_item_error', default='Error updating item due to validation failure.')
+                    if wants_json:
+                        return _json_failure(message, 500)
+                    flash(message, 'danger')
                 except Exception as e:
                     logger.error(f"Unexpected error updating item {item_id} in list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
-                    flash(trans('shopping_item_error', default=f'Error updating item: {str(e)}'), 'danger')
+                    message = trans('shopping_item_error', default=f'Error updating item: {str(e)}')
+                    if wants_json:
+                        return _json_failure(message, 500)
+                    flash(message, 'danger')
             else:
                 form_errors = {field: [trans(error, default=error) for error in field_errors] for field, field_errors in item_form.errors.items()}
-                logger.debug(f"Item update form validation failed: {form_errors}", extra={'session_id': session_id})
-                flash(trans('shopping_form_invalid', default='Invalid form data.'), 'danger')
+                logger.debug("Item update form validation failed: %s", form_errors, extra={'session_id': session_id})
+                message = trans('shopping_form_invalid', default='Invalid form data.')
+                if wants_json:
+                    return _json_failure(message, 400, form_errors)
+                flash(message, 'danger')
 
         elif action == 'delete_item':
             item_id = request.form.get('item_id')
-            logger.debug(f"Attempting to delete item {item_id} from list {list_id}", extra={'session_id': session_id})
-            if not ObjectId.is_valid(item_id):
+            logger.debug("Attempting to delete item %s from list %s", item_id, list_id, extra={'session_id': session_id})
+            item_oid = _to_object_id(item_id)
+            if item_oid is None:
                 logger.error(f"Invalid item ID: {item_id}", extra={'session_id': session_id})
-                flash(trans('shopping_invalid_item_id', default='Invalid item ID.'), 'danger')
+                message = trans('shopping_invalid_item_id', default='Invalid item ID.')
+                if wants_json:
+                    return _json_failure(message, 400)
+                flash(message, 'danger')
                 return redirect(url_for('shopping.edit_list', list_id=list_id))
             try:
                 with db.client.start_session() as mongo_session:
-                    with mongo_session.start_transaction():
-                        existing_item = db.shopping_items.find_one({'_id': ObjectId(item_id), 'list_id': str(list_id)}, session=mongo_session)
-                        if not existing_item:
-                            logger.error(f"Item not found: {item_id}", extra={'session_id': session_id})
-                            flash(trans('shopping_item_not_found', default='Item not found.'), 'danger')
-                            return redirect(url_for('shopping.edit_list', list_id=list_id))
-                        result = db.shopping_items.delete_one(
-                            {'_id': ObjectId(item_id), 'list_id': str(list_id), **filter_criteria},
+                    with mongo_session.start_transaction(write_concern=_ITEM_TXN_WRITE_CONCERN):
+                        # The delete hands back the removed item's price and quantity for the total
+                        deleted_item = db.shopping_items.find_one_and_delete(
+                            {'_id': item_oid, 'list_id': list_id, **filter_criteria},
+                            projection={'price': 1, 'quantity': 1},
                             session=mongo_session
                         )
-                        if result.deleted_count > 0:
-                            list_items = list(db.shopping_items.find({'list_id': str(list_id)}, session=mongo_session))
-                            total_spent = sum(item['price'] * item['quantity'] for item in list_items)
-                            db.shopping_lists.update_one(
-                                {'_id': ObjectId(list_id)},
-                                {'$set': {'total_spent': total_spent, 'updated_at': datetime.utcnow()}},
-                                session=mongo_session
-                            )
-                            logger.info(f"Item {item_id} deleted successfully from list {list_id}", extra={'session_id': session_id})
-                            flash(trans('shopping_item_deleted', default='Item deleted successfully!'), 'success')
-                            get_shopping_lists.cache_clear()
+                        if not deleted_item:
+                            logger.error(f"Item not found: {item_id}", extra={'session_id': session_id})
+                            message = trans('shopping_item_not_found', default='Item not found.')
+                            if wants_json:
+                                return _json_failure(message, 404)
+                            flash(message, 'danger')
                             return redirect(url_for('shopping.edit_list', list_id=list_id))
-                        else:
-                            logger.warning(f"No item deleted for ID {item_id} in list {list_id}", extra={'session_id': session_id})
-                            flash(trans('shopping_delete_item_failed', default='Failed to delete item.'), 'danger')
+                        total_spent = _bump_list_total(db, shopping_list['_id'], -_item_cost(deleted_item), now, mongo_session)
+                        logger.info(f"Item {item_id} deleted successfully from list {list_id}", extra={'session_id': session_id})
+                        message = trans('shopping_item_deleted', default='Item deleted successfully!')
+                        if wants_json:
+                            return jsonify({'success': True, 'message': message, 'item_id': item_id, 'total_spent': total_spent})
+                        flash(message, 'success')
+                        return redirect(url_for('shopping.edit_list', list_id=list_id))
             except errors.WriteError as e:
                 logger.error(f"Failed to delete item {item_id} from list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
-                flash(trans('shopping_item_error', default='Error deleting item due to validation failure.'), 'danger')
+                message = trans('shopping_item_error', default='Error deleting item due to validation failure.')
+                if wants_json:
+                    return _json_failure(message, 500)
+                flash(message, 'danger')
             except Exception as e:
                 logger.error(f"Unexpected error deleting item {item_id} from list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
-                flash(trans('shopping_item_error', default=f'Error deleting item: {str(e)}'), 'danger')
-
-        # Re-render the template with form errors if validation failed
-        return render_template(
-            'shopping/edit_list.html',
-            form=list_form,
-            list_form=list_form,
-            item_form=item_form,
-            list_id=list_id,
-            shopping_list=shopping_list,
-            items=items,
-            total_cost=total_cost,
-            tool_title=trans('shopping_edit_list', default='Edit Shopping List')
-        )
+                message = trans('shopping_item_error', default=f'Error deleting item: {str(e)}')
+                if wants_json:
+                    return _json_failure(message, 500)
+                flash(message, 'danger')
+
+        elif wants_json:
+            return _json_failure(trans('shopping_form_invalid', default='Invalid form data.'), 400)
+
+    # Items are only read for the page itself; successful POST actions redirect before this point,
+    # and a failed one re-renders here with its form errors. bought_count only exists on the
+    # aggregation's result, never on a stored list document
+    if 'bought_count' in shopping_list:
+        items = [_item_view(item) for item in shopping_list.pop('items')]
+        bought_count = shopping_list.pop('bought_count')
+        total_cost = shopping_list.pop('items_cost')
+    else:
+        items = _list_item_views(db, list_id)
+        bought_count = sum(1 for item in items if item['status'] == 'bought')
+        total_cost = sum(item['price_raw'] * item['quantity'] for item in items)
 
     return render_template(
         'shopping/edit_list.html',
@@ -1167,6 +1526,7 @@ def edit_list(list_id):
         list_id=list_id,
         shopping_list=shopping_list,
         items=items,
+        bought_count=bought_count,
         total_cost=total_cost,
         tool_title=trans('shopping_edit_list', default='Edit Shopping List')
     )
@@ -1178,7 +1538,7 @@ def toggle_item_status():
     """Toggle the status of a shopping item between 'to_buy' and 'bought'."""
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
-        logger.debug(f"New session created with sid: {session['sid']}")
+        logger.debug("New session created with sid: %s", session['sid'])
     session.permanent = True
     session.modified = True
 
@@ -1187,41 +1547,39 @@ def toggle_item_status():
     item_id = data.get('item_id')
     session_id = session.get('sid', 'no-session-id')
 
-    if not ObjectId.is_valid(item_id):
+    item_oid = _to_object_id(item_id)
+    if item_oid is None:
         logger.error(f"Invalid item ID: {item_id}", extra={'session_id': session_id})
         return jsonify({'success': False, 'error': trans('shopping_invalid_item_id', default='Invalid item ID.')}), 400
 
     filter_criteria = {} if is_admin() else {'user_id': str(current_user.id)}
-    item = db.shopping_items.find_one({'_id': ObjectId(item_id), **filter_criteria})
-
-    if not item:
-        logger.error(f"Item not found: {item_id}", extra={'session_id': session_id})
-        return jsonify({'success': False, 'error': trans('shopping_item_not_found', default='Item not found.')}), 404
-
-    new_status = 'bought' if item.get('status') == 'to_buy' else 'to_buy'
 
     try:
         with db.client.start_session() as mongo_session:
-            with mongo_session.start_transaction():
-                logger.debug(f"Updating status for item {item_id} to {new_status}", extra={'session_id': session_id})
-                result = db.shopping_items.update_one(
-                    {'_id': ObjectId(item_id), **filter_criteria},
-                    {'$set': {'status': new_status, 'updated_at': datetime.utcnow()}},
+            with mongo_session.start_transaction(write_concern=_ITEM_TXN_WRITE_CONCERN):
+                now = datetime.utcnow()
+                # The status is flipped on the server by a pipeline update, so the item is not read first
+                item = db.shopping_items.find_one_and_update(
+                    {'_id': item_oid, **filter_criteria},
+                    [{'$set': {
+                        'status': {'$cond': [{'$eq': ['$status', 'to_buy']}, 'bought', 'to_buy']},
+                        'updated_at': now
+                    }}],
+                    projection={'status': 1, 'list_id': 1},
+                    return_document=ReturnDocument.AFTER,
                     session=mongo_session
                 )
-                if result.modified_count > 0:
-                    list_items = list(db.shopping_items.find({'list_id': item['list_id']}, session=mongo_session))
-                    total_spent = sum(item['price'] * item['quantity'] for item in list_items)
-                    db.shopping_lists.update_one(
-                        {'_id': ObjectId(item['list_id'])},
-                        {'$set': {'total_spent': total_spent, 'updated_at': datetime.utcnow()}},
-                        session=mongo_session
-                    )
-                    logger.info(f"Item {item_id} status updated to {new_status}", extra={'session_id': session_id})
-                    return jsonify({'success': True, 'message': trans('shopping_item_status_updated', default='Item status updated successfully!')})
-                else:
-                    logger.warning(f"No changes made to item {item_id} status", extra={'session_id': session_id})
-                    return jsonify({'success': False, 'error': trans('shopping_update_item_failed', default='Failed to update item status.')}), 500
+                if not item:
+                    logger.error(f"Item not found: {item_id}", extra={'session_id': session_id})
+                    return jsonify({'success': False, 'error': trans('shopping_item_not_found', default='Item not found.')}), 404
+                # Status does not change what the list costs, so only its timestamp moves
+                db.shopping_lists.update_one(
+                    {'_id': ObjectId(item['list_id'])},
+                    {'$set': {'updated_at': now}},
+                    session=mongo_session
+                )
+                logger.info(f"Item {item_id} status updated to {item['status']}", extra={'session_id': session_id})
+                return jsonify({'success': True, 'message': trans('shopping_item_status_updated', default='Item status updated successfully!')})
     except errors.WriteError as e:
         logger.error(f"Failed to toggle status for item {item_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
         return jsonify({'success': False, 'error': trans('shopping_item_error', default='Error updating item status due to validation failure.')}), 500
@@ -1229,6 +1587,76 @@ def toggle_item_status():
         logger.error(f"Unexpected error toggling status for item {item_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
         return jsonify({'success': False, 'error': trans('shopping_item_error', default=f'Error updating item status: {str(e)}')}), 500
 
+@shopping_bp.route('/bulk_items', methods=['POST'])
+@custom_login_required
+@requires_role(['personal', 'admin'])
+def bulk_items():
+    """Apply several item updates and deletions to one list in a single round trip."""
+    db = get_mongo_db()
+    session_id = session.get('sid', 'no-session-id')
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'error': trans('shopping_invalid_items', default='Invalid items data.')}), 400
+    list_id = data.get('list_id')
+    ops = data.get('ops')
+
+    list_oid = _to_object_id(list_id)
+    if list_oid is None:
+        logger.error(f"Invalid list ID: {list_id}", extra={'session_id': session_id})
+        return jsonify({'success': False, 'error': trans('shopping_invalid_list_id', default='Invalid list ID.')}), 400
+    if not isinstance(ops, list) or not ops or len(ops) > _MAX_ITEMS_PER_POST:
+        return jsonify({'success': False, 'error': trans('shopping_invalid_items', default='Invalid items data.')}), 400
+
+    filter_criteria = {} if is_admin() else {'user_id': str(current_user.id)}
+    shopping_list = db.shopping_lists.find_one({'_id': list_oid, **filter_criteria}, {'budget': 1})
+    if not shopping_list:
+        logger.error(f"List not found: {list_id}", extra={'session_id': session_id})
+        return jsonify({'success': False, 'error': trans('shopping_list_not_found', default='List not found.')}), 404
+
+    # Every operation is validated before anything is written; each one is also scoped to this list
+    now = datetime.utcnow()
+    operations = []
+    try:
+        for op in ops:
+            item_oid = _to_object_id(op.get('item_id'))
+            if item_oid is None:
+                raise ValueError('Invalid item ID')
+            item_filter = {'_id': item_oid, 'list_id': list_id, **filter_criteria}
+            if op.get('action') == 'delete':
+                operations.append(DeleteOne(item_filter))
+            elif op.get('action') == 'update':
+                changes = _bulk_item_changes(op.get('data') or {})
+                operations.append(UpdateOne(item_filter, {'$set': {**changes, 'updated_at': now}}))
+            else:
+                raise ValueError('Invalid action')
+    except (ValueError, TypeError, AttributeError) as e:
+        logger.warning(f"Rejected bulk item operations for list {list_id}: {str(e)}", extra={'session_id': session_id})
+        return jsonify({'success': False, 'error': trans('shopping_invalid_items', default='Invalid items data.')}), 400
+
+    try:
+        result, total_spent = _apply_item_bulk(db, list_oid, operations, now)
+        logger.info(f"Bulk item operations on list {list_id}: {result.modified_count} updated, {result.deleted_count} deleted",
+                    extra={'session_id': session_id})
+        return jsonify({
+            'success': True,
+            'updated': result.modified_count,
+            'deleted': result.deleted_count,
+            'total_spent': total_spent,
+            'over_budget': total_spent > shopping_list.get('budget', 0.0)
+        })
+    except errors.BulkWriteError as e:
+        # The transaction rolls back the whole batch
+        write_errors = e.details.get('writeErrors', [])
+        if any(err.get('code') == 11000 for err in write_errors):
+            return jsonify({'success': False, 'error': trans('shopping_duplicate_item_name', default='Item name already exists in this list.')}), 400
+        logger.error(f"Failed bulk item operations for list {list_id}: "
+                     f"{[(err.get('index'), err.get('errmsg')) for err in write_errors]}",
+                     extra={'session_id': session_id})
+        return jsonify({'success': False, 'error': trans('shopping_item_error', default='Error updating items due to validation failure.')}), 500
+    except Exception as e:
+        logger.error(f"Unexpected error in bulk item operations for list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
+        return jsonify({'success': False, 'error': trans('shopping_item_error', default=f'Error updating items: {str(e)}')}), 500
+
 @shopping_bp.route('/delete_list', methods=['POST'])
 @custom_login_required
 @requires_role(['personal', 'admin'])
@@ -1236,7 +1664,7 @@ def delete_list():
     """Delete a shopping list and all its items."""
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
-        logger.debug(f"New session created with sid: {session['sid']}")
+        logger.debug("New session created with sid: %s", session['sid'])
     
     db = get_mongo_db()
     session_id = session.get('sid', 'no-session-id')
@@ -1245,45 +1673,51 @@ def delete_list():
         data = request.get_json()
         list_id = data.get('list_id')
         
-        if not ObjectId.is_valid(list_id):
+        list_oid = _to_object_id(list_id)
+        if list_oid is None:
             logger.error(f"Invalid list ID: {list_id}", extra={'session_id': session_id})
             return jsonify({'success': False, 'error': trans('shopping_invalid_list_id', default='Invalid list ID.')}), 400
         
-        filter_criteria = {} if is_admin() else {'user_id': str(current_user.id)}
-        shopping_list = db.shopping_lists.find_one({'_id': ObjectId(list_id), **filter_criteria})
-        
-        if not shopping_list:
-            logger.error(f"List not found: {list_id}", extra={'session_id': session_id})
-            return jsonify({'success': False, 'error': trans('shopping_list_not_found', default='List not found.')}), 404
+        # is_admin() enters an app context on every call, so it is resolved once per request
+        admin = is_admin()
+        filter_criteria = {} if admin else {'user_id': str(current_user.id)}
         
         try:
             with db.client.start_session() as mongo_session:
                 with mongo_session.start_transaction():
-                    db.shopping_items.delete_many({'list_id': list_id}, session=mongo_session)
-                    
-                    result = db.shopping_lists.delete_one({'_id': ObjectId(list_id)}, session=mongo_session)
+                    # The ownership check and the list delete are one round trip;
+                    # items are only removed once the list itself is gone.
+                    deleted_list = db.shopping_lists.find_one_and_delete(
+                        {'_id': list_oid, **filter_criteria},
+                        projection={'_id': 1},
+                        session=mongo_session
+                    )
+                    if not deleted_list:
+                        logger.error(f"List not found: {list_id}", extra={'session_id': session_id})
+                        return jsonify({'success': False, 'error': trans('shopping_list_not_found', default='List not found.')}), 404
                     
-                    if result.deleted_count > 0:
-                        if current_user.is_authenticated and not is_admin():
-                            if not deduct_ficore_credits(db, current_user.id, 1, 'delete_shopping_list', list_id, mongo_session):
-                                logger.warning(f"Failed to deduct FC for deleting list {list_id} by user {current_user.id}", extra={'session_id': session_id})
-                        
-                        try:
-                            log_tool_usage(
-                                tool_name='shopping',
-                                db=db,
-                                user_id=current_user.id,
-                                session_id=session_id,
-                                action='delete_list'
-                            )
-                        except Exception as e:
-                            logger.warning(f"Error logging delete activity: {str(e)}", extra={'session_id': session_id})
-                        
-                        logger.info(f"List {list_id} deleted successfully", extra={'session_id': session_id})
-                        return jsonify({'success': True, 'message': trans('shopping_list_deleted', default='List deleted successfully!')})
-                    else:
-                        logger.warning(f"No list deleted for ID {list_id}", extra={'session_id': session_id})
-                        return jsonify({'success': False, 'error': trans('shopping_delete_failed', default='Failed to delete list.')}), 500
+                    result = db.shopping_items.delete_many({'list_id': list_id}, session=mongo_session)
+                    logger.debug("Deleted %d items with list %s", result.deleted_count, list_id)
+            
+            # A failed deduction never rolled the delete back, so the credit is taken after the
+            # commit and the transaction only spans the two deletes
+            if current_user.is_authenticated and not admin:
+                if not deduct_ficore_credits(db, current_user.id, 1, 'delete_shopping_list', list_id):
+                    logger.warning(f"Failed to deduct FC for deleting list {list_id} by user {current_user.id}", extra={'session_id': session_id})
+            
+            try:
+                queue_tool_usage(
+                    tool_name='shopping',
+                    db=db,
+                    user_id=current_user.id,
+                    session_id=session_id,
+                    action='delete_list'
+                )
+            except Exception as e:
+                logger.warning(f"Error logging delete activity: {str(e)}", extra={'session_id': session_id})
+            
+            logger.info(f"List {list_id} deleted successfully", extra={'session_id': session_id})
+            return jsonify({'success': True, 'message': trans('shopping_list_deleted', default='List deleted successfully!')})
         except errors.WriteError as e:
             logger.error(f"Failed to delete list {list_id}: {str(e)}", exc_info=True, extra={'session_id': session_id})
             return jsonify({'success': False, 'error': trans('shopping_delete_error', default='Error deleting list due to validation failure.')}), 500
@@ -1302,32 +1736,39 @@ def export_pdf(list_id):
     """Export shopping list to PDF with FC deduction."""
     if 'sid' not in session:
         session['sid'] = str(uuid.uuid4())
-        logger.debug(f"New session created with sid: {session['sid']}")
+        logger.debug("New session created with sid: %s", session['sid'])
     
     db = get_mongo_db()
     session_id = session.get('sid', 'no-session-id')
     
     try:
-        if not ObjectId.is_valid(list_id):
+        list_oid = _to_object_id(list_id)
+        if list_oid is None:
             logger.error(f"Invalid list ID: {list_id}", extra={'session_id': session_id})
             flash(trans('shopping_invalid_list_id', default='Invalid list ID.'), 'danger')
             return redirect(url_for('shopping.manage'))
         
-        if current_user.is_authenticated and not is_admin():
+        admin = is_admin()
+        if current_user.is_authenticated and not admin:
             if not check_ficore_credit_balance(required_amount=2, user_id=current_user.id):
                 logger.warning(f"Insufficient credits for PDF export for user {current_user.id}", extra={'session_id': session_id})
                 flash(trans('shopping_insufficient_credits_pdf', default='Insufficient credits for PDF export. PDF export costs 2 FC.'), 'danger')
                 return redirect(url_for('shopping.manage'))
         
-        filter_criteria = {} if is_admin() else {'user_id': str(current_user.id)}
-        shopping_list = db.shopping_lists.find_one({'_id': ObjectId(list_id), **filter_criteria})
+        filter_criteria = {} if admin else {'user_id': str(current_user.id)}
+        # Only the printed fields of the list and its items are loaded
+        shopping_list = _fetch_list_with_items(
+            db, list_oid, filter_criteria,
+            {'_id': 0, 'name': 1, 'quantity': 1, 'price': 1, 'unit': 1, 'category': 1, 'status': 1},
+            list_projection={'name': 1, 'budget': 1, 'total_spent': 1, 'created_at': 1}
+        )
         
         if not shopping_list:
             logger.error(f"List not found: {list_id}", extra={'session_id': session_id})
             flash(trans('shopping_list_not_found', default='List not found.'), 'danger')
             return redirect(url_for('shopping.manage'))
         
-        list_items = list(db.shopping_items.find({'list_id': list_id}))
+        list_items = shopping_list['items']
         
         buffer = BytesIO()
         p = canvas.Canvas(buffer, pagesize=A4)
@@ -1347,53 +1788,54 @@ def export_pdf(list_id):
         p.drawString(50, y, f"Created: {format_date(shopping_list.get('created_at'))}")
         y -= 40
         
-        p.setFont("Helvetica-Bold", 10)
-        p.drawString(50, y, "Item")
-        p.drawString(200, y, "Qty")
-        p.drawString(250, y, "Price")
-        p.drawString(300, y, "Unit")
-        p.drawString(350, y, "Category")
-        p.drawString(450, y, "Status")
+        _draw_pdf_item_header(p, y)
         y -= 20
         
-        p.setFont("Helvetica", 9)
+        # Resolved once for the whole table rather than by format_currency on every row
+        lang = session.get('lang', 'en')
+        # Each page's rows go into one text object, so the cells share a single text block
+        # instead of opening one per drawString
+        rows = p.beginText()
         for item in list_items:
             if y < 50:
+                p.drawText(rows)
                 p.showPage()
                 draw_ficore_pdf_header(p, current_user, y_start=height - 50)
                 y = height - 120
-                p.setFont("Helvetica-Bold", 10)
-                p.drawString(50, y, "Item")
-                p.drawString(200, y, "Qty")
-                p.drawString(250, y, "Price")
-                p.drawString(300, y, "Unit")
-                p.drawString(350, y, "Category")
-                p.drawString(450, y, "Status")
+                _draw_pdf_item_header(p, y)
                 y -= 20
-                p.setFont("Helvetica", 9)
+                rows = p.beginText()
             
-            p.drawString(50, y, item.get('name', '')[:20])
-            p.drawString(200, y, str(item.get('quantity', 1)))
-            p.drawString(250, y, format_currency(item.get('price', 0)))
-            p.drawString(300, y, item.get('unit', 'piece'))
-            p.drawString(350, y, item.get('category', 'other'))
-            p.drawString(450, y, item.get('status', 'to_buy'))
+            cells = (
+                item.get('name', '')[:20],
+                str(item.get('quantity', 1)),
+                format_currency(item.get('price', 0), lang=lang),
+                item.get('unit', 'piece'),
+                item.get('category', 'other'),
+                item.get('status', 'to_buy')
+            )
+            for x, cell in zip(_PDF_ITEM_COLUMN_X, cells):
+                rows.setTextOrigin(x, y)
+                rows.textOut(cell)
             y -= 15
+        p.drawText(rows)
         
         p.save()
         buffer.seek(0)
         
-        if current_user.is_authenticated and not is_admin():
+        if current_user.is_authenticated and not admin:
             if not deduct_ficore_credits(db, current_user.id, 2, 'export_shopping_list_pdf', list_id):
                 logger.warning(f"Failed to deduct credits for PDF export for list {list_id} by user {current_user.id}", extra={'session_id': session_id})
                 flash(trans('shopping_credit_deduction_failed', default='Failed to deduct credits for PDF export.'), 'danger')
                 return redirect(url_for('shopping.manage'))
         
         logger.info(f"PDF exported successfully for list {list_id}", extra={'session_id': session_id})
-        return Response(
-            buffer.getvalue(),
+        # send_file streams the buffer in chunks instead of copying it out with getvalue()
+        return send_file(
+            buffer,
             mimetype='application/pdf',
-            headers={'Content-Disposition': f'attachment; filename=shopping_list_{shopping_list.get("name", "list")}_{datetime.utcnow().strftime("%Y%m%d_%H%M%S")}.pdf'}
+            as_attachment=True,
+            download_name=f'shopping_list_{shopping_list.get("name", "list")}_{datetime.utcnow().strftime("%Y%m%d_%H%M%S")}.pdf'
         )
         
     except Exception as e:
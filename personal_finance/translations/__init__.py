@@ -1,6 +1,6 @@
 import logging
 from flask import session, has_request_context, g, request
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, Optional, Union
 import threading
 
 # Set up logger to match app.py
@@ -198,6 +198,36 @@ def trans(key: str, lang: Optional[str] = None, default: Optional[str] = None, *
             return translation  # Return unformatted string as fallback
     return translation
 
+def trans_many(keys: Iterable[str], lang: Optional[str] = None) -> Dict[str, str]:
+    """
+    Translate several keys in one pass, resolving the language once.
+
+    Args:
+        keys: Translation keys to resolve.
+        lang: Language code ('en', 'ha'). Defaults to session['lang'] or 'en'.
+
+    Returns:
+        A dictionary mapping each key to its translation. Keys missing from the
+        requested language go through trans() so fallback and logging stay the same.
+    """
+    if lang is None:
+        lang = session.get('lang', 'en') if has_request_context() else 'en'
+    if lang not in ['en', 'ha']:
+        return {key: trans(key, lang=lang) for key in keys}
+
+    result = {}
+    for key in keys:
+        module_name = 'general'
+        if key not in GENERAL_SPECIFIC_KEYS:
+            for prefix, mod in KEY_PREFIX_TO_MODULE.items():
+                if key.startswith(prefix):
+                    module_name = mod
+                    break
+        module = translation_modules.get(module_name, translation_modules['general'])
+        translation = module.get(lang, {}).get(key)
+        result[key] = translation if translation is not None else trans(key, lang=lang)
+    return result
+
 def get_translations(lang: Optional[str] = None) -> Dict[str, callable]:
     """
     Return a dictionary with a trans callable for the specified language.
@@ -261,4 +291,4 @@ def register_translation(app):
             # Default to 'en' or use request headers/user settings as needed
             session['lang'] = request.accept_languages.best_match(['en', 'ha'], 'en')
 
-__all__ = ['trans', 'get_translations', 'get_all_translations', 'get_module_translations', 'register_translation']
+__all__ = ['trans', 'trans_many', 'get_translations', 'get_all_translations', 'get_module_translations', 'register_translation']
@@ -14,6 +14,7 @@ from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 from werkzeug.routing import BuildError
 from translations import trans
 import time
+from functools import lru_cache
 from wtforms import ValidationError
 
 # Flask extensions
@@ -596,30 +597,29 @@ def get_mongo_db():
     retry_delay = 1
     for attempt in range(max_retries):
         try:
-            with current_app.app_context():
-                if 'mongo' not in current_app.extensions:
-                    mongo_uri = os.getenv('MONGO_URI')
-                    if not mongo_uri:
-                        logger.error("MONGO_URI environment variable not set",
-                                    extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr if has_request_context() else 'unknown'})
-                        raise RuntimeError("MONGO_URI environment variable not set")
+            if 'mongo' not in current_app.extensions:
+                mongo_uri = os.getenv('MONGO_URI')
+                if not mongo_uri:
+                    logger.error("MONGO_URI environment variable not set",
+                                extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr if has_request_context() else 'unknown'})
+                    raise RuntimeError("MONGO_URI environment variable not set")
                     
-                    client = MongoClient(
-                        mongo_uri,
-                        serverSelectionTimeoutMS=5000,
-                        tls=True,
-                        tlsCAFile=certifi.where() if os.getenv('MONGO_CA_FILE') is None else os.getenv('MONGO_CA_FILE'),
-                        maxPoolSize=50,
-                        minPoolSize=5
-                    )
-                    client.admin.command('ping')
-                    current_app.extensions['mongo'] = client
-                    logger.info("MongoDB client initialized successfully in utils.get_mongo_db",
-                               extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr if has_request_context() else 'unknown'})
+                client = MongoClient(
+                    mongo_uri,
+                    serverSelectionTimeoutMS=5000,
+                    tls=True,
+                    tlsCAFile=certifi.where() if os.getenv('MONGO_CA_FILE') is None else os.getenv('MONGO_CA_FILE'),
+                    maxPoolSize=50,
+                    minPoolSize=5,
+                    maxIdleTimeMS=30000
+                )
+                client.admin.command('ping')
+                current_app.extensions['mongo'] = client
+                logger.info("MongoDB client initialized successfully in utils.get_mongo_db",
+                           extra={'session_id': session.get('sid', 'no-session-id'), 'ip_address': request.remote_addr if has_request_context() else 'unknown'})
                 
-                db = current_app.extensions['mongo']['ficodb']
-                db.command('ping')
-                return db
+            # The pooled client was pinged when it was created; operations surface connection errors themselves
+            return current_app.extensions['mongo']['ficodb']
         except (ConnectionFailure, ServerSelectionTimeoutError) as e:
             logger.warning(
                 f"Attempt {attempt + 1}/{max_retries} failed to connect to MongoDB: {str(e)}",
@@ -718,6 +718,12 @@ def is_admin():
     except Exception:
         return False
 
+@lru_cache(maxsize=4096)
+def _format_currency_amount(amount, currency, include_symbol):
+    """Format an already-coerced float; cached per (amount, currency, include_symbol) since template values repeat heavily."""
+    formatted = f"{int(amount):,}" if amount.is_integer() else f"{amount:,.2f}"
+    return f"{currency}{formatted}" if include_symbol else formatted
+
 def format_currency(amount, currency='₦', lang=None, include_symbol=True):
     """
     Format currency amount with proper locale.
@@ -735,12 +741,8 @@ def format_currency(amount, currency='₦', lang=None, include_symbol=True):
         with current_app.app_context():
             if lang is None:
                 lang = session.get('lang', 'en') if has_request_context() else 'en'
-            amount = clean_currency(amount) if isinstance(amount, str) else float(amount) if amount is not None else 0
-            if amount.is_integer():
-                formatted = f"{int(amount):,}"
-            else:
-                formatted = f"{amount:,.2f}"
-            return f"{currency}{formatted}" if include_symbol else formatted
+            amount = clean_currency(amount) if isinstance(amount, str) else float(amount) if amount is not None else 0.0
+            return _format_currency_amount(float(amount), currency, include_symbol)
     except (TypeError, ValueError, ValidationError) as e:
         logger.warning(f"{trans('general_currency_format_error', default='Error formatting currency')} {amount}: {str(e)}")
         return f"{currency}0" if include_symbol else "0"
@@ -958,7 +960,9 @@ def get_recent_activities(user_id=None, is_admin_user=False, db=None, session_id
             })
 
         # Fetch recent shopping items
-        shopping_items = db.shopping_items.find(query).sort('created_at', -1).limit(5)
+        shopping_items = db.shopping_items.find(
+            query, {'name': 1, 'created_at': 1, 'quantity': 1, 'price': 1, 'status': 1}
+        ).sort('created_at', -1).limit(5)
         for item in shopping_items:
             activities.append({
                 'type': 'shopping_item',